@@ -222,6 +222,41 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "analysis_cache": Arg(
+        '--analysis-cache',
+        help='Store indicators calculated by populate_indicators() per pair and month, '
+        'and reuse them for pairs with unchanged candles and strategy.',
+        action='store_true',
+        default=False,
+    ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Backtest engine to use. `columnar` skips candles without entry signal '
+        f'or open trade (default: `{constants.BACKTEST_ENGINE_DEFAULT}`).',
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "benchmark_pairs": Arg(
+        '--benchmark-pairs',
+        help='Number of pairs (from the pair whitelist) to benchmark with (default: %(default)d).',
+        type=check_int_positive,
+        metavar='INT',
+        default=10,
+    ),
+    "benchmark_candles": Arg(
+        '--benchmark-candles',
+        help='Number of synthetic candles per pair (default: %(default)d).',
+        type=check_int_positive,
+        metavar='INT',
+        default=10000,
+    ),
+    "benchmark_repeats": Arg(
+        '--benchmark-repeats',
+        help='Repeat every benchmark this many times, reporting the fastest run '
+        '(default: %(default)d).',
+        type=check_int_positive,
+        metavar='INT',
+        default=3,
+    ),
     # Edge
     "stoploss_range": Arg(
         '--stoplosses',
@@ -262,6 +297,21 @@ AVAILABLE_CLI_OPTIONS = {
         action='store_true',
         default=False,
     ),
+    "hyperopt_mmap_data": Arg(
+        '--mmap-data',
+        help='Share preprocessed data between hyperopt workers via memory-mapped files, '
+        'instead of loading a copy of the data per worker and epoch.',
+        action='store_true',
+        default=False,
+    ),
+    "hyperopt_signal_cache": Arg(
+        '--signal-cache',
+        help='Keep entry / exit signals of up to SIZE parameter combinations per pair, and '
+        'reuse them for epochs which don\'t change the parameters used by the signal functions. '
+        'Not used with --analyze-per-epoch.',
+        type=check_int_positive,
+        metavar='SIZE',
+    ),
 
     "print_all": Arg(
         '--print-all',
@@ -443,6 +493,21 @@ AVAILABLE_CLI_OPTIONS = {
         help='Storage format for downloaded trades data. (default: `jsongz`).',
         choices=constants.AVAILABLE_DATAHANDLERS_TRADES,
     ),
+    "data_jobs": Arg(
+        '--data-jobs',
+        help='Number of processes used to process pairs in parallel. '
+        'If -1, all CPUs are used, for -2, all CPUs but one are used, etc. (default: 1).',
+        type=int,
+        metavar='JOBS',
+    ),
+    "strategy_jobs": Arg(
+        '--strategy-jobs',
+        help='Number of processes used to backtest the strategies of `--strategy-list` '
+        'in parallel. If -1, all CPUs are used, for -2, all CPUs but one are used, etc. '
+        '(default: 1).',
+        type=int,
+        metavar='JOBS',
+    ),
     "show_timerange": Arg(
         '--show-timerange',
         help='Show timerange available for available data. (May take a while to calculate).',
@@ -78,7 +78,7 @@ def start_download_data(args: Dict[str, Any]) -> None:
                 pairs=expanded_pairs, timeframes=config['timeframes'],
                 datadir=config['datadir'], timerange=timerange, erase=bool(config.get('erase')),
                 data_format_ohlcv=config['dataformat_ohlcv'],
-                data_format_trades=config['dataformat_trades'],
+                data_format_trades=config['dataformat_trades'], jobs=config.get('data_jobs', 1),
             )
         else:
             if not exchange.get_option('ohlcv_has_history', True):
@@ -137,7 +137,7 @@ def start_convert_trades(args: Dict[str, Any]) -> None:
         pairs=expanded_pairs, timeframes=config['timeframes'],
         datadir=config['datadir'], timerange=timerange, erase=bool(config.get('erase')),
         data_format_ohlcv=config['dataformat_ohlcv'],
-        data_format_trades=config['dataformat_trades'],
+        data_format_trades=config['dataformat_trades'], jobs=config.get('data_jobs', 1),
     )
 
 
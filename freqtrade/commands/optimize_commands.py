@@ -74,6 +74,24 @@ def start_backtesting_show(args: Dict[str, Any]) -> None:
     show_sorted_pairlist(config, results)
 
 
+def start_benchmark(args: Dict[str, Any]) -> None:
+    """
+    Start Benchmark script
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    # Import here to avoid loading backtesting module when it's not used
+    from freqtrade.optimize.benchmark import Benchmark
+
+    # Initialize configuration
+    config = setup_optimize_configuration(args, RunMode.BACKTEST)
+
+    logger.info('Starting freqtrade in Benchmark mode')
+
+    benchmark = Benchmark(config)
+    benchmark.start()
+
+
 def start_hyperopt(args: Dict[str, Any]) -> None:
     """
     Start hyperopt script
@@ -276,12 +276,30 @@ class Configuration:
         self._args_to_config(config, argname='backtest_cache',
                              logstring='Parameter --cache={} detected ...')
 
+        self._args_to_config(config, argname='analysis_cache',
+                             logstring='Parameter --analysis-cache detected ...')
+
+        self._args_to_config(config, argname='backtest_engine',
+                             logstring='Parameter --backtest-engine={} detected ...')
+
+        self._args_to_config(config, argname='strategy_jobs',
+                             logstring='Using {} processes to backtest strategies.')
+
         self._args_to_config(config, argname='disableparamexport',
                              logstring='Parameter --disableparamexport detected: {} ...')
 
         self._args_to_config(config, argname='freqai_backtest_live_models',
                              logstring='Parameter --freqai-backtest-live-models detected ...')
 
+        self._args_to_config(config, argname='benchmark_pairs',
+                             logstring='Parameter --benchmark-pairs detected: {} ...')
+
+        self._args_to_config(config, argname='benchmark_candles',
+                             logstring='Parameter --benchmark-candles detected: {} ...')
+
+        self._args_to_config(config, argname='benchmark_repeats',
+                             logstring='Parameter --benchmark-repeats detected: {} ...')
+
         # Edge section:
         if 'stoploss_range' in self.args and self.args["stoploss_range"]:
             txt_range = eval(self.args["stoploss_range"])
@@ -311,6 +329,12 @@ class Configuration:
         self._args_to_config(config, argname='analyze_per_epoch',
                              logstring='Parameter --analyze-per-epoch detected.')
 
+        self._args_to_config(config, argname='hyperopt_mmap_data',
+                             logstring='Parameter --mmap-data detected.')
+
+        self._args_to_config(config, argname='hyperopt_signal_cache',
+                             logstring='Parameter --signal-cache detected: {}')
+
         self._args_to_config(config, argname='print_all',
                              logstring='Parameter --print-all detected ...')
 
@@ -438,6 +462,9 @@ class Configuration:
         self._args_to_config(config, argname='show_timerange',
                              logstring='Detected --show-timerange')
 
+        self._args_to_config(config, argname='data_jobs',
+                             logstring='Using {} processes to process data.')
+
     def _process_data_options(self, config: Config) -> None:
         self._args_to_config(config, argname='new_pairs_days',
                              logstring='Detected --new-pairs-days: {}')
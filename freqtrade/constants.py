@@ -36,11 +36,14 @@ AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList', 'ProducerPairList', '
                        'PrecisionFilter', 'PriceFilter', 'RangeStabilityFilter',
                        'ShuffleFilter', 'SpreadFilter', 'VolatilityFilter']
 AVAILABLE_PROTECTIONS = ['CooldownPeriod', 'LowProfitPairs', 'MaxDrawdown', 'StoplossGuard']
-AVAILABLE_DATAHANDLERS_TRADES = ['json', 'jsongz', 'hdf5']
-AVAILABLE_DATAHANDLERS = AVAILABLE_DATAHANDLERS_TRADES + ['feather', 'parquet']
+AVAILABLE_DATAHANDLERS_TRADES = ['json', 'jsongz', 'hdf5', 'feather']
+AVAILABLE_DATAHANDLERS = AVAILABLE_DATAHANDLERS_TRADES + ['parquet']
+AVAILABLE_WS_SERIALIZERS = ['json', 'arrow']
 BACKTEST_BREAKDOWNS = ['day', 'week', 'month']
 BACKTEST_CACHE_AGE = ['none', 'day', 'week', 'month']
 BACKTEST_CACHE_DEFAULT = 'day'
+BACKTEST_ENGINES = ['loop', 'columnar']
+BACKTEST_ENGINE_DEFAULT = 'loop'
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = '%Y-%m-%d %H:%M:%S'
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -48,6 +51,12 @@ DEFAULT_DATAFRAME_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
 # Don't modify sequence of DEFAULT_TRADES_COLUMNS
 # it has wide consequences for stored trades files
 DEFAULT_TRADES_COLUMNS = ['timestamp', 'id', 'type', 'side', 'price', 'amount', 'cost']
+# Trade columns required to build OHLCV candles (and to remove duplicate trades)
+TRADES_OHLCV_COLUMNS = ['timestamp', 'id', 'price', 'amount']
+# Number of trades read / written at once by datahandlers supporting chunked access
+TRADES_BATCH_SIZE = 100_000
+# Number of candles per row group / record batch in parquet and feather files
+OHLCV_BATCH_SIZE = 50_000
 TRADING_MODES = ['spot', 'margin', 'futures']
 MARGIN_MODES = ['cross', 'isolated', '']
 
@@ -140,6 +149,8 @@ CONF_SCHEMA = {
         'dry_run_wallet': {'type': 'number', 'default': DRY_RUN_WALLET},
         'cancel_open_orders_on_exit': {'type': 'boolean', 'default': False},
         'process_only_new_candles': {'type': 'boolean'},
+        'analysis_workers': {'type': 'integer', 'minimum': 1},
+        'lookback_candle_count': {'type': 'integer', 'minimum': 0},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -166,6 +177,8 @@ CONF_SCHEMA = {
             'type': 'array',
             'items': {'type': 'string', 'enum': BACKTEST_BREAKDOWNS}
         },
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES},
+        'analysis_cache': {'type': 'boolean'},
         'bot_name': {'type': 'string'},
         'unfilledtimeout': {
             'type': 'object',
@@ -443,6 +456,8 @@ CONF_SCHEMA = {
             'enum': AVAILABLE_DATAHANDLERS_TRADES,
             'default': 'jsongz'
         },
+        'data_jobs': {'type': 'integer', 'default': 1},
+        'strategy_jobs': {'type': 'integer', 'default': 1},
         'position_adjustment_enable': {'type': 'boolean'},
         'max_entry_position_adjustment': {'type': ['integer', 'number'], 'minimum': -1},
     },
@@ -515,6 +530,11 @@ CONF_SCHEMA = {
                             },
                             'secure': {'type': 'boolean', 'default': False},
                             'ws_token': {'type': 'string'},
+                            'serializer': {
+                                'type': 'string',
+                                'enum': AVAILABLE_WS_SERIALIZERS,
+                                'default': 'json'
+                            },
                         },
                         'required': ['name', 'host', 'ws_token']
                     }
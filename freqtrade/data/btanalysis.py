@@ -346,17 +346,72 @@ def evaluate_result_multi(results: pd.DataFrame, timeframe: str,
     return df_final[df_final['open_trades'] > max_open_trades]
 
 
+def _trade_dates_to_series(dates: List[Optional[datetime]]) -> pd.Series:
+    """
+    Convert trade dates to a UTC datetime series, keeping their full precision.
+    """
+    return pd.to_datetime(pd.Series(dates, dtype='object'), utc=True)
+
+
+def _to_seconds(values: pd.Series) -> pd.Series:
+    """
+    Convert datetimes (seconds since epoch) or timedeltas to float seconds -
+    computed from microseconds, like datetime.timestamp() and timedelta.total_seconds().
+    """
+    return (values.dropna().astype(np.int64) // 1000) / 1e6
+
+
 def trade_list_to_dataframe(trades: List[LocalTrade]) -> pd.DataFrame:
     """
     Convert list of Trade objects to pandas Dataframe
+    Builds the columns directly from the trade attributes - identical to
+    pd.DataFrame.from_records([t.to_json(True) for t in trades]), but without
+    building one dictionary per trade.
     :param trades: List of trade objects
     :return: Dataframe with BT_DATA_COLUMNS
     """
-    df = pd.DataFrame.from_records([t.to_json(True) for t in trades], columns=BT_DATA_COLUMNS)
-    if len(df) > 0:
-        df['close_date'] = pd.to_datetime(df['close_date'], utc=True)
-        df['open_date'] = pd.to_datetime(df['open_date'], utc=True)
-        df['close_rate'] = df['close_rate'].astype('float64')
+    if len(trades) == 0:
+        return pd.DataFrame(columns=BT_DATA_COLUMNS)
+
+    open_dates = _trade_dates_to_series([t.open_date for t in trades])
+    close_dates = _trade_dates_to_series([t.close_date for t in trades])
+    # Timestamps and durations use the exact dates, date columns are formatted in seconds.
+    open_timestamps = (_to_seconds(open_dates) * 1000).astype(np.int64)
+    close_timestamps = (_to_seconds(close_dates) * 1000).astype(np.int64)
+    durations = _to_seconds(close_dates - open_dates) // 60
+
+    df = pd.DataFrame({
+        'pair': [t.pair for t in trades],
+        'stake_amount': [round(t.stake_amount, 8) for t in trades],
+        'max_stake_amount': [round(t.max_stake_amount, 8) if t.max_stake_amount else None
+                             for t in trades],
+        'amount': [round(t.amount, 8) for t in trades],
+        'open_date': open_dates.dt.floor('S'),
+        'close_date': close_dates.dt.floor('S'),
+        'open_rate': [t.open_rate for t in trades],
+        'close_rate': np.array([t.close_rate for t in trades], dtype='float64'),
+        'fee_open': [t.fee_open for t in trades],
+        'fee_close': [t.fee_close for t in trades],
+        'trade_duration': durations.astype(np.int64).reindex(open_dates.index).tolist(),
+        'profit_ratio': [t.close_profit for t in trades],
+        'profit_abs': [t.close_profit_abs for t in trades],
+        'exit_reason': [t.exit_reason for t in trades],
+        'initial_stop_loss_abs': [t.initial_stop_loss for t in trades],
+        'initial_stop_loss_ratio': [t.initial_stop_loss_pct if t.initial_stop_loss_pct else None
+                                    for t in trades],
+        'stop_loss_abs': [t.stop_loss for t in trades],
+        'stop_loss_ratio': [t.stop_loss_pct if t.stop_loss_pct else None for t in trades],
+        'min_rate': [t.min_rate for t in trades],
+        'max_rate': [t.max_rate for t in trades],
+        'is_open': [t.is_open for t in trades],
+        'enter_tag': [t.enter_tag for t in trades],
+        'leverage': [t.leverage for t in trades],
+        'is_short': [t.is_short for t in trades],
+        'open_timestamp': open_timestamps.tolist(),
+        'close_timestamp': close_timestamps.reindex(open_dates.index).tolist(),
+        'orders': [[o.to_json(t.entry_side, True) for o in t.select_filled_or_open_orders()]
+                   for t in trades],
+    }, columns=BT_DATA_COLUMNS)
     return df
 
 
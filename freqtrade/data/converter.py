@@ -4,7 +4,7 @@ Functions to convert data from one format to another
 import itertools
 import logging
 from operator import itemgetter
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -200,6 +200,35 @@ def trades_remove_duplicates(trades: List[List]) -> List[List]:
     return [i for i, _ in itertools.groupby(sorted(trades, key=itemgetter(0)))]
 
 
+def trades_chunk_remove_duplicates(
+        trades: DataFrame, last_trades: Optional[DataFrame]
+) -> Tuple[DataFrame, Optional[DataFrame]]:
+    """
+    Removes duplicates from one chunk of a stream of trades (ordered by timestamp).
+    Duplicates of the last trades of the previous chunk are removed as well.
+    :param trades: DataFrame with at least the columns timestamp and id
+    :param last_trades: Trades returned for the previous chunk (or None)
+    :return: Tuple of (trades without duplicates, trades at the last timestamp of this chunk),
+        the latter must be passed to the call for the next chunk as `last_trades`.
+    """
+    subset = [col for col in ('timestamp', 'id', 'price', 'amount') if col in trades.columns]
+    trades = trades.drop_duplicates(subset=subset)
+    if last_trades is not None and not last_trades.empty:
+        last_ts = last_trades['timestamp'].iat[-1]
+        boundary = trades.loc[trades['timestamp'] == last_ts]
+        if not boundary.empty:
+            duplicated = pd.concat([last_trades, boundary]).duplicated(subset=subset).to_numpy()
+            trades = trades.drop(index=boundary.index[duplicated[len(last_trades):]])
+    if trades.empty:
+        return trades, last_trades
+    tail = trades.loc[trades['timestamp'] == trades['timestamp'].iat[-1]]
+    if last_trades is not None and not last_trades.empty and (
+            last_trades['timestamp'].iat[-1] == tail['timestamp'].iat[-1]):
+        # All trades of this chunk share the last timestamp of the previous chunk
+        tail = pd.concat([last_trades, tail], ignore_index=True)
+    return trades, tail
+
+
 def trades_dict_to_list(trades: List[Dict]) -> TradeList:
     """
     Convert fetch_trades result into a List (to be more memory efficient).
@@ -209,22 +238,35 @@ def trades_dict_to_list(trades: List[Dict]) -> TradeList:
     return [[t[col] for col in DEFAULT_TRADES_COLUMNS] for t in trades]
 
 
-def trades_to_ohlcv(trades: TradeList, timeframe: str) -> DataFrame:
+def trades_list_to_df(trades: TradeList) -> DataFrame:
+    """
+    Convert a trades list to a DataFrame with typed columns.
+    :param trades: List of Lists with constants.DEFAULT_TRADES_COLUMNS as columns
+    :return: DataFrame with constants.DEFAULT_TRADES_COLUMNS as columns
+    """
+    df = pd.DataFrame(trades, columns=DEFAULT_TRADES_COLUMNS)
+    return df.astype({'timestamp': 'int64', 'price': 'float64',
+                      'amount': 'float64', 'cost': 'float64'})
+
+
+def trades_to_ohlcv(trades: Union[TradeList, DataFrame], timeframe: str) -> DataFrame:
     """
     Converts trades list to OHLCV list
-    :param trades: List of trades, as returned by ccxt.fetch_trades.
+    :param trades: List of trades, as returned by ccxt.fetch_trades - or a DataFrame
+        containing at least the columns timestamp (in ms), price and amount.
+        Using a DataFrame avoids creating a Python object per trade and value.
     :param timeframe: Timeframe to resample data to
     :return: OHLCV Dataframe.
     :raises: ValueError if no trades are provided
     """
     from freqtrade.exchange import timeframe_to_minutes
     timeframe_minutes = timeframe_to_minutes(timeframe)
-    if not trades:
+    if len(trades) == 0:
         raise ValueError('Trade-list empty.')
-    df = pd.DataFrame(trades, columns=DEFAULT_TRADES_COLUMNS)
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms',
-                                     utc=True,)
-    df = df.set_index('timestamp')
+    if not isinstance(trades, DataFrame):
+        trades = pd.DataFrame(trades, columns=DEFAULT_TRADES_COLUMNS)
+    df = pd.DataFrame({'price': trades['price'].to_numpy(), 'amount': trades['amount'].to_numpy()},
+                      index=pd.to_datetime(trades['timestamp'].to_numpy(), unit='ms', utc=True))
 
     df_new = df['price'].resample(f'{timeframe_minutes}min').ohlc()
     df_new['volume'] = df['amount'].resample(f'{timeframe_minutes}min').sum()
@@ -234,6 +276,32 @@ def trades_to_ohlcv(trades: TradeList, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def trades_to_ohlcv_chunk(
+        trades: DataFrame, timeframe: str, pending: Optional[DataFrame]
+) -> Tuple[DataFrame, DataFrame]:
+    """
+    Convert one chunk of a stream of trades (ordered by timestamp) to OHLCV.
+    The last candle of a chunk may continue in the next chunk, so it's returned separately
+    and must be passed to the call for the next chunk as `pending`.
+    :param trades: DataFrame with at least the columns timestamp (in ms), price and amount
+    :param timeframe: Timeframe to resample data to
+    :param pending: Pending candle returned for the previous chunk (or None)
+    :return: Tuple of (completed candles, pending candle)
+    :raises: ValueError if no trades are provided
+    """
+    ohlcv = trades_to_ohlcv(trades, timeframe).reset_index(drop=True)
+    if pending is not None and len(pending) > 0:
+        if ohlcv['date'].iat[0] == pending['date'].iat[0]:
+            # Candle spans both chunks
+            ohlcv.loc[0, 'open'] = pending['open'].iat[0]
+            ohlcv.loc[0, 'high'] = max(ohlcv['high'].iat[0], pending['high'].iat[0])
+            ohlcv.loc[0, 'low'] = min(ohlcv['low'].iat[0], pending['low'].iat[0])
+            ohlcv.loc[0, 'volume'] += pending['volume'].iat[0]
+        else:
+            ohlcv = pd.concat([pending, ohlcv], ignore_index=True)
+    return ohlcv.iloc[:-1], ohlcv.iloc[-1:]
+
+
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
     """
     Convert trades from one format to another format.
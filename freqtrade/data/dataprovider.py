@@ -48,6 +48,10 @@ class DataProvider:
         self.__producer_pairs_df: Dict[str,
                                        Dict[PairWithTimeframe, Tuple[DataFrame, datetime]]] = {}
         self.__producer_pairs: Dict[str, List[str]] = {}
+        # Sequence number and last candle date of the last emitted dataframe per pair_key
+        self.__emitted_dfs: Dict[PairWithTimeframe, Tuple[int, Timestamp]] = {}
+        # Serialized API responses per pair_key - dropped once a new dataframe is cached
+        self.__response_cache: Dict[PairWithTimeframe, Dict[Any, bytes]] = {}
         self._msg_queue: deque = deque()
 
         self._default_candle_type = self._config.get('candle_type_def', CandleType.SPOT)
@@ -85,6 +89,19 @@ class DataProvider:
         pair_key = (pair, timeframe, candle_type)
         self.__cached_pairs[pair_key] = (
             dataframe, datetime.now(timezone.utc))
+        self.__response_cache.pop(pair_key, None)
+
+    def _get_response_cache(self, pair: str, timeframe: str) -> Dict[Any, bytes]:
+        """
+        Cache for serialized responses based on the analyzed dataframe of this pair.
+        Emptied whenever a new analyzed dataframe is stored for the pair.
+        Using private method as this should never be used by a user
+        :param pair: pair to get the cache for
+        :param timeframe: timeframe to get the cache for
+        :return: Dict which may be used by the caller to store serialized responses
+        """
+        pair_key = (pair, timeframe, self._config.get('candle_type_def', CandleType.SPOT))
+        return self.__response_cache.setdefault(pair_key, {})
 
     # For multiple producers we will want to merge the pairlists instead of overwriting
     def _set_producer_pairs(self, pairlist: List[str], producer_name: str = "default"):
@@ -110,20 +127,34 @@ class DataProvider:
         new_candle: bool
     ) -> None:
         """
-        Send this dataframe as an ANALYZED_DF message to RPC
+        Send the candles of this dataframe which changed since the last emit
+        as an ANALYZED_DF message to RPC.
+        Usually this is the last candle only - unless candles have been appended since the
+        last emit. Each message carries a sequence number per pair_key, so consumers can
+        detect lost messages.
 
         :param pair_key: PairWithTimeframe tuple
         :param dataframe: Dataframe to emit
         :param new_candle: This is a new candle
         """
         if self.__rpc:
+            seq, last_date = self.__emitted_dfs.get(pair_key, (0, None))
+            delta = dataframe.tail(1)
+            if new_candle and last_date is not None:
+                # All candles appended since the last emit
+                start = dataframe['date'].searchsorted(last_date, side='right')
+                if 0 < len(dataframe) - start < FULL_DATAFRAME_THRESHOLD:
+                    delta = dataframe.iloc[start:]
+            self.__emitted_dfs[pair_key] = (seq + 1, dataframe.iloc[-1]['date'])
+
             self.__rpc.send_msg(
                 {
                     'type': RPCMessageType.ANALYZED_DF,
                     'data': {
                         'key': pair_key,
-                        'df': dataframe.tail(1),
-                        'la': datetime.now(timezone.utc)
+                        'df': delta,
+                        'la': datetime.now(timezone.utc),
+                        'seq': seq + 1,
                     }
                 }
             )
@@ -408,6 +439,7 @@ class DataProvider:
         Clear pair dataframe cache.
         """
         self.__cached_pairs = {}
+        self.__response_cache = {}
         # Don't reset backtesting pairs -
         # otherwise they're reloaded each time during hyperopt due to with analyze_per_epoch
         # self.__cached_pairs_backtesting = {}
@@ -1,10 +1,16 @@
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, List, Optional
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import rapidjson
 from pandas import DataFrame, read_feather, to_datetime
+from pyarrow import feather
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, TradeList
+from freqtrade.constants import (DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS,
+                                 OHLCV_BATCH_SIZE, TRADES_BATCH_SIZE, TradeList)
 from freqtrade.enums import CandleType
 
 from .idatahandler import IDataHandler
@@ -12,6 +18,19 @@ from .idatahandler import IDataHandler
 
 logger = logging.getLogger(__name__)
 
+TRADES_SCHEMA = pa.schema([
+    ('timestamp', pa.int64()),
+    ('id', pa.string()),
+    ('type', pa.string()),
+    ('side', pa.string()),
+    ('price', pa.float64()),
+    ('amount', pa.float64()),
+    ('cost', pa.float64()),
+])
+
+# Schema metadata key containing the date range (in ms) of each record batch of ohlcv files
+BATCH_RANGES_KEY = b'freqtrade_batch_ranges'
+
 
 class FeatherDataHandler(IDataHandler):
 
@@ -32,8 +51,18 @@ class FeatherDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_feather(
-            filename, compression_level=9, compression='lz4')
+        table = pa.Table.from_pandas(data.loc[:, self._columns], preserve_index=False)
+        # Store the date range of each record batch, so loading a timerange
+        # only needs to read the batches overlapping with it.
+        dates = data['date'].values.astype('datetime64[ms]').astype('int64')
+        batch_ranges = [[int(dates[idx]), int(dates[min(idx + OHLCV_BATCH_SIZE, len(dates)) - 1])]
+                        for idx in range(0, len(dates), OHLCV_BATCH_SIZE)]
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            BATCH_RANGES_KEY: rapidjson.dumps(batch_ranges),
+        })
+        feather.write_feather(table, filename, compression='lz4', compression_level=9,
+                              chunksize=OHLCV_BATCH_SIZE)
 
     def _ohlcv_load(self, pair: str, timeframe: str,
                     timerange: Optional[TimeRange], candle_type: CandleType
@@ -59,7 +88,7 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
 
-        pairdata = read_feather(filename)
+        pairdata = self._read_ohlcv_file(filename, timerange)
         pairdata.columns = self._columns
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
                                           'low': 'float', 'close': 'float', 'volume': 'float'})
@@ -69,6 +98,27 @@ class FeatherDataHandler(IDataHandler):
                                        infer_datetime_format=True)
         return pairdata
 
+    @staticmethod
+    def _read_ohlcv_file(filename: Path, timerange: Optional[TimeRange]) -> DataFrame:
+        """
+        Read the record batches of an ohlcv file which overlap with timerange.
+        Files without batch ranges (written by older versions) are read completely.
+        """
+        with pa.memory_map(str(filename), 'r') as source:
+            reader = pa.ipc.open_file(source)
+            batch_ranges = (reader.schema.metadata or {}).get(BATCH_RANGES_KEY)
+            if not timerange or batch_ranges is None:
+                return read_feather(filename)
+            startms = timerange.startts * 1000 if timerange.starttype == 'date' else None
+            stopms = timerange.stopts * 1000 if timerange.stoptype == 'date' else None
+            batches = [
+                reader.get_batch(idx)
+                for idx, (batch_start, batch_end) in enumerate(rapidjson.loads(batch_ranges))
+                if (startms is None or batch_end >= startms)
+                and (stopms is None or batch_start <= stopms)
+            ]
+            return pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+
     def ohlcv_append(
         self,
         pair: str,
@@ -87,17 +137,23 @@ class FeatherDataHandler(IDataHandler):
 
     def trades_store(self, pair: str, data: TradeList) -> None:
         """
-        Store trades data (list of Dicts) to file
+        Store trades data (list of Lists) to file.
+        Data is written as uncompressed Arrow IPC file with typed columns, split into
+        record batches of TRADES_BATCH_SIZE rows - so it can be memory-mapped and
+        read batch by batch.
         :param pair: Pair - used for filename
         :param data: List of Lists containing trade data,
                      column sequence as in DEFAULT_TRADES_COLUMNS
         """
-        # filename = self._pair_trades_filename(self._datadir, pair)
+        filename = self._pair_trades_filename(self._datadir, pair)
+        self.create_dir_if_needed(filename)
 
-        raise NotImplementedError()
-        # array = pa.array(data)
-        # array
-        # feather.write_feather(data, filename)
+        columns = list(zip(*data)) if data else [[] for _ in DEFAULT_TRADES_COLUMNS]
+        table = pa.Table.from_arrays(
+            [pa.array(col, type=TRADES_SCHEMA.field(idx).type) for idx, col in enumerate(columns)],
+            schema=TRADES_SCHEMA)
+        feather.write_feather(table, filename, compression='uncompressed',
+                              chunksize=TRADES_BATCH_SIZE)
 
     def trades_append(self, pair: str, data: TradeList):
         """
@@ -110,20 +166,56 @@ class FeatherDataHandler(IDataHandler):
 
     def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
         """
-        Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
+        Load a pair from feather file.
         :param pair: Load trades for this pair
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for
         :return: List of trades
         """
-        raise NotImplementedError()
-        # filename = self._pair_trades_filename(self._datadir, pair)
-        # tradesdata = misc.file_load_json(filename)
-
-        # if not tradesdata:
-        #     return []
-
-        # return tradesdata
+        trades: TradeList = []
+        for df in self.trades_iter(pair, timerange=timerange):
+            df = df.astype(object).where(df.notna(), None)
+            trades.extend(df.values.tolist())
+        return trades
+
+    def trades_iter(self, pair: str, timerange: Optional[TimeRange] = None,
+                    columns: Optional[List[str]] = None) -> Iterator[DataFrame]:
+        """
+        Iterate over stored trades one record batch at a time.
+        The file is memory-mapped - only the requested columns of batches within
+        the timerange are read from disk.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for
+        :param columns: Columns to load (defaults to DEFAULT_TRADES_COLUMNS)
+        :return: Iterator of DataFrames with the requested columns
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return
+        startms = timerange.startts * 1000 if timerange and timerange.starttype == 'date' else None
+        stopms = timerange.stopts * 1000 if timerange and timerange.stoptype == 'date' else None
+        columns = columns or DEFAULT_TRADES_COLUMNS
+
+        with pa.memory_map(str(filename), 'r') as source:
+            reader = pa.ipc.open_file(source)
+            for idx in range(reader.num_record_batches):
+                batch = reader.get_batch(idx)
+                if batch.num_rows == 0:
+                    continue
+                timestamps = batch.column('timestamp')
+                if startms is not None or stopms is not None:
+                    minmax = pc.min_max(timestamps)
+                    if ((startms is not None and minmax['max'].as_py() < startms)
+                            or (stopms is not None and minmax['min'].as_py() >= stopms)):
+                        # Skip batches outside of the timerange without reading them
+                        continue
+                    mask = None
+                    if startms is not None:
+                        mask = pc.greater_equal(timestamps, startms)
+                    if stopms is not None:
+                        stopmask = pc.less(timestamps, stopms)
+                        mask = stopmask if mask is None else pc.and_(mask, stopmask)
+                    batch = batch.filter(mask)
+                yield pa.Table.from_batches([batch]).select(columns).to_pandas()
 
     @classmethod
     def _get_file_extension(cls):
@@ -1,11 +1,12 @@
 import logging
-from typing import Optional
+from typing import Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS, TradeList
+from freqtrade.constants import (DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS,
+                                 TRADES_BATCH_SIZE, TradeList)
 from freqtrade.enums import CandleType
 
 from .idatahandler import IDataHandler
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 class HDF5DataHandler(IDataHandler):
 
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    _ohlcv_append_supported = True
 
     def ohlcv_store(
             self, pair: str, timeframe: str, data: pd.DataFrame, candle_type: CandleType) -> None:
@@ -98,7 +100,14 @@ class HDF5DataHandler(IDataHandler):
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        key = self._pair_ohlcv_key(pair, timeframe)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        data.loc[:, self._columns].to_hdf(
+            filename, key, mode='a', append=True, complevel=9, complib='blosc',
+            format='table', data_columns=['date']
+        )
 
     def trades_store(self, pair: str, data: TradeList) -> None:
         """
@@ -147,6 +156,33 @@ class HDF5DataHandler(IDataHandler):
         trades[['id', 'type']] = trades[['id', 'type']].replace({np.nan: None})
         return trades.values.tolist()
 
+    def trades_iter(self, pair: str, timerange: Optional[TimeRange] = None,
+                    columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over stored trades in chunks of TRADES_BATCH_SIZE rows.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for
+        :param columns: Columns to load (defaults to DEFAULT_TRADES_COLUMNS)
+        :return: Iterator of DataFrames with the requested columns
+        """
+        key = self._pair_trades_key(pair)
+        filename = self._pair_trades_filename(self._datadir, pair)
+
+        if not filename.exists():
+            return
+        where = []
+        if timerange:
+            if timerange.starttype == 'date':
+                where.append(f"timestamp >= {timerange.startts * 1e3}")
+            if timerange.stoptype == 'date':
+                where.append(f"timestamp < {timerange.stopts * 1e3}")
+
+        with pd.HDFStore(filename, mode='r') as store:
+            for chunk in store.select(key, where=where, columns=columns,
+                                      chunksize=TRADES_BATCH_SIZE):
+                if not chunk.empty:
+                    yield chunk.reset_index(drop=True)
+
     @classmethod
     def _get_file_extension(cls):
         return "h5"
@@ -1,16 +1,24 @@
 import logging
 import operator
+import queue
+import shutil
+import tempfile
 from datetime import datetime
+from functools import partial
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import arrow
+from joblib import effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, TRADES_OHLCV_COLUMNS
 from freqtrade.data.converter import (clean_ohlcv_dataframe, ohlcv_to_dataframe,
-                                      trades_remove_duplicates, trades_to_ohlcv)
+                                      trades_chunk_remove_duplicates, trades_remove_duplicates,
+                                      trades_to_ohlcv_chunk)
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
@@ -21,6 +29,47 @@ from freqtrade.misc import format_ms_time
 logger = logging.getLogger(__name__)
 
 
+def _call_with_log_records(func: Callable, log_level: int, *args) -> Tuple[Any, List]:
+    """
+    Call func in a worker process.
+    Logging isn't configured in worker processes - so log records are collected
+    and returned, to be handled by the parent process (see _map_in_workers()).
+    :param log_level: Effective log level of the parent process
+    :return: Tuple of (result of func, list of log records)
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = QueueHandler(records)
+    root = logging.getLogger()
+    previous_level = root.level
+    root.addHandler(handler)
+    root.setLevel(log_level)
+    try:
+        result = func(*args)
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(previous_level)
+    log_records = []
+    while not records.empty():
+        log_records.append(records.get())
+    return result, log_records
+
+
+def _map_in_workers(func: Callable, items: List, workers: int) -> Iterator[Any]:
+    """
+    Map func over items using the reusable loky executor.
+    Logs of the worker processes are passed to the configured handlers of this process.
+    """
+    call = partial(_call_with_log_records, func, logging.getLogger().getEffectiveLevel())
+    results: Iterable[Tuple[Any, List]] = get_reusable_executor(max_workers=workers).map(
+        call, items)
+    for result, log_records in results:
+        for record in log_records:
+            record_logger = logging.getLogger(record.name)
+            if record_logger.isEnabledFor(record.levelno):
+                record_logger.handle(record)
+        yield result
+
+
 def load_pair_history(pair: str,
                       timeframe: str,
                       datadir: Path, *,
@@ -70,6 +119,8 @@ def load_data(datadir: Path,
               data_format: str = 'json',
               candle_type: CandleType = CandleType.SPOT,
               user_futures_funding_rate: Optional[int] = None,
+              jobs: int = 1,
+              progress_callback: Optional[Callable[[], None]] = None,
               ) -> Dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -83,6 +134,8 @@ def load_data(datadir: Path,
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param jobs: Number of processes used to load pairs in parallel (-1 for all CPUs).
+    :param progress_callback: Called once for every loaded pair
     :return: dict(<pair>:<Dataframe>)
     """
     result: Dict[str, DataFrame] = {}
@@ -90,15 +143,23 @@ def load_data(datadir: Path,
         logger.info(f'Using indicator startup period: {startup_candles} ...')
 
     data_handler = get_datahandler(datadir, data_format)
-
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, timeframe=timeframe,
-                                 datadir=datadir, timerange=timerange,
-                                 fill_up_missing=fill_up_missing,
-                                 startup_candles=startup_candles,
-                                 data_handler=data_handler,
-                                 candle_type=candle_type,
-                                 )
+    load_pair = partial(load_pair_history, timeframe=timeframe,
+                        datadir=datadir, timerange=timerange,
+                        fill_up_missing=fill_up_missing,
+                        startup_candles=startup_candles,
+                        data_handler=data_handler,
+                        candle_type=candle_type,
+                        )
+    if len(pairs) > 1 and effective_n_jobs(jobs) > 1:
+        workers = min(effective_n_jobs(jobs), len(pairs))
+        logger.info(f'Loading {len(pairs)} pairs using {workers} processes.')
+        histories = _map_in_workers(load_pair, pairs, workers)
+    else:
+        histories = map(load_pair, pairs)
+
+    for pair, hist in zip(pairs, histories):
+        if progress_callback:
+            progress_callback()
         if not hist.empty:
             result[pair] = hist
         else:
@@ -415,6 +476,87 @@ def refresh_backtest_trades_data(exchange: Exchange, pairs: List[str], datadir:
     return pairs_not_available
 
 
+def _trades_to_ohlcv_stream(data_handler: IDataHandler, pair: str, timeframes: List[str]
+                            ) -> Iterator[Tuple[str, DataFrame]]:
+    """
+    Convert stored trades to ohlcv, one chunk of trades at a time.
+    :return: Iterator of (timeframe, completed candles)
+    :raises: ValueError if no trades are available
+    """
+    pending: Dict[str, Optional[DataFrame]] = {timeframe: None for timeframe in timeframes}
+    last_trades: Optional[DataFrame] = None
+    # Only load the columns required for the conversion - as typed arrays
+    for trades in data_handler.trades_iter(pair, columns=TRADES_OHLCV_COLUMNS):
+        trades, last_trades = trades_chunk_remove_duplicates(trades, last_trades)
+        if trades.empty:
+            continue
+        for timeframe in timeframes:
+            ohlcv, pending[timeframe] = trades_to_ohlcv_chunk(
+                trades, timeframe, pending[timeframe])
+            yield timeframe, ohlcv
+
+    for timeframe, last_candle in pending.items():
+        if last_candle is None:
+            raise ValueError('Trade-list empty.')
+        yield timeframe, last_candle
+
+
+def _convert_trades_to_ohlcv_pair(
+    pair: str,
+    timeframes: List[str],
+    datadir: Path,
+    erase: bool,
+    data_format_ohlcv: str,
+    data_format_trades: str,
+    candle_type: CandleType
+) -> None:
+    """
+    Convert stored trades of one pair to ohlcv data.
+    Completed candles are appended to new ohlcv files as trades are processed - which replace
+    existing data once the conversion succeeded. Candles are collected and stored at once
+    if the ohlcv datahandler doesn't support appending.
+    """
+    data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
+    data_handler_ohlcv = get_datahandler(datadir, data_format=data_format_ohlcv)
+    append = data_handler_ohlcv._ohlcv_append_supported
+
+    if erase:
+        for timeframe in timeframes:
+            if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+                logger.info(f'Deleting existing data for pair {pair}, interval {timeframe}.')
+
+    completed: Dict[str, List[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    tmpdir = Path(tempfile.mkdtemp(prefix='.convert-', dir=datadir)) if append else None
+    try:
+        if tmpdir is None:
+            for timeframe, ohlcv in _trades_to_ohlcv_stream(
+                    data_handler_trades, pair, timeframes):
+                completed[timeframe].append(ohlcv)
+            for timeframe, ohlcv_chunks in completed.items():
+                # Store ohlcv
+                data_handler_ohlcv.ohlcv_store(
+                    pair, timeframe, data=concat(ohlcv_chunks, ignore_index=True),
+                    candle_type=candle_type)
+        else:
+            data_handler_tmp = get_datahandler(tmpdir, data_format=data_format_ohlcv)
+            for timeframe, ohlcv in _trades_to_ohlcv_stream(
+                    data_handler_trades, pair, timeframes):
+                if not ohlcv.empty:
+                    data_handler_tmp.ohlcv_append(pair, timeframe, ohlcv, candle_type=candle_type)
+            for timeframe in timeframes:
+                # Replace existing data with the converted data
+                filename = data_handler_ohlcv._pair_data_filename(
+                    datadir, pair, timeframe, candle_type)
+                data_handler_ohlcv.create_dir_if_needed(filename)
+                data_handler_tmp._pair_data_filename(
+                    tmpdir, pair, timeframe, candle_type).replace(filename)
+    except ValueError:
+        logger.exception(f'Could not convert {pair} to OHLCV.')
+    finally:
+        if tmpdir is not None:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
 def convert_trades_to_ohlcv(
     pairs: List[str],
     timeframes: List[str],
@@ -423,26 +565,26 @@ def convert_trades_to_ohlcv(
     erase: bool = False,
     data_format_ohlcv: str = 'json',
     data_format_trades: str = 'jsongz',
-    candle_type: CandleType = CandleType.SPOT
+    candle_type: CandleType = CandleType.SPOT,
+    jobs: int = 1,
 ) -> None:
     """
-    Convert stored trades data to ohlcv data
+    Convert stored trades data to ohlcv data.
+    Memory usage depends on the chunk size of the trades datahandler, not on the
+    length of the trades history.
+    :param jobs: Number of processes to convert pairs in parallel (-1 for all CPUs).
     """
-    data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
-    data_handler_ohlcv = get_datahandler(datadir, data_format=data_format_ohlcv)
-
-    for pair in pairs:
-        trades = data_handler_trades.trades_load(pair)
-        for timeframe in timeframes:
-            if erase:
-                if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                    logger.info(f'Deleting existing data for pair {pair}, interval {timeframe}.')
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.exception(f'Could not convert {pair} to OHLCV.')
+    convert_pair = partial(_convert_trades_to_ohlcv_pair, timeframes=timeframes, datadir=datadir,
+                           erase=erase, data_format_ohlcv=data_format_ohlcv,
+                           data_format_trades=data_format_trades, candle_type=candle_type)
+    if len(pairs) > 1 and effective_n_jobs(jobs) > 1:
+        workers = min(effective_n_jobs(jobs), len(pairs))
+        logger.info(f'Converting {len(pairs)} pairs using {workers} processes.')
+        # Consume results to propagate exceptions
+        list(_map_in_workers(convert_pair, pairs, workers))
+    else:
+        for pair in pairs:
+            convert_pair(pair)
 
 
 def get_timerange(data: Dict[str, DataFrame]) -> Tuple[datetime, datetime]:
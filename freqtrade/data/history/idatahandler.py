@@ -9,14 +9,15 @@ from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple, Type
+from typing import Iterator, List, Optional, Tuple, Type
 
 from pandas import DataFrame
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import ListPairsWithTimeframes, TradeList
-from freqtrade.data.converter import clean_ohlcv_dataframe, trades_remove_duplicates, trim_dataframe
+from freqtrade.data.converter import (clean_ohlcv_dataframe, trades_list_to_df,
+                                      trades_remove_duplicates, trim_dataframe)
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_seconds
 
@@ -26,6 +27,9 @@ logger = logging.getLogger(__name__)
 
 class IDataHandler(ABC):
 
+    # Set by subclasses implementing ohlcv_append()
+    _ohlcv_append_supported = False
+
     _OHLCV_REGEX = r'^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)'
 
     def __init__(self, datadir: Path) -> None:
@@ -218,6 +222,26 @@ class IDataHandler(ABC):
         """
         return trades_remove_duplicates(self._trades_load(pair, timerange=timerange))
 
+    def trades_iter(self, pair: str, timerange: Optional[TimeRange] = None,
+                    columns: Optional[List[str]] = None) -> Iterator[DataFrame]:
+        """
+        Iterate over stored trades in chunks of typed DataFrames.
+        The default implementation loads all trades at once -
+        subclasses can override this to read the data incrementally.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for
+        :param columns: Columns to load (defaults to DEFAULT_TRADES_COLUMNS)
+        :return: Iterator of DataFrames with the requested columns
+        """
+        df = trades_list_to_df(self.trades_load(pair, timerange=timerange))
+        if timerange:
+            if timerange.starttype == 'date':
+                df = df.loc[df['timestamp'] >= timerange.startts * 1000]
+            if timerange.stoptype == 'date':
+                df = df.loc[df['timestamp'] < timerange.stopts * 1000]
+        if not df.empty:
+            yield df[columns] if columns else df
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -1,10 +1,10 @@
 import logging
 from typing import Optional
 
-from pandas import DataFrame, read_parquet, to_datetime
+from pandas import DataFrame, Timestamp, read_parquet, to_datetime
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, TradeList
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, OHLCV_BATCH_SIZE, TradeList
 from freqtrade.enums import CandleType
 
 from .idatahandler import IDataHandler
@@ -32,7 +32,10 @@ class ParquetDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+        # Sorted data split into row groups - so row group statistics allow skipping
+        # row groups outside of the requested timerange when loading.
+        data.reset_index(drop=True).loc[:, self._columns].to_parquet(
+            filename, row_group_size=OHLCV_BATCH_SIZE)
 
     def _ohlcv_load(self, pair: str, timeframe: str,
                     timerange: Optional[TimeRange], candle_type: CandleType
@@ -58,7 +61,15 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
 
-        pairdata = read_parquet(filename)
+        filters = []
+        if timerange:
+            if timerange.starttype == 'date':
+                filters.append(('date', '>=', Timestamp(timerange.startts, unit='s', tz='UTC')))
+            if timerange.stoptype == 'date':
+                filters.append(('date', '<=', Timestamp(timerange.stopts, unit='s', tz='UTC')))
+        # Filters are pushed down to the reader - row groups outside of the timerange
+        # are not read at all.
+        pairdata = read_parquet(filename, filters=filters or None)
         pairdata.columns = self._columns
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
                                           'low': 'float', 'close': 'float', 'volume': 'float'})
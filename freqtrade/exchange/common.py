@@ -6,6 +6,7 @@ from typing import Any, Callable, Optional, TypeVar, cast, overload
 
 from freqtrade.exceptions import DDosProtection, RetryableOrderError, TemporaryError
 from freqtrade.mixins import LoggingMixin
+from freqtrade.util import LoopProfiler
 
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,9 @@ def _get_logging_mixin():
 API_RETRY_COUNT = 4
 API_FETCH_ORDER_RETRY_COUNT = 5
 
+# Upper bounds (in seconds) of the buckets for candle refresh latencies
+OHLCV_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
 BAD_EXCHANGES = {
     "bitmex": "Various reasons.",
     "phemex": "Does not provide history.",
@@ -138,7 +142,13 @@ def retrier_async(f):
             else:
                 logger.warning(msg + 'Giving up.')
                 raise ex
-    return wrapper
+
+    @wraps(f)
+    async def timed(*args, **kwargs):
+        # Measure the whole call, including retries
+        with LoopProfiler.timer('exchange', f.__name__):
+            return await wrapper(*args, **kwargs)
+    return timed
 
 
 F = TypeVar('F', bound=Callable[..., Any])
@@ -177,7 +187,13 @@ def retrier(_func: Optional[F] = None, *, retries=API_RETRY_COUNT):
                 else:
                     logger.warning(msg + 'Giving up.')
                     raise ex
-        return cast(F, wrapper)
+
+        @wraps(f)
+        def timed(*args, **kwargs):
+            # Measure the whole call, including retries
+            with LoopProfiler.timer('exchange', f.__name__):
+                return wrapper(*args, **kwargs)
+        return cast(F, timed)
     # Support both @retrier and @retrier(retries=2) syntax
     if _func is None:
         return decorator
@@ -5,11 +5,14 @@ Cryptocurrency Exchanges support
 import asyncio
 import inspect
 import logging
+import time
+from bisect import bisect_left
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import floor
+from statistics import median
 from threading import Lock
-from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Coroutine, Dict, List, Literal, Optional, Tuple, Union
 
 import arrow
 import ccxt
@@ -17,18 +20,18 @@ import ccxt.async_support as ccxt_async
 from cachetools import TTLCache
 from ccxt import TICK_SIZE
 from dateutil import parser
-from pandas import DataFrame, concat
+from pandas import DataFrame
 
 from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHANGE_STATES, BidAsk,
                                  BuySell, Config, EntryExit, ListPairsWithTimeframes, MakerTaker,
                                  PairWithTimeframe)
-from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe, trades_dict_to_list
+from freqtrade.data.converter import ohlcv_to_dataframe, trades_dict_to_list
 from freqtrade.enums import OPTIMIZE_MODES, CandleType, MarginMode, TradingMode
 from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFundsError,
                                   InvalidOrderException, OperationalException, PricingError,
                                   RetryableOrderError, TemporaryError)
-from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, remove_credentials, retrier,
-                                       retrier_async)
+from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, OHLCV_LATENCY_BUCKETS,
+                                       remove_credentials, retrier, retrier_async)
 from freqtrade.exchange.exchange_utils import (CcxtModuleType, amount_to_contract_precision,
                                                amount_to_contracts, amount_to_precision,
                                                contracts_to_amount, date_minus_candles,
@@ -36,6 +39,7 @@ from freqtrade.exchange.exchange_utils import (CcxtModuleType, amount_to_contrac
                                                price_to_precision, timeframe_to_minutes,
                                                timeframe_to_msecs, timeframe_to_next_date,
                                                timeframe_to_prev_date, timeframe_to_seconds)
+from freqtrade.exchange.kline_store import KlineStore
 from freqtrade.exchange.types import OHLCVResponse, Ticker, Tickers
 from freqtrade.misc import (chunks, deep_merge_dicts, file_dump_json, file_load_json,
                             safe_value_fallback2)
@@ -65,6 +69,7 @@ class Exchange:
         "ohlcv_has_history": True,  # Some exchanges (Kraken) don't provide history via ohlcv
         "ohlcv_partial_candle": True,
         "ohlcv_require_since": False,
+        "ohlcv_concurrent_requests": 100,  # Maximum number of concurrent candle requests
         # Check https://github.com/ccxt/ccxt/issues/10767 for removal of ohlcv_volume_currency
         "ohlcv_volume_currency": "base",  # "base" or "quote"
         "tickers_have_quoteVolume": True,
@@ -123,7 +128,9 @@ class Exchange:
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=1800)
 
         # Holds candles
-        self._klines: Dict[PairWithTimeframe, DataFrame] = {}
+        self._klines = KlineStore()
+        # Latency statistics of the last candle refresh
+        self._ohlcv_refresh_stats: Dict[str, Any] = {}
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: Dict[str, Any] = {}
@@ -1897,7 +1904,8 @@ class Exchange:
         """
         input_coroutines: List[Coroutine[Any, Any, OHLCVResponse]] = []
         cached_pairs = []
-        for pair, timeframe, candle_type in set(pair_list):
+        # Remove duplicates, keeping the order of pair_list (whitelisted pairs first)
+        for pair, timeframe, candle_type in dict.fromkeys(pair_list):
             if (timeframe not in self.timeframes
                     and candle_type in (CandleType.SPOT, CandleType.FUTURES)):
                 logger.warning(
@@ -1929,18 +1937,10 @@ class Exchange:
         ohlcv_df = ohlcv_to_dataframe(ticks, timeframe, pair=pair, fill_missing=True,
                                       drop_incomplete=drop_incomplete)
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(concat([old, ohlcv_df], axis=0), timeframe, pair,
-                                                 fill_missing=True, drop_incomplete=False)
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config['candle_type_def'])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+            candle_limit = self.ohlcv_candle_limit(timeframe, self._config['candle_type_def'])
+            # Reassign so we return the updated, combined df - aging out old candles
+            ohlcv_df = self._klines.merge_candles(
+                (pair, timeframe, c_type), ohlcv_df, candle_limit + self._startup_candle_count)
         return ohlcv_df
 
     def refresh_latest_ohlcv(self, pair_list: ListPairsWithTimeframes, *,
@@ -1949,7 +1949,9 @@ class Exchange:
                              ) -> Dict[PairWithTimeframe, DataFrame]:
         """
         Refresh in-memory OHLCV asynchronously and set `_klines` with the result
-        Loops asynchronously over pair_list and downloads all pairs async (semi-parallel).
+        Downloads all pairs async, limited to `ohlcv_concurrent_requests` concurrent requests.
+        Requests are started in the order of pair_list - so whitelisted pairs should come first.
+        Each response is processed as soon as it arrives.
         Only used in the dataprovider.refresh() method.
         :param pair_list: List of 2 element tuples containing pair, interval to refresh
         :param since_ms: time since when to download, in milliseconds
@@ -1964,25 +1966,25 @@ class Exchange:
         input_coroutines, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
 
         results_df = {}
-        # Chunk requests into batches of 100 to avoid overwelming ccxt Throttling
-        for input_coro in chunks(input_coroutines, 100):
-            async def gather_stuff():
-                return await asyncio.gather(*input_coro, return_exceptions=True)
 
-            with self._loop_lock:
-                results = self.loop.run_until_complete(gather_stuff())
+        def process_result(res: Union[OHLCVResponse, BaseException]) -> None:
+            if isinstance(res, BaseException):
+                logger.warning(f"Async code raised an exception: {repr(res)}")
+                return
+            # Deconstruct tuple (has 5 elements)
+            pair, timeframe, c_type, ticks, drop_hint = res
+            ohlcv_df = self._process_ohlcv_df(
+                pair, timeframe, c_type, ticks, cache,
+                drop_hint if drop_incomplete is None else drop_incomplete)
 
-            for res in results:
-                if isinstance(res, Exception):
-                    logger.warning(f"Async code raised an exception: {repr(res)}")
-                    continue
-                # Deconstruct tuple (has 5 elements)
-                pair, timeframe, c_type, ticks, drop_hint = res
-                drop_incomplete = drop_hint if drop_incomplete is None else drop_incomplete
-                ohlcv_df = self._process_ohlcv_df(
-                    pair, timeframe, c_type, ticks, cache, drop_incomplete)
+            results_df[(pair, timeframe, c_type)] = ohlcv_df
 
-                results_df[(pair, timeframe, c_type)] = ohlcv_df
+        if input_coroutines:
+            start = time.monotonic()
+            with self._loop_lock:
+                latencies = self.loop.run_until_complete(
+                    self._stream_ohlcv_requests(input_coroutines, process_result))
+            self._update_ohlcv_refresh_stats(latencies, time.monotonic() - start)
 
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
@@ -1993,6 +1995,78 @@ class Exchange:
 
         return results_df
 
+    async def _stream_ohlcv_requests(
+            self, input_coroutines: List[Coroutine[Any, Any, OHLCVResponse]],
+            process_result: Callable[[Union[OHLCVResponse, BaseException]], None]) -> List[float]:
+        """
+        Run candle requests concurrently (limited by `ohlcv_concurrent_requests`),
+        calling process_result() for every response (or exception) as soon as it arrives.
+        Requests are started in the order of input_coroutines.
+        :return: Latency of every request, in seconds
+        """
+        semaphore = asyncio.Semaphore(self._ft_has['ohlcv_concurrent_requests'])
+
+        async def limited(coro: Coroutine[Any, Any, OHLCVResponse]
+                          ) -> Tuple[Union[OHLCVResponse, BaseException], float]:
+            async with semaphore:
+                start = time.monotonic()
+                request = asyncio.ensure_future(coro)
+                try:
+                    # asyncio.wait() doesn't cancel the request when this task is cancelled -
+                    # so a cancelled request can be told apart from a cancelled refresh.
+                    await asyncio.wait([request])
+                except asyncio.CancelledError:
+                    request.cancel()
+                    await asyncio.gather(request, return_exceptions=True)
+                    raise
+                try:
+                    res: Union[OHLCVResponse, BaseException] = request.result()
+                except (Exception, asyncio.CancelledError) as e:
+                    # A cancelled request must not abort the whole refresh
+                    res = e
+                return res, time.monotonic() - start
+
+        tasks = [asyncio.ensure_future(limited(coro)) for coro in input_coroutines]
+        latencies: List[float] = []
+        try:
+            for next_response in asyncio.as_completed(tasks):
+                res, latency = await next_response
+                latencies.append(latency)
+                process_result(res)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Requests of tasks cancelled before they started were never awaited
+            for coro in input_coroutines:
+                coro.close()
+        return latencies
+
+    def _update_ohlcv_refresh_stats(self, latencies: List[float], duration: float) -> None:
+        buckets = [0] * (len(OHLCV_LATENCY_BUCKETS) + 1)
+        for latency in latencies:
+            buckets[bisect_left(OHLCV_LATENCY_BUCKETS, latency)] += 1
+        self._ohlcv_refresh_stats = {
+            'requests': len(latencies),
+            'duration': duration,
+            'latency_median': median(latencies) if latencies else 0.0,
+            'latency_max': max(latencies, default=0.0),
+            'latency_histogram': dict(zip(
+                [str(bound) for bound in OHLCV_LATENCY_BUCKETS] + ['inf'], buckets)),
+        }
+        logger.debug(f"Refreshed {len(latencies)} candle requests in {duration:.3f}s, "
+                     f"median latency {self._ohlcv_refresh_stats['latency_median']:.3f}s, "
+                     f"max latency {self._ohlcv_refresh_stats['latency_max']:.3f}s.")
+
+    def get_ohlcv_refresh_stats(self) -> Dict[str, Any]:
+        """
+        Statistics of the last candle refresh which downloaded data.
+        Contains the number of requests, the duration of the refresh, median and maximum
+        request latency and a histogram of request latencies, keyed by the upper bound of each
+        bucket (in seconds).
+        """
+        return self._ohlcv_refresh_stats
+
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
         interval_in_sec = timeframe_to_seconds(timeframe)
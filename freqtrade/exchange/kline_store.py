@@ -0,0 +1,196 @@
+"""
+In-memory store for candles (OHLCV) refreshed by the exchange.
+
+Candles are kept in preallocated numpy arrays per (pair, timeframe, candle_type),
+so refreshing a pair only updates the last candles in place instead of rebuilding
+the whole dataframe.
+"""
+import logging
+from typing import Dict, Iterator, MutableMapping, Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, concat
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.exchange.exchange_utils import timeframe_to_msecs
+
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+
+
+class KlineBuffer:
+    """
+    Candles of one pair, timeframe and candle type.
+    Rows [_start, _end) of the arrays hold the candles - appending only moves _end,
+    aging out old candles only moves _start. The arrays are compacted (or grown)
+    once they are full.
+    The dataframe is materialized on access and kept until the next update.
+    """
+
+    __slots__ = ('_df', '_dates', '_values', '_start', '_end')
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        self._df: Optional[DataFrame] = dataframe
+        # Candle open times in ns - shape (capacity, )
+        self._dates: Optional[np.ndarray] = None
+        # open, high, low, close, volume - shape (5, capacity)
+        self._values: Optional[np.ndarray] = None
+        self._start = 0
+        self._end = 0
+
+    @property
+    def dataframe(self) -> DataFrame:
+        if self._df is None:
+            assert self._dates is not None and self._values is not None
+            rows = slice(self._start, self._end)
+            df = DataFrame(
+                {col: self._values[idx, rows] for idx, col in enumerate(OHLCV_COLUMNS)})
+            df.insert(0, 'date', pd.to_datetime(self._dates[rows], unit='ns', utc=True))
+            self._df = df
+        return self._df
+
+    def _init_arrays(self, tf_ns: int) -> bool:
+        """
+        Build arrays from the stored dataframe.
+        :return: False if the dataframe can't be represented by a buffer
+            (unexpected columns / dtypes or missing candles).
+        """
+        df = self._df
+        if (df is None or df.empty or list(df.columns) != DEFAULT_DATAFRAME_COLUMNS
+                or str(df['date'].dtype) != 'datetime64[ns, UTC]'
+                or any(df[col].dtype != np.float64 for col in OHLCV_COLUMNS)):
+            return False
+        dates = df['date'].values.view(np.int64)
+        if len(dates) > 1 and not (np.diff(dates) == tf_ns).all():
+            return False
+        self._dates = np.empty(2 * len(df), dtype=np.int64)
+        self._values = np.empty((len(OHLCV_COLUMNS), 2 * len(df)), dtype=np.float64)
+        self._dates[:len(df)] = dates
+        self._values[:, :len(df)] = df[OHLCV_COLUMNS].to_numpy(dtype=np.float64).T
+        self._start = 0
+        self._end = len(df)
+        return True
+
+    def _reserve(self, rows: int, max_length: int) -> None:
+        """
+        Make room for appending rows - dropping candles which would be aged out anyway.
+        """
+        assert self._dates is not None and self._values is not None
+        capacity = len(self._dates)
+        if self._end + rows <= capacity:
+            return
+        keep = min(self._end - self._start, max(max_length - rows, 0))
+        src = slice(self._end - keep, self._end)
+        if keep + rows > capacity // 2:
+            capacity = 2 * (keep + rows)
+            dates = np.empty(capacity, dtype=np.int64)
+            values = np.empty((len(OHLCV_COLUMNS), capacity), dtype=np.float64)
+        else:
+            dates, values = self._dates, self._values
+        # Copy, as source and target may overlap
+        dates[:keep] = self._dates[src].copy()
+        values[:, :keep] = self._values[:, src].copy()
+        self._dates, self._values = dates, values
+        self._start = 0
+        self._end = keep
+
+    def update(self, candles: DataFrame, tf_ns: int, max_length: int) -> bool:
+        """
+        Merge candles into the buffer, keeping only the last max_length candles.
+        Candles for known dates are combined like clean_ohlcv_dataframe() does.
+        :param candles: cleaned candles (no duplicate / missing candles)
+        :param tf_ns: timeframe in nanoseconds
+        :param max_length: Maximum number of candles to keep
+        :return: False if candles can't be merged in place (they don't follow the
+            buffered candles without gap), leaving the buffer untouched.
+        """
+        if self._dates is None and not self._init_arrays(tf_ns):
+            return False
+        assert self._dates is not None and self._values is not None
+
+        if not candles.empty:
+            if list(candles.columns) != DEFAULT_DATAFRAME_COLUMNS:
+                return False
+            new_dates = candles['date'].values.view(np.int64)
+            first_date = self._dates[self._start]
+            last_date = self._dates[self._end - 1]
+            offset = new_dates[0] - first_date
+            if (offset < 0 or offset % tf_ns != 0 or new_dates[0] > last_date + tf_ns
+                    or (len(new_dates) > 1 and not (np.diff(new_dates) == tf_ns).all())):
+                return False
+            new_values = candles[OHLCV_COLUMNS].to_numpy(dtype=np.float64).T
+
+            idx = self._start + offset // tf_ns
+            overlap = min(self._end - idx, len(new_dates))
+            if overlap > 0:
+                old = self._values[:, idx:idx + overlap]
+                new = new_values[:, :overlap]
+                # open: first, high: max, low: min, close: last, volume: max - skipping nan
+                old[0] = np.where(np.isnan(old[0]), new[0], old[0])
+                old[1] = np.fmax(old[1], new[1])
+                old[2] = np.fmin(old[2], new[2])
+                old[3] = np.where(np.isnan(new[3]), old[3], new[3])
+                old[4] = np.fmax(old[4], new[4])
+
+            append = len(new_dates) - overlap
+            if append > 0:
+                self._reserve(append, max_length)
+                self._dates[self._end:self._end + append] = new_dates[overlap:]
+                self._values[:, self._end:self._end + append] = new_values[:, overlap:]
+                self._end += append
+
+        # Age out old candles
+        self._start = max(self._start, self._end - max_length)
+        self._df = None
+        return True
+
+
+class KlineStore(MutableMapping[PairWithTimeframe, DataFrame]):
+    """
+    Candle dataframes by (pair, timeframe, candle_type).
+    Behaves like a dict of dataframes - use merge_candles() to add refreshed candles.
+    """
+
+    def __init__(self) -> None:
+        self._buffers: Dict[PairWithTimeframe, KlineBuffer] = {}
+
+    def __getitem__(self, key: PairWithTimeframe) -> DataFrame:
+        return self._buffers[key].dataframe
+
+    def __setitem__(self, key: PairWithTimeframe, dataframe: DataFrame) -> None:
+        self._buffers[key] = KlineBuffer(dataframe)
+
+    def __delitem__(self, key: PairWithTimeframe) -> None:
+        del self._buffers[key]
+
+    def __iter__(self) -> Iterator[PairWithTimeframe]:
+        return iter(self._buffers)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def merge_candles(self, key: PairWithTimeframe, candles: DataFrame,
+                      max_length: int) -> DataFrame:
+        """
+        Combine refreshed candles with the stored candles.
+        :param key: (pair, timeframe, candle_type)
+        :param candles: Cleaned candles, as returned by ohlcv_to_dataframe()
+        :param max_length: Maximum number of candles to keep
+        :return: Combined dataframe
+        """
+        pair, timeframe, _ = key
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            self[key] = candles
+            return candles
+        if not buffer.update(candles, timeframe_to_msecs(timeframe) * 1_000_000, max_length):
+            logger.debug(f"Rebuilding candle cache for {key}.")
+            ohlcv_df = clean_ohlcv_dataframe(concat([buffer.dataframe, candles], axis=0),
+                                             timeframe, pair,
+                                             fill_missing=True, drop_incomplete=False)
+            self[key] = ohlcv_df.tail(max_length).reset_index(drop=True)
+        return self[key]
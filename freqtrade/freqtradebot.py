@@ -7,7 +7,7 @@ import traceback
 from datetime import datetime, time, timedelta, timezone
 from math import isclose
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from schedule import Scheduler
 
@@ -24,7 +24,7 @@ from freqtrade.exceptions import (DependencyException, ExchangeError, Insufficie
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_next_date, timeframe_to_seconds
 from freqtrade.misc import safe_value_fallback, safe_value_fallback2
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import Order, PairLocks, Trade, init_db
+from freqtrade.persistence import LocalOrder, Order, PairLocks, Trade, init_db
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
@@ -32,7 +32,7 @@ from freqtrade.rpc import RPCManager
 from freqtrade.rpc.external_message_consumer import ExternalMessageConsumer
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import FtPrecise
+from freqtrade.util import FtPrecise, LoopProfiler
 from freqtrade.util.binance_mig import migrate_binance_futures_names
 from freqtrade.wallets import Wallets
 
@@ -198,49 +198,60 @@ class FreqtradeBot(LoggingMixin):
         :return: True if one or more trades has been created or closed, False otherwise
         """
 
+        with LoopProfiler.timer('phases', 'process'):
+            self._process()
+        self.last_process = datetime.now(timezone.utc)
+
+    def _process(self) -> None:
         # Check whether markets have to be reloaded and reload them when it's needed
-        self.exchange.reload_markets()
+        with LoopProfiler.timer('phases', 'reload_markets'):
+            self.exchange.reload_markets()
 
-        self.update_trades_without_assigned_fees()
+        with LoopProfiler.timer('phases', 'update_fees'):
+            self.update_trades_without_assigned_fees()
 
-        # Query trades from persistence layer
-        trades: List[Trade] = Trade.get_open_trades()
+        with LoopProfiler.timer('phases', 'refresh_whitelist'):
+            # Query trades from persistence layer
+            trades: List[Trade] = Trade.get_open_trades()
 
-        self.active_pair_whitelist = self._refresh_active_whitelist(trades)
+            self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
         # Refreshing candles
-        self.dataprovider.refresh(self.pairlists.create_pair_list(self.active_pair_whitelist),
-                                  self.strategy.gather_informative_pairs())
+        with LoopProfiler.timer('phases', 'refresh_candles'):
+            self.dataprovider.refresh(self.pairlists.create_pair_list(self.active_pair_whitelist),
+                                      self.strategy.gather_informative_pairs())
 
-        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
+        with LoopProfiler.timer('phases', 'bot_loop_start'):
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
 
-        self.strategy.analyze(self.active_pair_whitelist)
+        with LoopProfiler.timer('phases', 'analyze'):
+            self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
+        with LoopProfiler.timer('phases', 'manage_open_orders'), self._exit_lock:
             # Check for exchange cancelations, timeouts and user requested replace
             self.manage_open_orders()
 
         # Protect from collisions with force_exit.
         # Without this, freqtrade my try to recreate stoploss_on_exchange orders
         # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
+        with LoopProfiler.timer('phases', 'exit_positions'), self._exit_lock:
             trades = Trade.get_open_trades()
             # First process current opened trades (positions)
             self.exit_positions(trades)
 
         # Check if we need to adjust our current positions before attempting to buy new trades.
         if self.strategy.position_adjustment_enable:
-            with self._exit_lock:
+            with LoopProfiler.timer('phases', 'adjust_positions'), self._exit_lock:
                 self.process_open_trade_positions()
 
         # Then looking for buy opportunities
         if self.get_free_open_trades():
-            self.enter_positions()
+            with LoopProfiler.timer('phases', 'enter_positions'):
+                self.enter_positions()
         if self.trading_mode == TradingMode.FUTURES:
             self._schedule.run_pending()
         Trade.commit()
         self.rpc.process_msg_queue(self.dataprovider._msg_queue)
-        self.last_process = datetime.now(timezone.utc)
 
     def process_stopped(self) -> None:
         """
@@ -930,7 +941,7 @@ class FreqtradeBot(LoggingMixin):
 
         return enter_limit_requested, stake_amount, leverage
 
-    def _notify_enter(self, trade: Trade, order: Order, order_type: Optional[str] = None,
+    def _notify_enter(self, trade: Trade, order: LocalOrder, order_type: Optional[str] = None,
                       fill: bool = False, sub_trade: bool = False) -> None:
         """
         Sends rpc notification when a entry order occurred.
@@ -1256,7 +1267,8 @@ class FreqtradeBot(LoggingMixin):
 
             fully_cancelled = self.update_trade_state(trade, trade.open_order_id, order)
             not_closed = order['status'] == 'open' or fully_cancelled
-            order_obj = trade.select_order_by_order_id(trade.open_order_id)
+            # Orders of database trades are Order objects
+            order_obj = cast(Optional[Order], trade.select_order_by_order_id(trade.open_order_id))
 
             if not_closed:
                 if fully_cancelled or (order_obj and self.strategy.ft_check_timed_out(
@@ -1624,7 +1636,7 @@ class FreqtradeBot(LoggingMixin):
         return True
 
     def _notify_exit(self, trade: Trade, order_type: str, fill: bool = False,
-                     sub_trade: bool = False, order: Optional[Order] = None) -> None:
+                     sub_trade: bool = False, order: Optional[LocalOrder] = None) -> None:
         """
         Sends rpc notification when a sell occurred.
         """
@@ -1810,7 +1822,7 @@ class FreqtradeBot(LoggingMixin):
         return False
 
     def order_close_notify(
-            self, trade: Trade, order: Order, stoploss_order: bool, send_msg: bool):
+            self, trade: Trade, order: LocalOrder, stoploss_order: bool, send_msg: bool):
         """send "fill" notifications"""
 
         sub_trade = not isclose(order.safe_amount_after_fee,
@@ -1841,7 +1853,8 @@ class FreqtradeBot(LoggingMixin):
             self.rpc.send_msg(msg)
 
     def apply_fee_conditional(self, trade: Trade, trade_base_currency: str,
-                              amount: float, fee_abs: float, order_obj: Order) -> Optional[float]:
+                              amount: float, fee_abs: float,
+                              order_obj: LocalOrder) -> Optional[float]:
         """
         Applies the fee to amount (either from Order or from Trades).
         Can eat into dust if more than the required asset is available.
@@ -1863,7 +1876,7 @@ class FreqtradeBot(LoggingMixin):
             return fee_abs
         return None
 
-    def handle_order_fee(self, trade: Trade, order_obj: Order, order: Dict[str, Any]) -> None:
+    def handle_order_fee(self, trade: Trade, order_obj: LocalOrder, order: Dict[str, Any]) -> None:
         # Try update amount (binance-fix)
         try:
             fee_abs = self.get_real_amount(trade, order, order_obj)
@@ -1872,7 +1885,7 @@ class FreqtradeBot(LoggingMixin):
         except DependencyException as exception:
             logger.warning("Could not update trade amount: %s", exception)
 
-    def get_real_amount(self, trade: Trade, order: Dict, order_obj: Order) -> Optional[float]:
+    def get_real_amount(self, trade: Trade, order: Dict, order_obj: LocalOrder) -> Optional[float]:
         """
         Detect and update trade fee.
         Calls trade.update_fee() upon correct detection.
@@ -1907,7 +1920,7 @@ class FreqtradeBot(LoggingMixin):
         return self.fee_detection_from_trades(
             trade, order, order_obj, order_amount, order.get('trades', []))
 
-    def fee_detection_from_trades(self, trade: Trade, order: Dict, order_obj: Order,
+    def fee_detection_from_trades(self, trade: Trade, order: Dict, order_obj: LocalOrder,
                                   order_amount: float, trades: List) -> Optional[float]:
         """
         fee-detection fallback to Trades.
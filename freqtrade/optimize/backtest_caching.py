@@ -1,23 +1,42 @@
 import hashlib
+import logging
 from copy import deepcopy
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
 import rapidjson
+from pandas import DataFrame
 
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.misc import pair_to_filename
 
-def get_strategy_run_id(strategy) -> str:
+
+logger = logging.getLogger(__name__)
+
+# Options that have no impact on results of individual backtest.
+RUN_NOT_IMPORTANT_KEYS = ('strategy_list', 'original_config', 'telegram', 'api_server')
+
+# Options that have no impact on the analyzed dataframe of a pair.
+# Candles used for the analysis are verified separately by AnalyzedDataCache.
+ANALYSIS_NOT_IMPORTANT_KEYS = RUN_NOT_IMPORTANT_KEYS + (
+    'exchange', 'pairlists', 'pairs', 'timerange', 'datadir', 'user_data_dir', 'exportfilename',
+    'export', 'backtest_cache', 'backtest_breakdown', 'backtest_engine', 'analysis_cache',
+    'max_open_trades', 'stake_amount', 'tradable_balance_ratio', 'available_capital',
+    'dry_run_wallet', 'fee', 'position_stacking', 'use_max_market_positions',
+    'enable_protections', 'protections', 'timeframe_detail', 'config_files',
+)
+
+
+def get_config_digest(config: Dict[str, Any], not_important_keys: Tuple[str, ...]):
     """
-    Generate unique identification hash for a backtest run. Identical config and strategy file will
-    always return an identical hash.
-    :param strategy: strategy object.
-    :return: hex string id.
+    Hash config, without the keys in not_important_keys.
+    :return: hashlib object, to add further data to the hash.
     """
     digest = hashlib.sha1()
-    config = deepcopy(strategy.config)
+    config = deepcopy(config)
 
-    # Options that have no impact on results of individual backtest.
-    not_important_keys = ('strategy_list', 'original_config', 'telegram', 'api_server')
     for k in not_important_keys:
         if k in config:
             del config[k]
@@ -26,11 +45,43 @@ def get_strategy_run_id(strategy) -> str:
     # as it does not matter for getting the hash.
     digest.update(rapidjson.dumps(config, default=str,
                                   number_mode=rapidjson.NM_NAN).encode('utf-8'))
+    return digest
+
+
+def _get_strategy_digest(strategy, not_important_keys: Tuple[str, ...]):
+    digest = get_config_digest(strategy.config, not_important_keys)
     # Include _ft_params_from_file - so changing parameter files cause cache eviction
     digest.update(rapidjson.dumps(
         strategy._ft_params_from_file, default=str, number_mode=rapidjson.NM_NAN).encode('utf-8'))
     with open(strategy.__file__, 'rb') as fp:
         digest.update(fp.read())
+    return digest
+
+
+def get_strategy_run_id(strategy) -> str:
+    """
+    Generate unique identification hash for a backtest run. Identical config and strategy file will
+    always return an identical hash.
+    :param strategy: strategy object.
+    :return: hex string id.
+    """
+    return _get_strategy_digest(strategy, RUN_NOT_IMPORTANT_KEYS).hexdigest().lower()
+
+
+def get_strategy_analysis_id(strategy) -> str:
+    """
+    Generate identification hash for the analyzed dataframes of a strategy.
+    Unlike get_strategy_run_id(), options which only influence trade simulation
+    (max_open_trades, wallet, pairs, timerange, ...) are not part of this hash.
+    Candles of informative pairs are included, as they may change the analyzed dataframes.
+    :param strategy: strategy object (with dataprovider).
+    :return: hex string id.
+    """
+    digest = _get_strategy_digest(strategy, ANALYSIS_NOT_IMPORTANT_KEYS)
+    for pair, timeframe, candle_type in sorted(strategy.gather_informative_pairs()):
+        digest.update(f'{pair}|{timeframe}|{candle_type}'.encode('utf-8'))
+        informative = strategy.dp.historic_ohlcv(pair, timeframe, candle_type)
+        digest.update(_hash_candles(informative))
     return digest.hexdigest().lower()
 
 
@@ -38,3 +89,109 @@ def get_backtest_metadata_filename(filename: Union[Path, str]) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
     return filename.parent / Path(f'{filename.stem}.meta{filename.suffix}')
+
+
+def _hash_candles(candles: DataFrame) -> bytes:
+    columns = [col for col in DEFAULT_DATAFRAME_COLUMNS if col in candles.columns]
+    return pd.util.hash_pandas_object(candles[columns], index=False).values.tobytes()
+
+
+class AnalyzedDataCache:
+    """
+    Stores analyzed dataframes (result of populate_indicators) per pair and calendar month.
+
+    A chunk is identified by a hash chained over the candles of all prior months and the month
+    itself - so it is only reused if all candles up to the end of this chunk are identical.
+    Pairs are only loaded from the cache if all their months are cached. Otherwise, the whole
+    pair is analyzed again - as recursive indicators (EMA, RSI, ...) of the remaining candles
+    depend on all prior candles - and the missing months are stored.
+    Changing the start date or the strategy invalidates all chunks.
+    """
+
+    def __init__(self, directory: Path, analysis_id: str) -> None:
+        self._directory = directory / analysis_id
+
+    def _get_chunks(self, candles: DataFrame) -> List[Tuple[str, slice]]:
+        """
+        Split candles into months.
+        :return: List of (chained hash, row slice) tuples
+        """
+        dates = candles['date']
+        months = (dates.dt.year * 12 + dates.dt.month).to_numpy()
+        bounds = [0, *(np.flatnonzero(np.diff(months)) + 1).tolist(), len(candles)]
+        chunks = []
+        digest = hashlib.sha1()
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            digest.update(_hash_candles(candles.iloc[start:end]))
+            chunks.append((digest.copy().hexdigest(), slice(start, end)))
+        return chunks
+
+    def _get_chunk_file(self, pair: str, chunk_hash: str) -> Path:
+        return self._directory / pair_to_filename(pair) / f'{chunk_hash}.pkl'
+
+    def load(self, pair: str, candles: DataFrame) -> Optional[DataFrame]:
+        """
+        Load the analyzed dataframe for the longest cached leading part of the given candles.
+        :param pair: Pair the candles belong to
+        :param candles: Candles which would be passed to populate_indicators
+        :return: Analyzed dataframe for the first len(result) candles,
+            or None if the first month is not cached
+        """
+        if candles.empty:
+            return None
+        files = []
+        for chunk_hash, _ in self._get_chunks(candles):
+            file = self._get_chunk_file(pair, chunk_hash)
+            if not file.is_file():
+                break
+            files.append(file)
+        if not files:
+            return None
+        analyzed = pd.concat([pd.read_pickle(file) for file in files])
+        analyzed.index = candles.index[:len(analyzed)]
+        return analyzed
+
+    def store(self, pair: str, candles: DataFrame, analyzed: DataFrame) -> None:
+        """
+        Store chunks of an analyzed dataframe which are not cached yet.
+        :param pair: Pair the candles belong to
+        :param candles: Candles passed to populate_indicators
+        :param analyzed: Result of populate_indicators for these candles
+        """
+        if not _is_aligned(candles, analyzed):
+            logger.warning(f'Not caching analyzed dataframe for {pair}, as '
+                           'populate_indicators did not keep all candles.')
+            return
+        for chunk_hash, rows in self._get_chunks(candles):
+            file = self._get_chunk_file(pair, chunk_hash)
+            if not file.is_file():
+                file.parent.mkdir(parents=True, exist_ok=True)
+                analyzed.iloc[rows].to_pickle(file)
+
+    def advise_all_indicators(self, strategy, data: Dict[str, DataFrame]
+                              ) -> Dict[str, DataFrame]:
+        """
+        Cached version of IStrategy.advise_all_indicators().
+        populate_indicators only runs for pairs which are not fully cached.
+        """
+        result: Dict[str, DataFrame] = {}
+        missing: Dict[str, DataFrame] = {}
+        for pair, candles in data.items():
+            analyzed = self.load(pair, candles)
+            if analyzed is not None and len(analyzed) == len(candles):
+                result[pair] = analyzed
+            else:
+                missing[pair] = candles
+        logger.info(f'Reusing cached indicators for {len(result)} of {len(data)} pairs.')
+
+        for pair, analyzed in strategy.advise_all_indicators(missing).items():
+            self.store(pair, data[pair], analyzed)
+            result[pair] = analyzed
+        # Keep the order of data, so results don't depend on the cache.
+        return {pair: result[pair] for pair in data}
+
+
+def _is_aligned(candles: DataFrame, analyzed: DataFrame) -> bool:
+    """ True if analyzed contains exactly the candles passed to populate_indicators """
+    return (not candles.empty and len(candles) == len(analyzed)
+            and (candles['date'].values == analyzed['date'].values).all())
@@ -4,12 +4,18 @@
 This module contains the backtesting logic
 """
 import logging
+import sys
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from joblib import effective_n_jobs
+from joblib.externals import cloudpickle
+from joblib.externals.loky import get_reusable_executor
 from numpy import nan
 from pandas import DataFrame
 
@@ -26,16 +32,21 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import (amount_to_contract_precision, price_to_precision,
                                 timeframe_to_minutes, timeframe_to_seconds)
 from freqtrade.mixins import LoggingMixin
-from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (AnalyzedDataCache, get_strategy_analysis_id,
+                                                 get_strategy_run_id)
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.optimize.optimize_reports import (generate_backtest_stats, show_backtest_results,
                                                  store_backtest_signal_candles,
                                                  store_backtest_stats)
-from freqtrade.persistence import LocalTrade, Order, PairLocks, Trade
+from freqtrade.optimize.signal_cache import SignalCache
+from freqtrade.persistence import LocalOrder, LocalTrade, PairLocks, Trade
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+from freqtrade.resolvers.strategy_resolver import check_override
 from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import BaseParameter
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util.binance_mig import migrate_binance_futures_data
 from freqtrade.wallets import Wallets
@@ -61,6 +72,86 @@ EXIT_TAG_IDX = 10
 HEADERS = ['date', 'open', 'high', 'low', 'close', 'enter_long', 'exit_long',
            'enter_short', 'exit_short', 'enter_tag', 'exit_tag']
 
+# Backtesting instance, data and timerange of the current worker process -
+# set once by _init_backtesting_worker().
+_worker_backtesting: Optional[Tuple['Backtesting', Dict[str, DataFrame], TimeRange]] = None
+
+
+def _init_backtesting_worker(backtesting_pickle: bytes) -> None:
+    """
+    Initializer for the --strategy-jobs worker processes.
+    Unpickles Backtesting (including the shared indicators) and the data once per process.
+    """
+    global _worker_backtesting
+    _worker_backtesting = cloudpickle.loads(backtesting_pickle)
+
+
+def _backtest_strategy(
+        index: int) -> Tuple[str, Dict[str, Any], Optional[Dict], datetime, datetime]:
+    """
+    Backtest one strategy of the strategy list in a worker process.
+    :param index: Index of the strategy in Backtesting.strategylist
+    :return: Tuple of (strategy name, results, signal candles, min date, max date)
+    """
+    if _worker_backtesting is None:
+        raise OperationalException('Backtesting worker has not been initialized.')
+    backtesting, data, timerange = _worker_backtesting
+    strat = backtesting.strategylist[index]
+    min_date, max_date = backtesting.backtest_one_strategy(strat, data, timerange)
+    name = strat.get_strategy_name()
+    return (name, backtesting.all_results[name], backtesting.processed_dfs.get(name),
+            min_date, max_date)
+
+
+class PairArrays(NamedTuple):
+    """
+    Columnar backtest data for one pair, used by the columnar backtest engine.
+    """
+    dates: pd.DatetimeIndex
+    # HEADERS[OPEN_IDX:ENTER_TAG_IDX] - prices and (shifted) signals as float64
+    values: np.ndarray
+    # HEADERS[ENTER_TAG_IDX:] - enter_tag and exit_tag
+    tags: np.ndarray
+    # Backtest loop step each row is processed at
+    steps: np.ndarray
+    # Rows with a valid entry signal (see check_for_trade_entry())
+    entries: np.ndarray
+
+    def get_row(self, index: int) -> Tuple:
+        """
+        Build a single row in the same format as _get_ohlcv_as_lists() uses.
+        """
+        return (self.dates[index], *self.values[index].tolist(), *self.tags[index].tolist())
+
+
+class DetailArrays(NamedTuple):
+    """
+    Detail timeframe data for one pair, pre-indexed for fast per-candle slicing.
+    """
+    dates: pd.DatetimeIndex
+    # Dates as int64 (nanoseconds) - sorted, used for searchsorted lookups
+    dates_ns: np.ndarray
+    # HEADERS[OPEN_IDX:LONG_IDX] - open, high, low, close
+    values: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df: DataFrame) -> 'DetailArrays':
+        dates = pd.DatetimeIndex(df['date'])
+        return cls(
+            dates=dates,
+            dates_ns=dates.asi8,
+            values=df[HEADERS[OPEN_IDX:LONG_IDX]].to_numpy(dtype=np.float64),
+        )
+
+    def get_offsets(self, start: pd.Timestamp, timeframe_ns: int) -> Tuple[int, int]:
+        """
+        Get the row offsets of all detail candles within one main candle.
+        Equivalent to filtering on start <= date < start + timeframe.
+        """
+        start_ns = start.value
+        lower, upper = np.searchsorted(self.dates_ns, [start_ns, start_ns + timeframe_ns])
+        return int(lower), int(upper)
+
 
 class Backtesting:
     """
@@ -157,6 +248,12 @@ class Backtesting:
         # strategies which define "can_short=True" will fail to load in Spot mode.
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get('position_stacking', False)
+        self.backtest_engine: str = self.config.get('backtest_engine',
+                                                    constants.BACKTEST_ENGINE_DEFAULT)
+        # Enabled by hyperopt - only valid while the analyzed dataframes don't change.
+        self.signal_cache: Optional[SignalCache] = None
+        # Shares indicators between the strategies of --strategy-list.
+        self.indicator_cache: Optional[IndicatorCache] = None
         self.enable_protections: bool = self.config.get('enable_protections', False)
         migrate_binance_futures_data(config)
 
@@ -179,9 +276,26 @@ class Backtesting:
 
         else:
             self.timeframe_detail_min = 0
-        self.detail_data: Dict[str, DataFrame] = {}
+        self.detail_data = {}
         self.futures_data: Dict[str, DataFrame] = {}
 
+    @property
+    def detail_data(self) -> Dict[str, DataFrame]:
+        return self._detail_data
+
+    @detail_data.setter
+    def detail_data(self, detail_data: Dict[str, DataFrame]) -> None:
+        """
+        Assign detail timeframe data and build the per-pair index used by the backtest loop.
+        Detail data must be assigned as a whole - modifications of individual pairs
+        will not be reflected in the index.
+        """
+        self._detail_data = detail_data
+        self._detail_arrays: Dict[str, DetailArrays] = {
+            pair: DetailArrays.from_dataframe(df)
+            for pair, df in detail_data.items() if not df.empty
+        }
+
     def init_backtest(self):
 
         self.prepare_backtest(False)
@@ -220,7 +334,7 @@ class Backtesting:
         Loads backtest data and returns the data combined with the timerange
         as tuple.
         """
-        self.progress.init_step(BacktestState.DATALOAD, 1)
+        self.progress.init_step(BacktestState.DATALOAD, len(self.pairlists.whitelist))
 
         data = history.load_data(
             datadir=self.config['datadir'],
@@ -230,7 +344,9 @@ class Backtesting:
             startup_candles=self.config['startup_candle_count'],
             fail_without_data=True,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
-            candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+            candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+            jobs=self.config.get('data_jobs', 1),
+            progress_callback=self.progress.increment,
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -243,7 +359,6 @@ class Backtesting:
         self.timerange.adjust_start_if_necessary(timeframe_to_seconds(self.timeframe),
                                                  self.required_startup, min_date)
 
-        self.progress.set_new_value(1)
         return data, self.timerange
 
     def load_bt_data_detail(self) -> None:
@@ -259,7 +374,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+                candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+                jobs=self.config.get('data_jobs', 1),
             )
         else:
             self.detail_data = {}
@@ -273,7 +389,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=CandleType.FUNDING_RATE
+                candle_type=CandleType.FUNDING_RATE,
+                jobs=self.config.get('data_jobs', 1),
             )
 
             # For simplicity, assign to CandleType.Mark (might contian index candles!)
@@ -285,7 +402,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
-                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price"))
+                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                jobs=self.config.get('data_jobs', 1),
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -335,6 +453,71 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
+    def _advise_signals(self, pair: str, pair_data: DataFrame) -> DataFrame:
+        """
+        Run the entry / exit functions of the strategy for one pair.
+        With the signal cache enabled, the columns added or modified by these functions
+        are reused if none of the strategy parameters they read changed.
+        """
+        metadata = {'pair': pair}
+        if self.signal_cache is None or pair_data.empty:
+            return self.strategy.advise_exit(
+                self.strategy.advise_entry(pair_data, metadata), metadata).copy()
+
+        signals = self.signal_cache.get(pair)
+        if signals is not None:
+            columns = list(pair_data.columns)
+            columns += [col for col in signals.columns if col not in pair_data.columns]
+            return pd.concat(
+                [pair_data.drop(columns=signals.columns, errors='ignore'), signals],
+                axis=1)[columns]
+
+        with BaseParameter.track_reads() as reads:
+            # Work on a copy, so columns modified by the signal functions can be detected
+            df_analyzed = self.strategy.advise_exit(
+                self.strategy.advise_entry(pair_data.copy(), metadata), metadata).copy()
+        if all(col in df_analyzed.columns for col in pair_data.columns):
+            self.signal_cache.set(pair, reads, df_analyzed[[
+                col for col in df_analyzed.columns
+                if col not in pair_data.columns or not df_analyzed[col].equals(pair_data[col])
+            ]])
+        return df_analyzed
+
+    def _get_shifted_signal_dataframe(self, pair: str, processed: Dict[str, DataFrame]
+                                      ) -> DataFrame:
+        """
+        Populate entry / exit signals for one pair and shift them by one candle.
+        Replaces processed[pair] with the trimmed, analyzed dataframe.
+        """
+        pair_data = processed[pair]
+        if not pair_data.empty:
+            # Cleanup from prior runs
+            pair_data.drop(HEADERS[5:] + ['buy', 'sell'], axis=1, errors='ignore')
+
+        df_analyzed = self._advise_signals(pair, pair_data)
+        # Trim startup period from analyzed dataframe
+        df_analyzed = processed[pair] = pair_data = trim_dataframe(
+            df_analyzed, self.timerange, startup_candles=self.required_startup)
+        # Update dataprovider cache
+        self.dataprovider._set_cached_df(
+            pair, self.timeframe, df_analyzed, self.config['candle_type_def'])
+
+        # Create a copy of the dataframe before shifting, that way the entry signal/tag
+        # remains on the correct candle for callbacks.
+        df_analyzed = df_analyzed.copy()
+
+        # To avoid using data from future, we use entry/exit signals shifted
+        # from the previous candle
+        for col in HEADERS[5:]:
+            tag_col = col in ('enter_tag', 'exit_tag')
+            if col in df_analyzed.columns:
+                df_analyzed[col] = df_analyzed.loc[:, col].replace(
+                    [nan], [0 if not tag_col else None]).shift(1)
+            elif not df_analyzed.empty:
+                df_analyzed[col] = 0 if not tag_col else None
+
+        return df_analyzed.drop(df_analyzed.head(1).index)
+
     def _get_ohlcv_as_lists(self, processed: Dict[str, DataFrame]) -> Dict[str, Tuple]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
@@ -350,46 +533,106 @@ class Backtesting:
 
         # Create dict with data
         for pair in processed.keys():
-            pair_data = processed[pair]
             self.check_abort()
             self.progress.increment()
 
-            if not pair_data.empty:
-                # Cleanup from prior runs
-                pair_data.drop(HEADERS[5:] + ['buy', 'sell'], axis=1, errors='ignore')
+            df_analyzed = self._get_shifted_signal_dataframe(pair, processed)
+            data[pair] = self._convert_pair_data(
+                pair, df_analyzed, 'lists', self._dataframe_to_list)
+        return data
 
-            df_analyzed = self.strategy.advise_exit(
-                self.strategy.advise_entry(pair_data, {'pair': pair}),
-                {'pair': pair}
-            ).copy()
-            # Trim startup period from analyzed dataframe
-            df_analyzed = processed[pair] = pair_data = trim_dataframe(
-                df_analyzed, self.timerange, startup_candles=self.required_startup)
-            # Update dataprovider cache
-            self.dataprovider._set_cached_df(
-                pair, self.timeframe, df_analyzed, self.config['candle_type_def'])
-
-            # Create a copy of the dataframe before shifting, that way the entry signal/tag
-            # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
-
-            # To avoid using data from future, we use entry/exit signals shifted
-            # from the previous candle
-            for col in HEADERS[5:]:
-                tag_col = col in ('enter_tag', 'exit_tag')
-                if col in df_analyzed.columns:
-                    df_analyzed[col] = df_analyzed.loc[:, col].replace(
-                        [nan], [0 if not tag_col else None]).shift(1)
-                elif not df_analyzed.empty:
-                    df_analyzed[col] = 0 if not tag_col else None
-
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
-
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+    @staticmethod
+    def _dataframe_to_list(df_analyzed: DataFrame) -> List[List]:
+        # Convert from Pandas to list for performance reasons
+        # (Looping Pandas is slow.)
+        return df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+
+    def _convert_pair_data(self, pair: str, df_analyzed: DataFrame, kind: Hashable,
+                           convert: Callable[[DataFrame], Any]) -> Any:
+        """
+        Convert the shifted signal dataframe of one pair to the format used by the backtest loop.
+        With the signal cache enabled, data from the prior run is reused if the signals
+        didn't change.
+        """
+        if self.signal_cache is None:
+            return convert(df_analyzed)
+        signals = df_analyzed[[col for col in HEADERS[5:] if col in df_analyzed.columns]]
+        data = self.signal_cache.get_converted(pair, kind, signals)
+        if data is None:
+            data = convert(df_analyzed)
+            self.signal_cache.set_converted(pair, kind, signals, data)
         return data
 
+    def _get_ohlcv_as_arrays(self, processed: Dict[str, DataFrame], start_date: datetime
+                             ) -> Dict[str, PairArrays]:
+        """
+        Columnar counterpart of _get_ohlcv_as_lists, used by the columnar backtest engine.
+        Keeps every pair as contiguous NumPy arrays, aligned on the backtest loop steps.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        """
+
+        data: Dict[str, PairArrays] = {}
+        self.progress.init_step(BacktestState.CONVERT, len(processed))
+        timeframe_ns = self.timeframe_min * 60 * 10 ** 9
+        start_ns = pd.Timestamp(start_date).value
+
+        for pair in processed.keys():
+            self.check_abort()
+            self.progress.increment()
+
+            df_analyzed = self._get_shifted_signal_dataframe(pair, processed)
+            data[pair] = self._convert_pair_data(
+                pair, df_analyzed, ('arrays', start_ns),
+                partial(self._dataframe_to_arrays, start_ns=start_ns, timeframe_ns=timeframe_ns))
+        return data
+
+    def _dataframe_to_arrays(self, df_analyzed: DataFrame, start_ns: int, timeframe_ns: int
+                             ) -> PairArrays:
+        if df_analyzed.empty:
+            df_analyzed = DataFrame({'date': pd.to_datetime([], utc=True)}, columns=HEADERS)
+
+        dates = pd.DatetimeIndex(df_analyzed['date'])
+        values = df_analyzed[HEADERS[OPEN_IDX:ENTER_TAG_IDX]].to_numpy(dtype=np.float64)
+        tags = df_analyzed[HEADERS[ENTER_TAG_IDX:]].to_numpy(dtype=object)
+        return PairArrays(
+            dates=dates,
+            values=values,
+            tags=tags,
+            steps=self._calculate_row_steps(dates.asi8, start_ns, timeframe_ns),
+            entries=self._entry_signal_mask(values),
+        )
+
+    @staticmethod
+    def _calculate_row_steps(dates_ns: np.ndarray, start_ns: int, timeframe_ns: int
+                             ) -> np.ndarray:
+        """
+        Calculate the loop step at which each row is processed by the backtest loop.
+        Step n corresponds to current_time = start_date + (n + 1) * timeframe.
+        A row becomes available once current_time reaches its date, and every pair
+        advances by at most one row per step (see validate_row()).
+        """
+        if len(dates_ns) == 0:
+            return np.empty(0, dtype=np.int64)
+        # Ceiling division of the distance to the first loop time
+        earliest = np.maximum(-((start_ns + timeframe_ns - dates_ns) // timeframe_ns), 0)
+        idx = np.arange(len(dates_ns), dtype=np.int64)
+        return idx + np.maximum.accumulate(earliest - idx)
+
+    def _entry_signal_mask(self, values: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of check_for_trade_entry() - True where a row carries an entry signal.
+        :param values: Array with the columns HEADERS[OPEN_IDX:ENTER_TAG_IDX]
+        """
+        enter_long = values[:, LONG_IDX - 1] == 1
+        exit_long = values[:, ELONG_IDX - 1] == 1
+        enter_short = (values[:, SHORT_IDX - 1] == 1) & self._can_short
+        exit_short = (values[:, ESHORT_IDX - 1] == 1) & self._can_short
+        return ((enter_long & ~(exit_long | enter_short))
+                | (enter_short & ~(exit_short | enter_long)))
+
     def _get_close_rate(self, row: Tuple, trade: LocalTrade, exit: ExitCheckTuple,
                         trade_dur: int) -> float:
         """
@@ -651,7 +894,7 @@ class Backtesting:
         # amount = amount or trade.amount
         amount = amount_to_contract_precision(amount or trade.amount, trade.amount_precision,
                                               self.precision_mode, trade.contract_size)
-        order = Order(
+        order = LocalOrder(
             id=self.order_id_counter,
             ft_trade_id=trade.id,
             order_date=exit_candle_time,
@@ -873,7 +1116,7 @@ class Backtesting:
                 is_short=is_short,
             ))
 
-            order = Order(
+            order = LocalOrder(
                 id=self.order_id_counter,
                 ft_trade_id=trade.id,
                 ft_is_open=True,
@@ -968,7 +1211,7 @@ class Backtesting:
         return False
 
     def check_order_cancel(
-            self, trade: LocalTrade, order: Order, current_time: datetime) -> Optional[bool]:
+            self, trade: LocalTrade, order: LocalOrder, current_time: datetime) -> Optional[bool]:
         """
         Check if current analyzed order has to be canceled.
         Returns True if the trade should be Deleted (initial order was canceled),
@@ -977,7 +1220,8 @@ class Backtesting:
         """
         timedout = self.strategy.ft_check_timed_out(
             trade,  # type: ignore[arg-type]
-            order, current_time)
+            order,  # type: ignore[arg-type]
+            current_time)
         if timedout:
             if order.side == trade.entry_side:
                 self.timedout_entry_orders += 1
@@ -997,7 +1241,7 @@ class Backtesting:
                 return False
         return None
 
-    def check_order_replace(self, trade: LocalTrade, order: Order, current_time,
+    def check_order_replace(self, trade: LocalTrade, order: LocalOrder, current_time,
                             row: Tuple) -> bool:
         """
         Check if current analyzed entry order has to be replaced and do so.
@@ -1010,7 +1254,8 @@ class Backtesting:
             requested_rate = strategy_safe_wrapper(self.strategy.adjust_entry_price,
                                                    default_retval=order.price)(
                 trade=trade,  # type: ignore[arg-type]
-                order=order, pair=trade.pair, current_time=current_time,
+                order=order,  # type: ignore[arg-type]
+                pair=trade.pair, current_time=current_time,
                 proposed_rate=row[OPEN_IDX], current_order_rate=order.price,
                 entry_tag=trade.enter_tag, side=trade.trade_direction
             )  # default value is current order price
@@ -1123,24 +1368,52 @@ class Backtesting:
                 self.run_protections(pair, current_time, trade.trade_direction)
         return open_trade_count_start
 
-    def backtest(self, processed: Dict,
-                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    def _process_pair_candle(self, pair: str, row: Tuple, current_time: datetime,
+                             end_date: datetime, open_trade_count_start: int) -> int:
         """
-        Implement backtesting functionality
+        Process one main-timeframe candle for one pair.
+        Spreads out into the detail timeframe if necessary.
+        """
+        trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
 
-        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
-        Of course try to not have ugly code. By some accessor are sometime slower than functions.
-        Avoid extensive logging in this method and functions it calls.
+        if (
+            (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
+            and self.timeframe_detail and pair in self.detail_data
+        ):
+            # Spread out into detail timeframe.
+            # Should only happen when we are either in a trade for this pair
+            # or when we got the signal for a new trade.
+            detail = self._detail_arrays.get(pair)
+            if detail is not None:
+                lower, upper = detail.get_offsets(row[DATE_IDX], self.timeframe_min * 60 * 10 ** 9)
+            if detail is None or lower == upper:
+                # Fall back to "regular" data if no detail data was found for this candle
+                return self.backtest_loop(
+                    row, pair, current_time, end_date,
+                    open_trade_count_start, trade_dir)
+            # Entry / exit signals and tags of the main candle apply to all detail candles
+            signals = tuple(row[LONG_IDX:])
+            is_first = True
+            current_time_det = current_time
+            for det_idx, det_values in enumerate(detail.values[lower:upper].tolist(), lower):
+                det_row = (detail.dates[det_idx], *det_values, *signals)
+                open_trade_count_start = self.backtest_loop(
+                    det_row, pair, current_time_det, end_date,
+                    open_trade_count_start, trade_dir, is_first)
+                current_time_det += timedelta(minutes=self.timeframe_detail_min)
+                is_first = False
+            return open_trade_count_start
+        else:
+            return self.backtest_loop(
+                row, pair, current_time, end_date,
+                open_trade_count_start, trade_dir)
 
-        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
-        optimize memory usage!
-        :param start_date: backtesting timerange start datetime
-        :param end_date: backtesting timerange end datetime
-        :return: DataFrame with trades (results of backtesting)
+    def _run_list_backtest(self, processed: Dict, start_date: datetime, end_date: datetime
+                           ) -> Dict[str, List[Tuple]]:
+        """
+        Default backtest engine - loops every candle of every pair.
+        :return: Dict of lists with data per pair
         """
-        self.prepare_backtest(self.enable_protections)
-        # Ensure wallets are uptodate (important for --strategy-list)
-        self.wallets.update()
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
         data: Dict = self._get_ohlcv_as_lists(processed)
@@ -1164,51 +1437,289 @@ class Backtesting:
                 row_index += 1
                 indexes[pair] = row_index
                 self.dataprovider._set_dataframe_max_index(row_index)
-                current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-                trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
-
-                if (
-                    (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
-                    and self.timeframe_detail and pair in self.detail_data
-                ):
-                    # Spread out into detail timeframe.
-                    # Should only happen when we are either in a trade for this pair
-                    # or when we got the signal for a new trade.
-                    exit_candle_end = current_detail_time + timedelta(minutes=self.timeframe_min)
-
-                    detail_data = self.detail_data[pair]
-                    detail_data = detail_data.loc[
-                        (detail_data['date'] >= current_detail_time) &
-                        (detail_data['date'] < exit_candle_end)
-                    ].copy()
-                    if len(detail_data) == 0:
-                        # Fall back to "regular" data if no detail data was found for this candle
-                        open_trade_count_start = self.backtest_loop(
-                            row, pair, current_time, end_date,
-                            open_trade_count_start, trade_dir)
-                        continue
-                    detail_data.loc[:, 'enter_long'] = row[LONG_IDX]
-                    detail_data.loc[:, 'exit_long'] = row[ELONG_IDX]
-                    detail_data.loc[:, 'enter_short'] = row[SHORT_IDX]
-                    detail_data.loc[:, 'exit_short'] = row[ESHORT_IDX]
-                    detail_data.loc[:, 'enter_tag'] = row[ENTER_TAG_IDX]
-                    detail_data.loc[:, 'exit_tag'] = row[EXIT_TAG_IDX]
-                    is_first = True
-                    current_time_det = current_time
-                    for det_row in detail_data[HEADERS].values.tolist():
-                        open_trade_count_start = self.backtest_loop(
-                            det_row, pair, current_time_det, end_date,
-                            open_trade_count_start, trade_dir, is_first)
-                        current_time_det += timedelta(minutes=self.timeframe_detail_min)
-                        is_first = False
-                else:
-                    open_trade_count_start = self.backtest_loop(
-                        row, pair, current_time, end_date,
-                        open_trade_count_start, trade_dir)
+                open_trade_count_start = self._process_pair_candle(
+                    pair, row, current_time, end_date, open_trade_count_start)
 
             # Move time one configured time_interval ahead.
             self.progress.increment()
             current_time += timedelta(minutes=self.timeframe_min)
+        return data
+
+    def _run_columnar_backtest(self, processed: Dict, start_date: datetime, end_date: datetime
+                               ) -> Dict[str, List[Tuple]]:
+        """
+        Columnar backtest engine.
+        Produces the same results as _run_list_backtest(), but only visits candles
+        which have an entry signal or belong to a pair with open trades.
+        Loop steps without either are skipped entirely.
+        If supported by the strategy (see _fast_exits_supported()), candles of open trades
+        are only visited once an exit may happen (see _find_exit_candidate()).
+        :return: Dict with the last row per pair (used to close left open trades)
+        """
+        data = self._get_ohlcv_as_arrays(processed, start_date)
+        pairs = list(data.keys())
+        pair_idx = {pair: idx for idx, pair in enumerate(pairs)}
+
+        timeframe_td = timedelta(minutes=self.timeframe_min)
+        max_steps = int((end_date - start_date) / timeframe_td)
+
+        # Masks of (step, pair) combinations which have a candle / an entry signal
+        has_row = np.zeros((max_steps, len(pairs)), dtype=bool)
+        has_entry = np.zeros((max_steps, len(pairs)), dtype=bool)
+        for idx, pair in enumerate(pairs):
+            steps = data[pair].steps
+            in_range = steps < max_steps
+            has_row[steps[in_range], idx] = True
+            has_entry[steps[in_range & data[pair].entries], idx] = True
+        entry_steps = np.flatnonzero(has_entry.any(axis=1))
+
+        # Register pairs in the order the loop engine first visits them,
+        # which defines the order left open trades are closed in.
+        for idx in sorted(np.flatnonzero(has_row.any(axis=0)).tolist(),
+                          key=lambda idx: (int(data[pairs[idx]].steps[0]), idx)):
+            LocalTrade.bt_trades_open_pp.setdefault(pairs[idx], [])
+
+        fast_exits = self._fast_exits_supported()
+        roi_table = self._get_roi_table()
+        # Open trades without exit check until the scheduled step.
+        # trade id -> (scheduled step, first row of the pair not checked yet)
+        scheduled: Dict[int, Tuple[int, int]] = {}
+
+        self.progress.init_step(BacktestState.BACKTEST, max_steps)
+        step = 0
+        while step < max_steps:
+            if len(scheduled) == LocalTrade.bt_open_open_trade_count:
+                # No trade needs a check - jump ahead to the next entry signal or scheduled check.
+                next_step = self._next_columnar_step(step, entry_steps, scheduled, max_steps)
+                if next_step > step:
+                    self._count_rejected_slots(
+                        has_row[step:next_step] & ~self._open_trade_mask(pair_idx),
+                        LocalTrade.bt_open_open_trade_count)
+                    step = next_step
+                    if step >= max_steps:
+                        break
+
+            current_time = start_date + timeframe_td * (step + 1)
+            open_trade_count_start = LocalTrade.bt_open_open_trade_count
+            self.check_abort()
+
+            active = (self._exit_check_mask(pair_idx, scheduled, step)
+                      | has_entry[step]) & has_row[step]
+            skipped = has_row[step] & ~self._open_trade_mask(pair_idx)
+
+            prev_idx = 0
+            for idx in np.flatnonzero(active).tolist():
+                self._count_rejected_slots(skipped[prev_idx:idx], open_trade_count_start)
+                prev_idx = idx + 1
+
+                pair = pairs[idx]
+                pair_data = data[pair]
+                row_index = int(np.searchsorted(pair_data.steps, step))
+                self._apply_scheduled_candles(pair, pair_data, scheduled, row_index)
+
+                self.dataprovider._set_dataframe_max_index(row_index + 1)
+                open_trade_count_start = self._process_pair_candle(
+                    pair, pair_data.get_row(row_index), current_time, end_date,
+                    open_trade_count_start)
+
+                if fast_exits:
+                    self._schedule_exit_checks(
+                        pair, pair_data, row_index + 1, max_steps, scheduled, roi_table)
+            self._count_rejected_slots(skipped[prev_idx:], open_trade_count_start)
+
+            step += 1
+            self.progress.set_new_value(step)
+
+        # Trades without further exit check still need the candles up to the end.
+        for pair in list(LocalTrade.bt_trades_open_pp):
+            self._apply_scheduled_candles(
+                pair, data[pair], scheduled, int(np.searchsorted(data[pair].steps, max_steps)))
+
+        # Leave the dataprovider in the same state as the loop engine would.
+        row_steps = np.flatnonzero(has_row.any(axis=1))
+        if len(row_steps) > 0:
+            last_pair = pairs[np.flatnonzero(has_row[row_steps[-1]])[-1]]
+            self.dataprovider._set_dataframe_max_index(
+                int(np.searchsorted(data[last_pair].steps, row_steps[-1])) + 1)
+        self.progress.set_new_value(max_steps)
+        return {pair: [pair_data.get_row(-1)] for pair, pair_data in data.items()
+                if len(pair_data.steps) > 0}
+
+    @staticmethod
+    def _next_columnar_step(step: int, entry_steps: np.ndarray,
+                            scheduled: Dict[int, Tuple[int, int]], max_steps: int) -> int:
+        """
+        Next step with either an entry signal or a scheduled exit check.
+        """
+        next_entry = np.searchsorted(entry_steps, step)
+        return min([int(entry_steps[next_entry]) if next_entry < len(entry_steps) else max_steps,
+                    *(sched[0] for sched in scheduled.values())])
+
+    def _schedule_exit_checks(self, pair: str, pair_data: PairArrays, start: int, max_steps: int,
+                              scheduled: Dict[int, Tuple[int, int]],
+                              roi_table: Tuple[np.ndarray, np.ndarray]) -> None:
+        """
+        Schedule the next exit check of all open trades of pair without open orders.
+        :param start: First row not checked yet
+        """
+        end = int(np.searchsorted(pair_data.steps, max_steps))
+        for trade in LocalTrade.bt_trades_open_pp[pair]:
+            if any(order.ft_is_open for order in trade.orders):
+                continue
+            candidate = self._find_exit_candidate(trade, pair_data, start, end, roi_table)
+            scheduled[trade.id] = (
+                int(pair_data.steps[candidate]) if candidate < end else max_steps, start)
+
+    def _open_trade_mask(self, pair_idx: Dict[str, int]) -> np.ndarray:
+        """
+        Pairs which can't enter a trade as they have an open trade (without position stacking).
+        """
+        mask = np.zeros(len(pair_idx), dtype=bool)
+        if not self._position_stacking:
+            for pair, trades in LocalTrade.bt_trades_open_pp.items():
+                mask[pair_idx[pair]] = len(trades) > 0
+        return mask
+
+    @staticmethod
+    def _exit_check_mask(pair_idx: Dict[str, int], scheduled: Dict[int, Tuple[int, int]],
+                         step: int) -> np.ndarray:
+        """
+        Pairs with open trades which have to be checked at step.
+        """
+        mask = np.zeros(len(pair_idx), dtype=bool)
+        for pair, trades in LocalTrade.bt_trades_open_pp.items():
+            mask[pair_idx[pair]] = any(
+                scheduled.get(trade.id, (step, ))[0] <= step for trade in trades)
+        return mask
+
+    def _count_rejected_slots(self, has_row: np.ndarray, open_trade_count: int) -> None:
+        """
+        Account for trade_slot_available() calls of skipped pairs in the columnar engine.
+        The loop engine checks the trade slot for every candle of a pair without open trade.
+        """
+        max_open_trades: IntOrInf = self.config['max_open_trades']
+        if 0 < max_open_trades <= open_trade_count:
+            self.rejected_trades += int(has_row.sum())
+
+    def _fast_exits_supported(self) -> bool:
+        """
+        Open trades only need to be checked on candles where they may exit if no callback
+        is called on every candle of an open trade - and the trade only depends on candle data.
+        """
+        return (self.trading_mode == TradingMode.SPOT
+                and not self.timeframe_detail
+                and not self.strategy.position_adjustment_enable
+                and not self.strategy.use_custom_stoploss
+                and not (self.strategy.use_exit_signal
+                         and (check_override(self.strategy, IStrategy, 'custom_exit')
+                              or check_override(self.strategy, IStrategy, 'custom_sell'))))
+
+    def _get_roi_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        minimal_roi as sorted arrays of minutes and ROI values.
+        """
+        roi = sorted(self.strategy.minimal_roi.items())
+        return (np.array([int(minutes) for minutes, _ in roi], dtype=np.int64),
+                np.array([value for _, value in roi], dtype=np.float64))
+
+    def _exit_candidate_mask(self, trade: LocalTrade, pair_data: PairArrays, start: int,
+                             end: int, roi_table: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """
+        Vectorized version of the checks in IStrategy.should_exit() for a spot trade without
+        open orders. True for rows where the trade may exit or its stoploss may move.
+        Rows which are False don't change the trade except for min_rate / max_rate.
+        """
+        values = pair_data.values[start:end]
+        high = values[:, HIGH_IDX - 1]
+        low = values[:, LOW_IDX - 1]
+        # Stoploss hit - also includes rows with invalid prices
+        mask = ~(low > trade.stop_loss) | ~(high > 0)
+        # Profit at high - approximated, so comparisons use a small tolerance
+        profit = high * (trade.amount * (1 - trade.fee_close)) / trade.open_trade_value - 1
+        tolerance = 1e-6
+
+        strategy = self.strategy
+        if strategy.trailing_stop:
+            # Stoploss may be moved up - same calculation as trade.adjust_stop_loss().
+            leverage = trade.leverage or 1.0
+            offset = strategy.trailing_stop_positive_offset
+            trailing = (profit >= offset - tolerance if strategy.trailing_only_offset_is_reached
+                        else np.ones(len(high), dtype=bool))
+            if strategy.trailing_stop_positive is not None:
+                mask |= (trailing & (profit > offset - tolerance)
+                         & (high * (1 - abs(strategy.trailing_stop_positive / leverage))
+                            > trade.stop_loss))
+                trailing = trailing & (profit <= offset + tolerance)
+            mask |= trailing & (high * (1 - abs(strategy.stoploss / leverage)) > trade.stop_loss)
+
+        roi_minutes, roi_values = roi_table
+        if len(roi_minutes) > 0:
+            open_ns = pd.Timestamp(trade.open_date_utc).value
+            duration = (pair_data.dates.asi8[start:end] - open_ns) // (60 * 10 ** 9)
+            roi_idx = np.searchsorted(roi_minutes, duration, side='right') - 1
+            mask |= (roi_idx >= 0) & (profit > roi_values[np.maximum(roi_idx, 0)] - tolerance)
+
+        if strategy.use_exit_signal:
+            mask |= (values[:, ELONG_IDX - 1] != 0) & (values[:, LONG_IDX - 1] == 0)
+        return mask
+
+    def _find_exit_candidate(self, trade: LocalTrade, pair_data: PairArrays, start: int,
+                             end: int, roi_table: Tuple[np.ndarray, np.ndarray]) -> int:
+        """
+        Find the first row in [start, end) the trade has to be checked at.
+        Scans in growing chunks, as most trades exit within a few candles.
+        :return: Row index - or end if the trade doesn't need another check.
+        """
+        size = 32
+        while start < end:
+            stop = min(start + size, end)
+            candidates = np.flatnonzero(
+                self._exit_candidate_mask(trade, pair_data, start, stop, roi_table))
+            if len(candidates) > 0:
+                return start + int(candidates[0])
+            start = stop
+            size *= 4
+        return end
+
+    @staticmethod
+    def _apply_scheduled_candles(pair: str, pair_data: PairArrays,
+                                 scheduled: Dict[int, Tuple[int, int]], end: int) -> None:
+        """
+        Update min_rate / max_rate of scheduled trades of pair with the candles skipped
+        up to (excluding) row end, and remove them from scheduled.
+        """
+        for trade in LocalTrade.bt_trades_open_pp[pair]:
+            if trade.id not in scheduled:
+                continue
+            start = scheduled.pop(trade.id)[1]
+            if start < end:
+                values = pair_data.values[start:end]
+                trade.adjust_min_max_rates(float(values[:, HIGH_IDX - 1].max()),
+                                           float(values[:, LOW_IDX - 1].min()))
+
+    def backtest(self, processed: Dict,
+                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """
+        Implement backtesting functionality
+
+        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
+        Of course try to not have ugly code. By some accessor are sometime slower than functions.
+        Avoid extensive logging in this method and functions it calls.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :return: DataFrame with trades (results of backtesting)
+        """
+        self.prepare_backtest(self.enable_protections)
+        # Ensure wallets are uptodate (important for --strategy-list)
+        self.wallets.update()
+
+        if self.backtest_engine == 'columnar':
+            data = self._run_columnar_backtest(processed, start_date, end_date)
+        else:
+            data = self._run_list_backtest(processed, start_date, end_date)
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
@@ -1227,6 +1738,28 @@ class Backtesting:
             'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
         }
 
+    def _advise_all_indicators(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs.
+        Strategies of --strategy-list with identical indicators share the analyzed dataframes.
+        """
+        if self.indicator_cache is not None:
+            return self.indicator_cache.advise_all_indicators(
+                self.strategy, data, self._analyze_indicators)
+        return self._analyze_indicators(data)
+
+    def _analyze_indicators(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        With --analysis-cache, analyzed dataframes of unchanged candles are loaded from disk.
+        """
+        if (not self.config.get('analysis_cache', False)
+                or self.config.get('freqai', {}).get('enabled', False)):
+            return self.strategy.advise_all_indicators(data)
+        cache = AnalyzedDataCache(
+            self.config['user_data_dir'] / 'backtest_results' / 'analysis_cache',
+            get_strategy_analysis_id(self.strategy))
+        return cache.advise_all_indicators(self.strategy, data)
+
     def backtest_one_strategy(self, strat: IStrategy, data: Dict[str, DataFrame],
                               timerange: TimeRange):
         self.progress.init_step(BacktestState.ANALYZE, 0)
@@ -1243,7 +1776,9 @@ class Backtesting:
             self.config.update({'max_open_trades': self.strategy.max_open_trades})
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self._advise_all_indicators(data)
+        if self.indicator_cache is not None:
+            self.indicator_cache.release(strat)
 
         # Trim startup period from analyzed dataframe
         preprocessed_tmp = trim_dataframes(preprocessed, timerange, self.required_startup)
@@ -1278,6 +1813,61 @@ class Backtesting:
 
         return min_date, max_date
 
+    def release_exchange(self) -> None:
+        """
+        Drops all unpicklable parts of the exchange, so this instance can be sent to
+        worker processes. The exchange can't be used to call the exchange API afterwards.
+        """
+        self.exchange.close()
+        self.exchange._api = None
+        self.exchange._api_async = None
+        self.exchange.loop = None  # type: ignore
+        self.exchange._loop_lock = None  # type: ignore
+        self.exchange._cache_lock = None  # type: ignore
+        self.pairlists = None  # type: ignore
+
+    @staticmethod
+    def _register_strategy_modules(bases) -> None:
+        """
+        Pickle the modules of strategy base classes by value,
+        so workers can load strategies which inherit from classes in other files.
+        """
+        for base in bases:
+            if base.__name__ != 'IStrategy':
+                cloudpickle.register_pickle_by_value(sys.modules[base.__module__])
+                Backtesting._register_strategy_modules(base.__bases__)
+
+    def backtest_strategies_parallel(self, strategies: List[IStrategy],
+                                     data: Dict[str, DataFrame], timerange: TimeRange,
+                                     jobs: int) -> Tuple[datetime, datetime]:
+        """
+        Backtest strategies in worker processes.
+        Shared indicators are calculated in this process first - once per group of strategies
+        with identical indicators - so workers only run entry / exit functions and the
+        backtest itself. Indicators of all other strategies are calculated by the workers.
+        :return: min_date and max_date of the backtested data
+        """
+        for strat in strategies:
+            if self.indicator_cache is not None and self.indicator_cache.is_shared(strat):
+                self._set_strategy(strat)
+                self._advise_all_indicators(data)
+            self._register_strategy_modules(strat.__class__.__bases__)
+
+        logger.info(f'Backtesting {len(strategies)} strategies using {jobs} processes.')
+        self.release_exchange()
+        executor = get_reusable_executor(
+            max_workers=jobs,
+            initializer=_init_backtesting_worker,
+            initargs=(cloudpickle.dumps((self, data, timerange)),),
+        )
+        indexes = [self.strategylist.index(strat) for strat in strategies]
+        for name, results, signal_candles, min_date, max_date in executor.map(
+                _backtest_strategy, indexes):
+            self.all_results[name] = results
+            if signal_candles is not None:
+                self.processed_dfs[name] = signal_candles
+        return min_date, max_date
+
     def _generate_trade_signal_candles(self, preprocessed_df, bt_results):
         signal_candles_only = {}
         for pair in preprocessed_df.keys():
@@ -1336,12 +1926,30 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results['strategy']:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f'Reusing result of previous backtest for {strat.get_strategy_name()}')
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        if len(strategies) > 1 and not self.config.get('freqai', {}).get('enabled', False):
+            # populate_indicators may not run for strategies loaded from the analysis cache,
+            # so parameters read by it can't be tracked.
+            self.indicator_cache = IndicatorCache(
+                strategies, track_parameters=not self.config.get('analysis_cache', False))
+            jobs = min(effective_n_jobs(self.config.get('strategy_jobs', 1)), len(strategies))
+        else:
+            jobs = 1
+
+        if jobs > 1:
+            min_date, max_date = self.backtest_strategies_parallel(
+                strategies, data, timerange, jobs)
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+        self.indicator_cache = None
 
         # Update old results with new ones.
         if len(self.all_results) > 0:
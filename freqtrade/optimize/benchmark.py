@@ -0,0 +1,267 @@
+# pragma pylint: disable=missing-docstring, W0212, too-many-arguments
+
+"""
+This module contains the benchmark class.
+Measures the throughput of backtesting, hyperopt and live-loop hot paths on
+deterministic, synthetic candles - so results are comparable between runs and versions.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import rapidjson
+from pandas import DataFrame
+from tabulate import tabulate
+
+from freqtrade import __version__
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import BACKTEST_ENGINE_DEFAULT, BACKTEST_ENGINES, Config
+from freqtrade.data import history
+from freqtrade.data.converter import ohlcv_to_dataframe, trim_dataframes
+from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import timeframe_to_msecs
+from freqtrade.exchange.kline_store import KlineStore
+from freqtrade.misc import file_dump_json
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.persistence import LocalTrade
+
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+BENCHMARK_SEED = 42
+
+
+def generate_benchmark_candles(pair_index: int, candles: int, timeframe: str) -> List[List]:
+    """
+    Generate deterministic candles (a random walk) in the format returned by
+    ccxt.fetch_ohlcv - the same pair_index always results in the same candles.
+    :param pair_index: Index of the pair - used to seed the random generator
+    :param candles: Number of candles to generate
+    :param timeframe: Timeframe of the candles
+    :return: List of [timestamp (ms), open, high, low, close, volume]
+    """
+    rng = np.random.default_rng(BENCHMARK_SEED + pair_index)
+    tf_ms = timeframe_to_msecs(timeframe)
+    start_ms = int(BENCHMARK_START.timestamp() * 1000)
+    dates = start_ms + np.arange(candles, dtype=np.int64) * tf_ms
+
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, candles)))
+    open_ = np.concatenate([[100.0], close[:-1]])
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, candles)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, candles)))
+    volume = rng.uniform(100, 10000, candles)
+    return [[int(date), *values] for date, values in zip(
+        dates, np.column_stack([open_, high, low, close, volume]).tolist())]
+
+
+class Benchmark:
+    """
+    Benchmark class, measures the throughput of the hot paths of freqtrade.
+
+    To run a benchmark:
+    benchmark = Benchmark(config)
+    benchmark.start()
+    """
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.repeats: int = config.get('benchmark_repeats', 3)
+        self.candles: int = config.get('benchmark_candles', 10000)
+
+        self.backtesting = Backtesting(config)
+        self.strategy = self.backtesting.strategylist[0]
+        self.backtesting._set_strategy(self.strategy)
+        # Use all generated candles
+        self.backtesting.timerange = TimeRange()
+        self.timeframe = self.backtesting.timeframe
+
+        whitelist = self.backtesting.pairlists.whitelist
+        self.pairs = whitelist[:config.get('benchmark_pairs', 10)]
+        if len(self.pairs) < config.get('benchmark_pairs', 10):
+            logger.warning(f"Only {len(self.pairs)} pairs in whitelist, "
+                           f"benchmarking with {len(self.pairs)} pairs.")
+        if self.candles <= self.backtesting.required_startup:
+            raise OperationalException(
+                f"Benchmark requires more than {self.backtesting.required_startup} candles "
+                "(startup_candle_count of the strategy).")
+
+        self.results: List[Dict[str, Any]] = []
+
+    def _measure(self, name: str, func: Callable[[], Any], items: int, unit: str) -> None:
+        """
+        Run func `repeats` times and record the fastest run.
+        :param name: Name of the benchmark
+        :param func: Function to measure
+        :param items: Number of items processed by one call of func
+        :param unit: Unit of items (e.g. candles)
+        """
+        durations = []
+        for _ in range(self.repeats):
+            start = perf_counter()
+            func()
+            durations.append(perf_counter() - start)
+        seconds = min(durations)
+        self.results.append({
+            'name': name,
+            'seconds': seconds,
+            'repeats': self.repeats,
+            'items': items,
+            'unit': unit,
+            'throughput': items / seconds if seconds > 0 else 0.0,
+        })
+        logger.info(f"Benchmark {name}: {seconds:.4f}s for {items} {unit}.")
+
+    def _benchmark_profit_calculation(self) -> None:
+        trade = LocalTrade(
+            pair=self.pairs[0],
+            open_rate=100.0,
+            amount=10.0,
+            stake_amount=1000.0,
+            fee_open=self.backtesting.fee,
+            fee_close=self.backtesting.fee,
+            open_date=BENCHMARK_START,
+            exchange=self.config['exchange']['name'],
+            is_short=False,
+            leverage=1.0,
+            trading_mode=self.backtesting.trading_mode,
+        )
+        rates = (100 + np.sin(np.arange(self.candles)) * 5).tolist()
+
+        def calculate() -> None:
+            for rate in rates:
+                trade.calc_profit_ratio(rate)
+
+        self._measure('calc_profit_ratio', calculate, len(rates), 'calls')
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Run all benchmarks.
+        :return: List with one result per benchmark
+        """
+        self.results = []
+        total = self.candles * len(self.pairs)
+        raw = {pair: generate_benchmark_candles(idx, self.candles, self.timeframe)
+               for idx, pair in enumerate(self.pairs)}
+
+        data: Dict[str, DataFrame] = {}
+
+        def convert() -> None:
+            for pair, ohlcv in raw.items():
+                data[pair] = ohlcv_to_dataframe(ohlcv, self.timeframe, pair,
+                                                fill_missing=True, drop_incomplete=False)
+
+        self._measure('ohlcv_to_dataframe', convert, total, 'candles')
+
+        # Live refresh - merge the last 2 candles, one new candle per refresh.
+        refresh_start = max(self.candles - 100, 0)
+        refreshes = self.candles - refresh_start - 1
+
+        def refresh() -> None:
+            store = KlineStore()
+            for pair, df in data.items():
+                key = (pair, self.timeframe, self.config['candle_type_def'])
+                store[key] = df.iloc[:refresh_start + 1].reset_index(drop=True)
+                for idx in range(refresh_start, refresh_start + refreshes):
+                    store.merge_candles(key, df.iloc[idx:idx + 2].reset_index(drop=True),
+                                        self.candles)
+
+        self._measure('refresh_candles', refresh, refreshes * len(data), 'refreshes')
+
+        self._measure(
+            'analyze_ticker',
+            lambda: [self.strategy.analyze_ticker(df.copy(), {'pair': pair})
+                     for pair, df in data.items()],
+            total, 'candles')
+
+        preprocessed: Dict[str, DataFrame] = {}
+
+        def populate() -> None:
+            preprocessed.update(self.strategy.advise_all_indicators(data))
+
+        self._measure('advise_all_indicators', populate, total, 'candles')
+
+        self._measure(
+            '_get_ohlcv_as_lists',
+            lambda: self.backtesting._get_ohlcv_as_lists(dict(preprocessed)),
+            total, 'candles')
+
+        preprocessed_tmp = trim_dataframes(preprocessed, self.backtesting.timerange,
+                                           self.backtesting.required_startup)
+        min_date, max_date = history.get_timerange(preprocessed_tmp)
+        backtested_candles = int((max_date - min_date) / timedelta(
+            milliseconds=timeframe_to_msecs(self.timeframe))) * len(preprocessed_tmp)
+
+        for engine in BACKTEST_ENGINES:
+            self.backtesting.backtest_engine = engine
+            self._measure(
+                f'backtest[{engine}]',
+                lambda: self.backtesting.backtest(dict(preprocessed), min_date, max_date),
+                backtested_candles, 'candles')
+        self.backtesting.backtest_engine = self.config.get(
+            'backtest_engine', BACKTEST_ENGINE_DEFAULT)
+
+        self._benchmark_profit_calculation()
+        return self.results
+
+    @staticmethod
+    def load_previous_results(directory: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load the most recent benchmark results from directory.
+        :return: Benchmark results, or None if no prior benchmark results exist.
+        """
+        files = sorted(directory.glob('benchmark-*.json'))
+        if not files:
+            return None
+        with files[-1].open('r') as file:
+            return rapidjson.load(file)
+
+    def results_to_table(self, previous: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Format results as table.
+        :param previous: Prior results - adds the change in throughput.
+        """
+        prior = {res['name']: res for res in previous['results']} if previous else {}
+        headers = ['Benchmark', 'Seconds', 'Items', 'Throughput (items/s)']
+        if previous:
+            headers.append('Change')
+        rows = []
+        for res in self.results:
+            row = [res['name'], f"{res['seconds']:.4f}", f"{res['items']} {res['unit']}",
+                   f"{res['throughput']:,.0f}"]
+            if previous:
+                old = prior.get(res['name'], {}).get('throughput')
+                row.append(f"{res['throughput'] / old - 1:+.1%}" if old else '')
+            rows.append(row)
+        return tabulate(rows, headers=headers, tablefmt='orgtbl', stralign='right')
+
+    def start(self) -> None:
+        """
+        Run all benchmarks, show the results and store them as json in
+        user_data/benchmark_results.
+        """
+        logger.info(f"Benchmarking {self.strategy.get_strategy_name()} with "
+                    f"{len(self.pairs)} pairs and {self.candles} candles per pair.")
+        self.run()
+
+        directory = Path(self.config['user_data_dir']) / 'benchmark_results'
+        directory.mkdir(parents=True, exist_ok=True)
+        previous = self.load_previous_results(directory)
+
+        print(self.results_to_table(previous))
+
+        now = datetime.now(timezone.utc)
+        filename = directory / f"benchmark-{now.strftime('%Y-%m-%d_%H-%M-%S')}.json"
+        file_dump_json(filename, {
+            'freqtrade_version': __version__,
+            'timestamp': int(now.timestamp()),
+            'strategy': self.strategy.get_strategy_name(),
+            'timeframe': self.timeframe,
+            'pairs': len(self.pairs),
+            'candles': self.candles,
+            'repeats': self.repeats,
+            'results': self.results,
+        })
@@ -17,8 +17,9 @@ import progressbar
 import rapidjson
 from colorama import Fore, Style
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import cpu_count, dump, effective_n_jobs, load
 from joblib.externals import cloudpickle
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame
 
 from freqtrade.constants import DATETIME_PRINT_FORMAT, FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
@@ -31,10 +32,13 @@ from freqtrade.misc import deep_merge_dicts, file_dump_json, plural
 from freqtrade.optimize.backtesting import Backtesting
 # Import IHyperOpt and IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt_data_store import (dump_mmap_dataframes, load_mmap_dataframes,
+                                                    remove_mmap_dataframes)
 from freqtrade.optimize.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import (HyperoptStateContainer, HyperoptTools,
                                                hyperopt_serializer)
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.signal_cache import SignalCache
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 
 
@@ -57,6 +61,27 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Hyperopt instance of the current worker process - set once by _init_hyperopt_worker().
+_worker_hyperopt: Optional['Hyperopt'] = None
+
+
+def _init_hyperopt_worker(hyperopt_pickle: bytes) -> None:
+    """
+    Initializer for the hyperopt worker processes.
+    Unpickles the Hyperopt instance (with Backtesting and strategy) once per worker process.
+    """
+    global _worker_hyperopt
+    _worker_hyperopt = cloudpickle.loads(hyperopt_pickle)
+
+
+def _run_hyperopt_epoch(raw_params: List[Any]) -> Dict[str, Any]:
+    """
+    Evaluate one epoch in a worker process. Only the parameters are sent to the worker.
+    """
+    if _worker_hyperopt is None:
+        raise OperationalException('Hyperopt worker has not been initialized.')
+    return _worker_hyperopt.generate_optimizer(raw_params)
+
 
 class Hyperopt:
     """
@@ -85,6 +110,8 @@ class Hyperopt:
         self.pairlist = self.backtesting.pairlists.whitelist
         self.custom_hyperopt: HyperOptAuto
         self.analyze_per_epoch = self.config.get('analyze_per_epoch', False)
+        if self.config.get('hyperopt_signal_cache') and not self.analyze_per_epoch:
+            self.backtesting.signal_cache = SignalCache(self.config['hyperopt_signal_cache'])
         HyperoptStateContainer.set_state(HyperoptState.STARTUP)
 
         if not self.config.get('hyperopt'):
@@ -107,6 +134,9 @@ class Hyperopt:
                                    f'strategy_{strategy}_{time_now}.fthypt')
         self.data_pickle_file = (self.config['user_data_dir'] /
                                  'hyperopt_results' / 'hyperopt_tickerdata.pkl')
+        self.mmap_data = self.config.get('hyperopt_mmap_data', False)
+        self.data_mmap_dir = (self.config['user_data_dir'] /
+                              'hyperopt_results' / 'hyperopt_tickerdata')
         self.total_epochs = config.get('epochs', 0)
 
         self.current_best_loss = 100
@@ -132,6 +162,14 @@ class Hyperopt:
         self.print_colorized = self.config.get('print_colorized', False)
         self.print_json = self.config.get('print_json', False)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        The optimizer is only used by the main process - don't send it to the worker processes.
+        """
+        state = self.__dict__.copy()
+        state.pop('opt', None)
+        return state
+
     @staticmethod
     def get_lock_filename(config: Config) -> str:
 
@@ -146,6 +184,7 @@ class Hyperopt:
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
+        remove_mmap_dataframes(self.data_mmap_dir)
 
     def hyperopt_pickle_magic(self, bases) -> None:
         """
@@ -353,11 +392,10 @@ class Hyperopt:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        processed = self._load_hyperopt_data()
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
 
         bt_results = self.backtesting.backtest(
             processed=processed,
@@ -434,11 +472,31 @@ class Hyperopt:
             model_queue_size=SKOPT_MODEL_QUEUE_SIZE,
         )
 
-    def run_optimizer_parallel(
-            self, parallel: Parallel, asked: List[List]) -> List[Dict[str, Any]]:
+    def release_exchange(self) -> None:
+        """
+        We don't need exchange instance anymore while running hyperopt.
+        Drops all unpicklable parts, so the instance can be sent to the worker processes.
+        """
+        self.backtesting.release_exchange()
+
+    def get_worker_pool(self, jobs: int):
+        """
+        Start (or reuse) the pool of worker processes.
+        The Hyperopt instance is pickled once and unpickled once per worker process,
+        so every epoch only needs to transfer the parameters to evaluate.
+        """
+        return get_reusable_executor(
+            max_workers=jobs,
+            initializer=_init_hyperopt_worker,
+            initargs=(cloudpickle.dumps(self),),
+        )
+
+    def run_optimizer_parallel(self, pool, asked: List[List]) -> List[Dict[str, Any]]:
         """ Start optimizer in a parallel way """
-        return parallel(delayed(
-                        wrap_non_picklable_objects(self.generate_optimizer))(v) for v in asked)
+        if pool is None:
+            # Single job - evaluate in the main process.
+            return [self.generate_optimizer(v) for v in asked]
+        return list(pool.map(_run_hyperopt_epoch, asked))
 
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
@@ -471,10 +529,29 @@ class Hyperopt:
                         f'up to {self.max_date.strftime(DATETIME_PRINT_FORMAT)} '
                         f'({(self.max_date - self.min_date).days} days)..')
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self._dump_hyperopt_data(preprocessed)
+        else:
+            self._dump_hyperopt_data(data)
+
+    def _dump_hyperopt_data(self, data: Dict[str, DataFrame]) -> None:
+        """
+        Store data for the hyperopt worker processes.
+        """
+        if self.mmap_data:
+            dump_mmap_dataframes(data, self.data_mmap_dir)
         else:
             dump(data, self.data_pickle_file)
 
+    def _load_hyperopt_data(self) -> Dict[str, DataFrame]:
+        """
+        Load data stored by _dump_hyperopt_data().
+        Memory-mapped data is shared between all worker processes.
+        """
+        if self.mmap_data:
+            return load_mmap_dataframes(self.data_mmap_dir)
+        with self.data_pickle_file.open('rb') as f:
+            return load(f, mmap_mode='r')
+
     def get_asked_points(self, n_points: int) -> Tuple[List[List[Any]], List[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
@@ -576,15 +653,7 @@ class Hyperopt:
 
         self.prepare_hyperopt_data()
 
-        # We don't need exchange instance anymore while running hyperopt
-        self.backtesting.exchange.close()
-        self.backtesting.exchange._api = None
-        self.backtesting.exchange._api_async = None
-        self.backtesting.exchange.loop = None  # type: ignore
-        self.backtesting.exchange._loop_lock = None  # type: ignore
-        self.backtesting.exchange._cache_lock = None  # type: ignore
-        # self.backtesting.exchange = None  # type: ignore
-        self.backtesting.pairlists = None  # type: ignore
+        self.release_exchange()
 
         cpus = cpu_count()
         logger.info(f"Found {cpus} CPU cores. Let's make them scream!")
@@ -596,51 +665,58 @@ class Hyperopt:
         if self.print_colorized:
             colorama_init(autoreset=True)
 
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f'Effective number of parallel workers used: {jobs}')
+        pool = None
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f'Effective number of parallel workers used: {jobs}')
-
-                # Define progressbar
-                widgets = self.get_progressbar_widgets()
-                with progressbar.ProgressBar(
-                    max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
-                    widgets=widgets
-                ) as pbar:
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(n_points=1)
-                        f_val0 = self.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0['loss']])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        # Calculate progressbar outputs
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-
-                            pbar.update(current)
+            # Define progressbar
+            widgets = self.get_progressbar_widgets()
+            with progressbar.ProgressBar(
+                max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
+                widgets=widgets
+            ) as pbar:
+                start = 0
+
+                if self.analyze_per_epoch:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(n_points=1)
+                    f_val0 = self.generate_optimizer(asked[0])
+                    self.opt.tell(asked, [f_val0['loss']])
+                    self.evaluate_result(f_val0, 1, is_random[0])
+                    pbar.update(1)
+                    start += 1
+
+                if jobs > 1:
+                    # Workers are started after the first analysis,
+                    # so they receive the filled informative cache.
+                    pool = self.get_worker_pool(jobs)
+
+                evals = ceil((self.total_epochs - start) / jobs)
+                for i in range(evals):
+                    # Correct the number of epochs to be processed for the last
+                    # iteration (should not exceed self.total_epochs in total)
+                    n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                    current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                    asked, is_random = self.get_asked_points(n_points=current_jobs)
+                    f_val = self.run_optimizer_parallel(pool, asked)
+                    self.opt.tell(asked, [v['loss'] for v in f_val])
+
+                    # Calculate progressbar outputs
+                    for j, val in enumerate(f_val):
+                        # Use human-friendly indexes here (starting from 1)
+                        current = i * jobs + j + 1 + start
+
+                        self.evaluate_result(val, current, is_random[j])
+
+                        pbar.update(current)
 
         except KeyboardInterrupt:
             print('User interrupted..')
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, kill_workers=True)
 
         logger.info(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
                     f"saved to '{self.results_file}'.")
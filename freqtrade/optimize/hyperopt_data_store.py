@@ -0,0 +1,102 @@
+"""
+Memory-mapped storage of preprocessed hyperopt data.
+
+Numeric columns are written as .npy files, which every hyperopt worker process
+maps into memory instead of unpickling a private copy of the whole dataset.
+"""
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import dump, load
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILENAME = 'metadata.pkl'
+
+
+def _split_columns(df: DataFrame) -> Tuple[Dict[np.dtype, List[str]], List[str]]:
+    """
+    Group numeric columns by dtype. All other columns (dates, tags, ...) are returned separately.
+    """
+    groups: Dict[np.dtype, List[str]] = {}
+    other: List[str] = []
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, np.dtype) and pd.api.types.is_numeric_dtype(dtype):
+            groups.setdefault(dtype, []).append(col)
+        else:
+            other.append(col)
+    return groups, other
+
+
+def dump_mmap_dataframes(data: Dict[str, DataFrame], directory: Path) -> None:
+    """
+    Store dataframes in a format which can be memory-mapped by load_mmap_dataframes().
+    Numeric columns are stored as one .npy file per pair and dtype, using the
+    (columns x rows) layout pandas uses internally, so loading them doesn't require a copy.
+    All remaining columns are pickled alongside the metadata.
+    :param data: Dict of dataframes (usually with populated indicators)
+    :param directory: Target directory - will be removed if it exists.
+    """
+    remove_mmap_dataframes(directory)
+    directory.mkdir(parents=True)
+    metadata: Dict[str, Dict[str, Any]] = {}
+
+    for pair_idx, (pair, df) in enumerate(data.items()):
+        groups, other = _split_columns(df)
+        if df.empty:
+            # Zero-sized files cannot be memory-mapped
+            groups, other = {}, list(df.columns)
+
+        files = []
+        for group_idx, (dtype, columns) in enumerate(groups.items()):
+            filename = f'{pair_idx}_{group_idx}.npy'
+            values = np.lib.format.open_memmap(
+                directory / filename, mode='w+', dtype=dtype, shape=(len(columns), len(df)))
+            values[:] = df[columns].to_numpy(dtype=dtype).T
+            values.flush()
+            del values
+            files.append((filename, columns))
+
+        metadata[pair] = {
+            'files': files,
+            'other': df[other],
+        }
+    dump(metadata, directory / METADATA_FILENAME)
+    logger.debug(f"Stored memory-mappable data for {len(metadata)} pairs in {directory}.")
+
+
+def load_mmap_dataframes(directory: Path) -> Dict[str, DataFrame]:
+    """
+    Load dataframes stored by dump_mmap_dataframes().
+    Numeric columns are copy-on-write views on the memory-mapped files - so all processes
+    loading the same store share the underlying memory.
+    Modifications (e.g. adding signal columns) stay private to the calling process.
+    Columns are grouped by dtype - with non-numeric columns (e.g. date) first.
+    :param directory: Directory the data was stored to.
+    :return: Dict of dataframes
+    """
+    metadata = load(directory / METADATA_FILENAME)
+    data: Dict[str, DataFrame] = {}
+    for pair, pair_meta in metadata.items():
+        other: DataFrame = pair_meta['other']
+        frames = [other]
+        for filename, columns in pair_meta['files']:
+            values = np.load(directory / filename, mmap_mode='c')
+            frames.append(DataFrame(values.T, columns=columns, index=other.index, copy=False))
+        data[pair] = pd.concat(frames, axis=1, copy=False) if len(frames) > 1 else other
+    return data
+
+
+def remove_mmap_dataframes(directory: Path) -> None:
+    """
+    Remove a store created by dump_mmap_dataframes().
+    """
+    if directory.is_dir():
+        logger.info(f"Removing `{directory}`.")
+        shutil.rmtree(directory)
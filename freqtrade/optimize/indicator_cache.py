@@ -0,0 +1,215 @@
+"""
+Shares indicators between the strategies of one --strategy-list backtest.
+
+Strategy variants often only differ in their entry / exit logic, roi or stoploss -
+so populate_indicators only needs to run once for all of them.
+"""
+import inspect
+import logging
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from pandas import DataFrame
+
+from freqtrade.optimize.backtest_caching import ANALYSIS_NOT_IMPORTANT_KEYS, get_config_digest
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import BaseParameter
+
+
+logger = logging.getLogger(__name__)
+
+# Strategy attributes which only influence trade simulation.
+# StrategyResolver copies most of them to the configuration as well.
+SIMULATION_ATTRIBUTES = (
+    'minimal_roi', 'stoploss', 'trailing_stop', 'trailing_stop_positive',
+    'trailing_stop_positive_offset', 'trailing_only_offset_is_reached', 'use_custom_stoploss',
+    'process_only_new_candles', 'order_types', 'order_time_in_force', 'stake_amount',
+    'protections', 'startup_candle_count', 'lookback_candle_count', 'unfilledtimeout',
+    'use_exit_signal', 'exit_profit_only', 'ignore_roi_if_entry_signal', 'exit_profit_offset',
+    'disable_dataframe_checks', 'ignore_buying_expired_candle_after',
+    'position_adjustment_enable', 'max_entry_position_adjustment', 'max_open_trades',
+    'plot_config', 'INTERFACE_VERSION',
+)
+
+# Parameter values are compared by IndicatorCache.
+PARAMETER_ATTRIBUTES = ('buy_params', 'sell_params', 'protection_params')
+
+# Options that have no impact on populate_indicators of a strategy within one backtest run.
+INDICATORS_NOT_IMPORTANT_KEYS = (
+    ANALYSIS_NOT_IMPORTANT_KEYS + ('strategy', 'strategy_path') + SIMULATION_ATTRIBUTES)
+
+# IStrategy methods which can influence the analyzed dataframe when overridden.
+INDICATOR_METHODS = (
+    '__init__', 'bot_start', 'informative_pairs', 'populate_indicators',
+    'advise_indicators', 'advise_all_indicators',
+)
+
+
+def _code_names(code: CodeType) -> Set[str]:
+    """Names of globals used by code - including nested functions and comprehensions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names.update(_code_names(const))
+    return names
+
+
+def _hash_function(digest, func: Callable, seen: Set[int]) -> None:
+    """
+    Hash the source of func, and of all module level functions, classes and values it uses -
+    so identical code in different strategy files results in an identical hash.
+    """
+    func = inspect.unwrap(func)
+    if id(func) in seen:
+        return
+    seen.add(id(func))
+    digest.update(inspect.getsource(func).encode('utf-8'))
+    func_globals = getattr(func, '__globals__', {})
+    code = getattr(func, '__code__', None)
+    for name in sorted(_code_names(code) if code else ()):
+        if name not in func_globals:
+            continue
+        value = func_globals[name]
+        if inspect.ismodule(value):
+            digest.update(f'{name}={value.__name__}'.encode('utf-8'))
+        elif inspect.isfunction(value):
+            _hash_function(digest, value, seen)
+        elif inspect.isclass(value):
+            if value.__module__ == func.__module__:
+                digest.update(inspect.getsource(value).encode('utf-8'))
+            else:
+                digest.update(f'{name}={value.__module__}.{value.__qualname__}'.encode('utf-8'))
+        else:
+            digest.update(f'{name}={value!r}'.encode('utf-8'))
+
+
+def get_strategy_indicator_id(strategy: IStrategy) -> Optional[str]:
+    """
+    Generate identification hash for populate_indicators of a strategy.
+    Unlike get_strategy_analysis_id(), only code which may calculate indicators is hashed
+    (not the whole strategy file) - so variants which only differ in entry / exit logic,
+    roi, stoploss or other trade simulation settings result in identical hashes.
+    Parameter values are not part of this hash.
+    :param strategy: strategy object.
+    :return: hex string id, or None if the source of the strategy is not available.
+    """
+    digest = get_config_digest(strategy.config, INDICATORS_NOT_IMPORTANT_KEYS)
+    seen: Set[int] = set()
+    try:
+        for cls in type(strategy).__mro__:
+            if cls is IStrategy or not issubclass(cls, IStrategy):
+                break
+            for name, value in sorted(vars(cls).items()):
+                # Unwrap staticmethods, classmethods and properties
+                value = getattr(value, '__func__', getattr(value, 'fget', value))
+                if inspect.isfunction(value):
+                    if name in INDICATOR_METHODS or not hasattr(IStrategy, name):
+                        digest.update(name.encode('utf-8'))
+                        _hash_function(digest, value, seen)
+                elif not (name.startswith('_') or name in SIMULATION_ATTRIBUTES
+                          or name in PARAMETER_ATTRIBUTES or inspect.isclass(value)
+                          or isinstance(value, BaseParameter)):
+                    digest.update(f'{name}={value!r}'.encode('utf-8'))
+    except (OSError, TypeError):
+        # Source is not available (e.g. for classes created at runtime).
+        return None
+    return digest.hexdigest().lower()
+
+
+class IndicatorCache:
+    """
+    Keeps analyzed dataframes of a --strategy-list backtest in memory.
+
+    A strategy reuses the dataframes of a prior strategy with identical indicator id
+    (see get_strategy_indicator_id()) if all parameters read by populate_indicators
+    of the prior strategy have identical values.
+    Dataframes are dropped once all strategies with this indicator id have been analyzed.
+    """
+
+    def __init__(self, strategies: List[IStrategy], track_parameters: bool = True) -> None:
+        """
+        :param strategies: Strategies which will be analyzed
+        :param track_parameters: Only compare parameters read by populate_indicators.
+            If False, all parameter values must be identical - required if populate_indicators
+            may not run, e.g. when indicators are loaded from the analysis cache.
+        """
+        self._track_parameters = track_parameters
+        self._ids: Dict[str, str] = {}
+        self._users: Dict[str, int] = {}
+        self._entries: Dict[str, List[Tuple[Dict[str, Any], Dict[str, DataFrame]]]] = {}
+        for strategy in strategies:
+            indicator_id = get_strategy_indicator_id(strategy)
+            if indicator_id is not None:
+                self._ids[strategy.get_strategy_name()] = indicator_id
+                self._users[indicator_id] = self._users.get(indicator_id, 0) + 1
+
+    @staticmethod
+    def _get_values(parameters: Iterable[BaseParameter]) -> Optional[Dict[str, Any]]:
+        values = {}
+        for parameter in parameters:
+            name = getattr(parameter, 'name', None)
+            if name is None:
+                # Parameter not loaded by the strategy - can't be compared.
+                return None
+            values[name] = parameter.value
+        return values
+
+    def _matches(self, strategy: IStrategy, values: Dict[str, Any]) -> bool:
+        if not self._track_parameters:
+            return self._get_values(p for _, p in strategy.enumerate_parameters()) == values
+        for name, value in values.items():
+            parameter = getattr(strategy, name, None)
+            if not isinstance(parameter, BaseParameter) or parameter.value != value:
+                return False
+        return True
+
+    def is_shared(self, strategy: IStrategy) -> bool:
+        """
+        :return: True if other remaining strategies may reuse the indicators of strategy.
+        """
+        indicator_id = self._ids.get(strategy.get_strategy_name())
+        return indicator_id is not None and self._users[indicator_id] > 1
+
+    def advise_all_indicators(
+            self, strategy: IStrategy, data: Dict[str, DataFrame],
+            advise: Callable[[Dict[str, DataFrame]], Dict[str, DataFrame]]
+            ) -> Dict[str, DataFrame]:
+        """
+        Shared version of advise(data).
+        :param strategy: Strategy to analyze data for
+        :param data: Candles per pair
+        :param advise: Function calculating the indicators for strategy
+        :return: Analyzed dataframes. Shared dataframes are copied, so the entry / exit
+            functions of one strategy don't modify the dataframes of other strategies.
+        """
+        indicator_id = self._ids.get(strategy.get_strategy_name())
+        if indicator_id is None:
+            return advise(data)
+
+        for values, analyzed in self._entries.get(indicator_id, []):
+            if self._matches(strategy, values):
+                logger.info(f'Reusing indicators for {strategy.get_strategy_name()}.')
+                return {pair: df.copy() for pair, df in analyzed.items()}
+
+        with BaseParameter.track_reads() as reads:
+            analyzed = advise(data)
+        if self._users[indicator_id] > 1:
+            parameters = self._get_values(
+                reads if self._track_parameters else
+                (p for _, p in strategy.enumerate_parameters()))
+            if parameters is not None:
+                self._entries.setdefault(indicator_id, []).append((parameters, analyzed))
+                return {pair: df.copy() for pair, df in analyzed.items()}
+        return analyzed
+
+    def release(self, strategy: IStrategy) -> None:
+        """
+        Drop dataframes which are not needed by any remaining strategy.
+        To be called once per strategy, after it has been analyzed.
+        """
+        indicator_id = self._ids.pop(strategy.get_strategy_name(), None)
+        if indicator_id is None:
+            return
+        self._users[indicator_id] -= 1
+        if self._users[indicator_id] <= 0:
+            self._entries.pop(indicator_id, None)
@@ -0,0 +1,94 @@
+"""
+Cache for entry / exit signals of hyperopt epochs.
+
+Signals are keyed on the values of all strategy parameters read by the entry / exit
+functions, so epochs which only change other parameters (or spaces like roi / stoploss)
+don't need to rerun the signal functions.
+"""
+import logging
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+from cachetools import LRUCache
+from pandas import DataFrame
+
+from freqtrade.strategy.parameters import BaseParameter
+
+
+logger = logging.getLogger(__name__)
+
+
+class SignalCache:
+    """
+    Per-pair cache of the columns added or modified by the entry / exit functions of a strategy.
+    Only valid as long as the dataframes passed to the signal functions don't change -
+    so it can't be used with --analyze-per-epoch.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        :param maxsize: Number of parameter combinations to keep per pair
+        """
+        self.maxsize = maxsize
+        self._parameters: Dict[str, Tuple[BaseParameter, ...]] = {}
+        self._signals: Dict[str, LRUCache] = {}
+        self._converted: Dict[str, Tuple[Hashable, DataFrame, Any]] = {}
+
+    def _get_key(self, pair: str) -> Optional[Tuple]:
+        parameters = self._parameters.get(pair)
+        if parameters is None:
+            return None
+        key = tuple(p.value for p in parameters)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values (e.g. lists as categories) can't be cached.
+            return None
+        return key
+
+    def get(self, pair: str) -> Optional[DataFrame]:
+        """
+        Get signal columns for the current parameter values.
+        :param pair: Pair to get signals for
+        :return: Columns added or modified by the signal functions, or None if not cached.
+        """
+        key = self._get_key(pair)
+        if key is None:
+            return None
+        return self._signals[pair].get(key)
+
+    def set(self, pair: str, parameters: Set[BaseParameter], signals: DataFrame) -> None:
+        """
+        Store signal columns for the current parameter values.
+        :param pair: Pair the signals have been calculated for
+        :param parameters: Parameters read while calculating the signals
+        :param signals: Columns added or modified by the signal functions
+        """
+        known = self._parameters.get(pair, ())
+        if not parameters.issubset(known):
+            # A parameter was read for the first time (e.g. due to a condition in the strategy),
+            # so prior keys are incomplete.
+            self._parameters[pair] = known + tuple(parameters.difference(known))
+            self._signals[pair] = LRUCache(maxsize=self.maxsize)
+            logger.debug(f"Signals for {pair} depend on "
+                         f"{[p.name for p in self._parameters[pair]]}.")
+        key = self._get_key(pair)
+        if key is not None:
+            self._signals[pair][key] = signals
+
+    def get_converted(self, pair: str, kind: Hashable, signals: DataFrame) -> Optional[Any]:
+        """
+        Get backtest data converted in a prior epoch, if it was based on identical signals.
+        :param pair: Pair to get data for
+        :param kind: Identifier for the conversion (e.g. the backtest engine)
+        :param signals: Current signal columns
+        """
+        converted = self._converted.get(pair)
+        if converted is not None and converted[0] == kind and converted[1].equals(signals):
+            return converted[2]
+        return None
+
+    def set_converted(self, pair: str, kind: Hashable, signals: DataFrame, data: Any) -> None:
+        """
+        Store backtest data converted from signals - replaces prior data for this pair.
+        """
+        self._converted[pair] = (kind, signals, data)
@@ -2,4 +2,4 @@
 
 from freqtrade.persistence.models import init_db
 from freqtrade.persistence.pairlock_middleware import PairLocks
-from freqtrade.persistence.trade_model import LocalTrade, Order, Trade
+from freqtrade.persistence.trade_model import LocalOrder, LocalTrade, Order, Trade
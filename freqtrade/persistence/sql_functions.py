@@ -0,0 +1,57 @@
+"""
+Database-agnostic sql functions
+"""
+from sqlalchemy import Date
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+class DateTrunc(FunctionElement):
+    """
+    Truncate a datetime column to the start of its day, week (monday) or month.
+    Usage: DateTrunc('weeks', Trade.close_date)
+    """
+    type = Date()
+    inherit_cache = True
+    name = 'date_trunc'
+    # timeunit is part of the statement cache key
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ('timeunit', InternalTraversal.dp_string)]
+
+    def __init__(self, timeunit: str, *clauses, **kwargs):
+        """
+        :param timeunit: Valid entries are 'days', 'weeks', 'months'
+        """
+        if timeunit not in ('days', 'weeks', 'months'):
+            raise ValueError(f'Invalid timeunit {timeunit}')
+        self.timeunit = timeunit
+        super().__init__(*clauses, **kwargs)
+
+
+@compiles(DateTrunc)
+def _compile_date_trunc(element: DateTrunc, compiler, **kw) -> str:
+    # PostgreSQL
+    unit = element.timeunit[:-1]
+    return f"CAST(date_trunc('{unit}', {compiler.process(element.clauses, **kw)}) AS DATE)"
+
+
+@compiles(DateTrunc, 'sqlite')
+def _compile_date_trunc_sqlite(element: DateTrunc, compiler, **kw) -> str:
+    column = compiler.process(element.clauses, **kw)
+    if element.timeunit == 'weeks':
+        # 'weekday 1' moves forward to the next monday (or stays on monday)
+        return f"date({column}, '-6 days', 'weekday 1')"
+    if element.timeunit == 'months':
+        return f"date({column}, 'start of month')"
+    return f"date({column})"
+
+
+@compiles(DateTrunc, 'mysql')
+def _compile_date_trunc_mysql(element: DateTrunc, compiler, **kw) -> str:
+    column = compiler.process(element.clauses, **kw)
+    if element.timeunit == 'weeks':
+        return f"(DATE({column}) - INTERVAL WEEKDAY({column}) DAY)"
+    if element.timeunit == 'months':
+        return f"(DATE({column}) - INTERVAL (DAYOFMONTH({column}) - 1) DAY)"
+    return f"DATE({column})"
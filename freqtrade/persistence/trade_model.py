@@ -24,53 +24,53 @@ from freqtrade.util import FtPrecise
 logger = logging.getLogger(__name__)
 
 
-class Order(_DECL_BASE):
+class LocalOrder:
     """
-    Order database model
-    Keeps a record of all orders placed on the exchange
-
-    One to many relationship with Trades:
-      - One trade can have many orders
-      - One Order can only be associated with one Trade
-
-    Mirrors CCXT Order structure
+    Order model without database mapping.
+    Used in backtesting - must be aligned to the Order model!
+    Uses __slots__, as backtests can create a large number of orders.
     """
-    __tablename__ = 'orders'
-    # Uniqueness should be ensured over pair, order_id
-    # its likely that order_id is unique per Pair on some exchanges.
-    __table_args__ = (UniqueConstraint('ft_pair', 'order_id', name="_order_pair_order_id"),)
-
-    id = Column(Integer, primary_key=True)
-    ft_trade_id = Column(Integer, ForeignKey('trades.id'), index=True)
-
-    trade = relationship("Trade", back_populates="orders")
-
-    # order_side can only be 'buy', 'sell' or 'stoploss'
-    ft_order_side = Column(String(25), nullable=False)
-    ft_pair = Column(String(25), nullable=False)
-    ft_is_open = Column(Boolean, nullable=False, default=True, index=True)
-    ft_amount = Column(Float(), nullable=False)
-    ft_price = Column(Float(), nullable=False)
+    __slots__ = (
+        'id', 'ft_trade_id', 'ft_order_side', 'ft_pair', 'ft_is_open', 'ft_amount', 'ft_price',
+        'order_id', 'status', 'symbol', 'order_type', 'side', 'price', 'average', 'amount',
+        'filled', 'remaining', 'cost', 'stop_price', 'order_date', 'order_filled_date',
+        'order_update_date', 'funding_fee', 'ft_fee_base',
+    )
+
+    id: int
+    ft_trade_id: int
+    ft_order_side: str
+    ft_pair: str
+    ft_is_open: bool
+    ft_amount: float
+    ft_price: float
+
+    order_id: str
+    status: Optional[str]
+    symbol: Optional[str]
+    order_type: str
+    side: str
+    price: float
+    average: float
+    amount: float
+    filled: float
+    remaining: float
+    cost: float
+    stop_price: Optional[float]
+    order_date: datetime
+    order_filled_date: Optional[datetime]
+    order_update_date: Optional[datetime]
+
+    funding_fee: Optional[float]
+
+    ft_fee_base: Optional[float]
 
-    order_id = Column(String(255), nullable=False, index=True)
-    status = Column(String(255), nullable=True)
-    symbol = Column(String(25), nullable=True)
-    order_type = Column(String(50), nullable=True)
-    side = Column(String(25), nullable=True)
-    price = Column(Float(), nullable=True)
-    average = Column(Float(), nullable=True)
-    amount = Column(Float(), nullable=True)
-    filled = Column(Float(), nullable=True)
-    remaining = Column(Float(), nullable=True)
-    cost = Column(Float(), nullable=True)
-    stop_price = Column(Float(), nullable=True)
-    order_date = Column(DateTime(), nullable=True, default=datetime.utcnow)
-    order_filled_date = Column(DateTime(), nullable=True)
-    order_update_date = Column(DateTime(), nullable=True)
-
-    funding_fee = Column(Float(), nullable=True)
-
-    ft_fee_base = Column(Float(), nullable=True)
+    def __init__(self, **kwargs):
+        for key in self.__slots__:
+            setattr(self, key, None)
+        self.ft_is_open = True
+        for key in kwargs:
+            setattr(self, key, kwargs[key])
 
     @property
     def order_date_utc(self) -> datetime:
@@ -116,6 +116,100 @@ class Order(_DECL_BASE):
         return (f'Order(id={self.id}, order_id={self.order_id}, trade_id={self.ft_trade_id}, '
                 f'side={self.side}, order_type={self.order_type}, status={self.status})')
 
+    def to_json(self, entry_side: str, minified: bool = False) -> Dict[str, Any]:
+        resp = {
+            'amount': self.safe_amount,
+            'safe_price': self.safe_price,
+            'ft_order_side': self.ft_order_side,
+            'order_filled_timestamp': int(self.order_filled_date.replace(
+                tzinfo=timezone.utc).timestamp() * 1000) if self.order_filled_date else None,
+            'ft_is_entry': self.ft_order_side == entry_side,
+        }
+        if not minified:
+            resp.update({
+                'pair': self.ft_pair,
+                'order_id': self.order_id,
+                'status': self.status,
+                'average': round(self.average, 8) if self.average else 0,
+                'cost': self.cost if self.cost else 0,
+                'filled': self.filled,
+                'is_open': self.ft_is_open,
+                'order_date': self.order_date.strftime(DATETIME_PRINT_FORMAT)
+                if self.order_date else None,
+                'order_timestamp': int(self.order_date.replace(
+                    tzinfo=timezone.utc).timestamp() * 1000) if self.order_date else None,
+                'order_filled_date': self.order_filled_date.strftime(DATETIME_PRINT_FORMAT)
+                if self.order_filled_date else None,
+                'order_type': self.order_type,
+                'price': self.price,
+                'remaining': self.remaining,
+            })
+        return resp
+
+    def close_bt_order(self, close_date: datetime, trade: 'LocalTrade'):
+        self.order_filled_date = close_date
+        self.filled = self.amount
+        self.remaining = 0
+        self.status = 'closed'
+        self.ft_is_open = False
+        # Assign funding fees to Order.
+        # Assumes backtesting will use date_last_filled_utc to calculate future funding fees.
+        self.funding_fee = trade.funding_fees
+
+        if (self.ft_order_side == trade.entry_side):
+            trade.open_rate = self.price
+            trade.recalc_trade_from_orders()
+            trade.adjust_stop_loss(trade.open_rate, trade.stop_loss_pct, refresh=True)
+
+
+class Order(_DECL_BASE, LocalOrder):
+    """
+    Order database model
+    Keeps a record of all orders placed on the exchange
+
+    One to many relationship with Trades:
+      - One trade can have many orders
+      - One Order can only be associated with one Trade
+
+    Mirrors CCXT Order structure
+    """
+    __tablename__ = 'orders'
+    # Uniqueness should be ensured over pair, order_id
+    # its likely that order_id is unique per Pair on some exchanges.
+    __table_args__ = (UniqueConstraint('ft_pair', 'order_id', name="_order_pair_order_id"),)
+
+    id = Column(Integer, primary_key=True)
+    ft_trade_id = Column(Integer, ForeignKey('trades.id'), index=True)
+
+    trade = relationship("Trade", back_populates="orders")
+
+    # order_side can only be 'buy', 'sell' or 'stoploss'
+    ft_order_side = Column(String(25), nullable=False)
+    ft_pair = Column(String(25), nullable=False)
+    ft_is_open = Column(Boolean, nullable=False, default=True, index=True)
+    ft_amount = Column(Float(), nullable=False)
+    ft_price = Column(Float(), nullable=False)
+
+    order_id = Column(String(255), nullable=False, index=True)
+    status = Column(String(255), nullable=True)
+    symbol = Column(String(25), nullable=True)
+    order_type = Column(String(50), nullable=True)
+    side = Column(String(25), nullable=True)
+    price = Column(Float(), nullable=True)
+    average = Column(Float(), nullable=True)
+    amount = Column(Float(), nullable=True)
+    filled = Column(Float(), nullable=True)
+    remaining = Column(Float(), nullable=True)
+    cost = Column(Float(), nullable=True)
+    stop_price = Column(Float(), nullable=True)
+    order_date = Column(DateTime(), nullable=True, default=datetime.utcnow)
+    order_filled_date = Column(DateTime(), nullable=True)
+    order_update_date = Column(DateTime(), nullable=True)
+
+    funding_fee = Column(Float(), nullable=True)
+
+    ft_fee_base = Column(Float(), nullable=True)
+
     def update_from_ccxt_object(self, order):
         """
         Update Order from ccxt response
@@ -170,51 +264,6 @@ class Order(_DECL_BASE):
             'info': {},
         }
 
-    def to_json(self, entry_side: str, minified: bool = False) -> Dict[str, Any]:
-        resp = {
-            'amount': self.safe_amount,
-            'safe_price': self.safe_price,
-            'ft_order_side': self.ft_order_side,
-            'order_filled_timestamp': int(self.order_filled_date.replace(
-                tzinfo=timezone.utc).timestamp() * 1000) if self.order_filled_date else None,
-            'ft_is_entry': self.ft_order_side == entry_side,
-        }
-        if not minified:
-            resp.update({
-                'pair': self.ft_pair,
-                'order_id': self.order_id,
-                'status': self.status,
-                'average': round(self.average, 8) if self.average else 0,
-                'cost': self.cost if self.cost else 0,
-                'filled': self.filled,
-                'is_open': self.ft_is_open,
-                'order_date': self.order_date.strftime(DATETIME_PRINT_FORMAT)
-                if self.order_date else None,
-                'order_timestamp': int(self.order_date.replace(
-                    tzinfo=timezone.utc).timestamp() * 1000) if self.order_date else None,
-                'order_filled_date': self.order_filled_date.strftime(DATETIME_PRINT_FORMAT)
-                if self.order_filled_date else None,
-                'order_type': self.order_type,
-                'price': self.price,
-                'remaining': self.remaining,
-            })
-        return resp
-
-    def close_bt_order(self, close_date: datetime, trade: 'LocalTrade'):
-        self.order_filled_date = close_date
-        self.filled = self.amount
-        self.remaining = 0
-        self.status = 'closed'
-        self.ft_is_open = False
-        # Assign funding fees to Order.
-        # Assumes backtesting will use date_last_filled_utc to calculate future funding fees.
-        self.funding_fee = trade.funding_fees
-
-        if (self.ft_order_side == trade.entry_side):
-            trade.open_rate = self.price
-            trade.recalc_trade_from_orders()
-            trade.adjust_stop_loss(trade.open_rate, trade.stop_loss_pct, refresh=True)
-
     @staticmethod
     def update_orders(orders: List['Order'], order: Dict[str, Any]):
         """
@@ -286,7 +335,7 @@ class LocalTrade():
 
     id: int = 0
 
-    orders: List[Order] = []
+    orders: List[LocalOrder] = []
 
     exchange: str = ''
     pair: str = ''
@@ -639,7 +688,7 @@ class LocalTrade():
             f"Trailing stoploss saved us: "
             f"{float(self.stop_loss) - float(self.initial_stop_loss):.8f}.")
 
-    def update_trade(self, order: Order) -> None:
+    def update_trade(self, order: LocalOrder) -> None:
         """
         Updates this entity with amount and actual open/close rates.
         :param order: order retrieved by exchange.fetch_order()
@@ -740,9 +789,6 @@ class LocalTrade():
         else:
             return False
 
-    def update_order(self, order: Dict) -> None:
-        Order.update_orders(self.orders, order)
-
     def get_exit_order_count(self) -> int:
         """
         Get amount of failed exiting orders
@@ -962,7 +1008,7 @@ class LocalTrade():
             self.close_profit = (close_profit_abs / total_stake) * self.leverage
             self.close_profit_abs = close_profit_abs
 
-    def select_order_by_order_id(self, order_id: str) -> Optional[Order]:
+    def select_order_by_order_id(self, order_id: str) -> Optional[LocalOrder]:
         """
         Finds order object by Order id.
         :param order_id: Exchange order id
@@ -972,8 +1018,8 @@ class LocalTrade():
                 return o
         return None
 
-    def select_order(self, order_side: Optional[str] = None,
-                     is_open: Optional[bool] = None, only_filled: bool = False) -> Optional[Order]:
+    def select_order(self, order_side: Optional[str] = None, is_open: Optional[bool] = None,
+                     only_filled: bool = False) -> Optional[LocalOrder]:
         """
         Finds latest order for this orderside and status
         :param order_side: ft_order_side of the order (either 'buy', 'sell' or 'stoploss')
@@ -993,7 +1039,7 @@ class LocalTrade():
         else:
             return None
 
-    def select_filled_orders(self, order_side: Optional[str] = None) -> List['Order']:
+    def select_filled_orders(self, order_side: Optional[str] = None) -> List[LocalOrder]:
         """
         Finds filled orders for this orderside.
         :param order_side: Side of the order (either 'buy', 'sell', or None)
@@ -1004,7 +1050,7 @@ class LocalTrade():
                 and o.filled
                 and o.status in NON_OPEN_EXCHANGE_STATES]
 
-    def select_filled_or_open_orders(self) -> List['Order']:
+    def select_filled_or_open_orders(self) -> List[LocalOrder]:
         """
         Finds filled or open orders
         :param order_side: Side of the order (either 'buy', 'sell', or None)
@@ -1251,6 +1297,9 @@ class Trade(_DECL_BASE, LocalTrade):
         Trade.query.session.delete(self)
         Trade.commit()
 
+    def update_order(self, order: Dict) -> None:
+        Order.update_orders(self.orders, order)
+
     @staticmethod
     def commit():
         Trade.query.session.commit()
@@ -67,6 +67,7 @@ class StrategyResolver(IResolver):
                       ("stake_amount",                    None),
                       ("protections",                     None),
                       ("startup_candle_count",            None),
+                      ("lookback_candle_count",           None),
                       ("unfilledtimeout",                 None),
                       ("use_exit_signal",                 True),
                       ("exit_profit_only",                False),
@@ -455,6 +455,31 @@ class SysInfo(BaseModel):
     ram_pct: float
 
 
+class ProfileEntry(BaseModel):
+    count: int
+    last: float
+    mean: float
+    max: float
+
+
+class Profile(BaseModel):
+    phases: Dict[str, ProfileEntry]
+    pairs: Dict[str, ProfileEntry]
+    exchange: Dict[str, ProfileEntry]
+    ohlcv_refresh: Dict[str, Any]
+
+
+class WSChannelStats(BaseModel):
+    channel_id: str
+    remote_addr: str
+    subscriptions: List[str]
+    queue_size: int
+    max_queue_size: int
+    coalesced: int
+    dropped: int
+    avg_send_time: float
+
+
 class Health(BaseModel):
     last_process: datetime
     last_process_ts: int
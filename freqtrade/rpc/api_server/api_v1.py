@@ -1,8 +1,8 @@
 import logging
 from copy import deepcopy
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from fastapi.exceptions import HTTPException
 
 from freqtrade import __version__
@@ -16,11 +16,13 @@ from freqtrade.rpc.api_server.api_schemas import (AvailablePairs, Balances, Blac
                                                   ForceEnterResponse, ForceExitPayload,
                                                   FreqAIModelListResponse, Health, Locks, Logs,
                                                   OpenTradeSchema, PairHistory, PerformanceEntry,
-                                                  Ping, PlotConfig, Profit, ResultMsg, ShowConfig,
-                                                  Stats, StatusMsg, StrategyListResponse,
-                                                  StrategyResponse, SysInfo, Version,
-                                                  WhitelistResponse)
-from freqtrade.rpc.api_server.deps import get_config, get_exchange, get_rpc, get_rpc_optional
+                                                  Ping, PlotConfig, Profile, Profit, ResultMsg,
+                                                  ShowConfig, Stats, StatusMsg,
+                                                  StrategyListResponse, StrategyResponse, SysInfo,
+                                                  Version, WhitelistResponse, WSChannelStats)
+from freqtrade.rpc.api_server.deps import (get_config, get_exchange, get_rpc, get_rpc_optional,
+                                           get_ws_channels)
+from freqtrade.rpc.api_server.ws.channel import WebSocketChannel
 from freqtrade.rpc.rpc import RPCException
 
 
@@ -42,7 +44,9 @@ logger = logging.getLogger(__name__)
 # 2.22: Add FreqAI to backtesting
 # 2.23: Allow plot config request in webserver mode
 # 2.24: Add cancel_open_order endpoint
-API_VERSION = 2.24
+# 2.25: Add profile endpoint
+# 2.26: Add ws_channels endpoint
+API_VERSION = 2.26
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -240,7 +244,9 @@ def reload_config(rpc: RPC = Depends(get_rpc)):
 @router.get('/pair_candles', response_model=PairHistory, tags=['candle data'])
 def pair_candles(
         pair: str, timeframe: str, limit: Optional[int] = None, rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_analysed_dataframe(pair, timeframe, limit)
+    # Serialized (and cached) by rpc - bypasses response_model validation.
+    return Response(rpc._rpc_analysed_dataframe_json(pair, timeframe, limit),
+                    media_type='application/json')
 
 
 @router.get('/pair_history', response_model=PairHistory, tags=['candle data'])
@@ -347,3 +353,14 @@ def sysinfo():
 @router.get('/health', response_model=Health, tags=['info'])
 def health(rpc: RPC = Depends(get_rpc)):
     return rpc._health()
+
+
+@router.get('/profile', response_model=Profile, tags=['info'])
+def profile(rpc: RPC = Depends(get_rpc)):
+    return rpc._rpc_profile()
+
+
+@router.get('/ws_channels', response_model=List[WSChannelStats], tags=['info'])
+async def ws_channels(channels: Set[WebSocketChannel] = Depends(get_ws_channels)):
+    # Runs in the event loop, which owns the channels
+    return [channel.stats for channel in channels]
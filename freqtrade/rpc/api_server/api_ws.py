@@ -1,6 +1,5 @@
 import logging
-import time
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 from fastapi import APIRouter, Depends
 from fastapi.websockets import WebSocket
@@ -8,9 +7,10 @@ from pydantic import ValidationError
 
 from freqtrade.enums import RPCMessageType, RPCRequestType
 from freqtrade.rpc.api_server.api_auth import validate_ws_token
-from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc
+from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc, get_ws_channels
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import get_serializer_cls, select_subprotocol
 from freqtrade.rpc.api_server.ws_schemas import (WSAnalyzedDFMessage, WSMessageSchema,
                                                  WSRequestSchema, WSWhitelistMessage)
 from freqtrade.rpc.rpc import RPC
@@ -32,19 +32,13 @@ async def channel_reader(channel: WebSocketChannel, rpc: RPC):
 
 async def channel_broadcaster(channel: WebSocketChannel, message_stream: MessageStream):
     """
-    Iterate over messages in the message stream and send them
+    Iterate over messages in the message stream and queue them on the channel.
+    Queueing doesn't wait for the send, so a slow channel doesn't fall behind
+    on the message stream - superseded messages are combined in its queue instead.
     """
     async for message, ts in message_stream:
         if channel.subscribed_to(message.get('type')):
-            # Log a warning if this channel is behind
-            # on the message stream by a lot
-            if (time.time() - ts) > 60:
-                logger.warning(f"Channel {channel} is behind MessageStream by 1 minute,"
-                               " this can cause a memory leak if you see this message"
-                               " often, consider reducing pair list size or amount of"
-                               " consumers.")
-
-            await channel.send(message, timeout=True)
+            channel.queue_message(message, ts)
 
 
 async def _process_consumer_request(
@@ -105,11 +99,22 @@ async def message_endpoint(
     websocket: WebSocket,
     token: str = Depends(validate_ws_token),
     rpc: RPC = Depends(get_rpc),
-    message_stream: MessageStream = Depends(get_message_stream)
+    message_stream: MessageStream = Depends(get_message_stream),
+    channels: Set[WebSocketChannel] = Depends(get_ws_channels)
 ):
     if token:
-        async with create_channel(websocket) as channel:
-            await channel.run_channel_tasks(
-                channel_reader(channel, rpc),
-                channel_broadcaster(channel, message_stream)
-            )
+        # Use the serializer negotiated with the consumer, JSON if none was offered
+        subprotocol = select_subprotocol(websocket.scope.get('subprotocols', []))
+        async with create_channel(
+            websocket,
+            serializer_cls=get_serializer_cls(subprotocol)
+        ) as channel:
+            channels.add(channel)
+            try:
+                await channel.run_channel_tasks(
+                    channel_reader(channel, rpc),
+                    channel_broadcaster(channel, message_stream),
+                    channel.send_queued_messages()
+                )
+            finally:
+                channels.discard(channel)
@@ -45,6 +45,10 @@ def get_message_stream():
     return ApiServer._message_stream
 
 
+def get_ws_channels():
+    return ApiServer._ws_channels
+
+
 def is_webserver_mode(config=Depends(get_config)):
     if config['runmode'] != RunMode.WEBSERVER:
         raise RPCException('Bot is not in the correct state')
@@ -1,6 +1,6 @@
 import logging
 from ipaddress import IPv4Address
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 import orjson
 import uvicorn
@@ -11,6 +11,7 @@ from starlette.responses import JSONResponse
 from freqtrade.constants import Config
 from freqtrade.exceptions import OperationalException
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
+from freqtrade.rpc.api_server.ws.channel import WebSocketChannel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
 from freqtrade.rpc.rpc import RPC, RPCException, RPCHandler
 
@@ -47,6 +48,8 @@ class ApiServer(RPCHandler):
     _exchange = None
     # websocket message stuff
     _message_stream: Optional[MessageStream] = None
+    # Connected websocket channels
+    _ws_channels: Set[WebSocketChannel] = set()
 
     def __new__(cls, *args, **kwargs):
         """
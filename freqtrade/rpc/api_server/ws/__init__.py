@@ -2,6 +2,7 @@
 # isort: off
 from freqtrade.rpc.api_server.ws.types import WebSocketType
 from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
-from freqtrade.rpc.api_server.ws.serializer import HybridJSONWebSocketSerializer
+from freqtrade.rpc.api_server.ws.serializer import (ArrowWebSocketSerializer,
+                                                    HybridJSONWebSocketSerializer)
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
@@ -3,12 +3,14 @@ import logging
 import time
 from collections import deque
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Type, Union
+from typing import Any, AsyncIterator, Deque, Dict, Hashable, List, Optional, Type, Union
 from uuid import uuid4
 
 from fastapi import WebSocketDisconnect
+from pandas import concat
 from websockets.exceptions import ConnectionClosed
 
+from freqtrade.enums import RPCMessageType
 from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
 from freqtrade.rpc.api_server.ws.serializer import (HybridJSONWebSocketSerializer,
                                                     WebSocketSerializer)
@@ -18,6 +20,51 @@ from freqtrade.rpc.api_server.ws_schemas import WSMessageSchemaType
 
 logger = logging.getLogger(__name__)
 
+# Default size limit of the outbound message queue per channel
+MAX_QUEUE_SIZE = 1000
+
+
+class _QueuedMessage:
+    __slots__ = ('key', 'message', 'ts')
+
+    def __init__(self, key: Optional[Hashable], message: Dict[str, Any], ts: float):
+        self.key = key
+        self.message = message
+        self.ts = ts
+
+
+def _coalesce_key(message: Dict[str, Any]) -> Optional[Hashable]:
+    """
+    Messages with the same key supersede each other while queued.
+    Messages without key (e.g. entry / exit notifications) are never coalesced.
+    """
+    message_type = message.get('type')
+    if message_type == RPCMessageType.WHITELIST:
+        return (RPCMessageType.WHITELIST, )
+    if message_type == RPCMessageType.ANALYZED_DF:
+        return (RPCMessageType.ANALYZED_DF, *message['data']['key'])
+    if message_type == RPCMessageType.NEW_CANDLE:
+        return (RPCMessageType.NEW_CANDLE, *message['data'])
+    return None
+
+
+def _coalesce(queued: Dict[str, Any], message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combine a queued message with a newer message with the same key.
+    Analyzed dataframes only contain the changed candles, so the candles of both
+    messages are combined. The result has no sequence number, as it doesn't continue
+    the sequence of the producer.
+    """
+    if message.get('type') != RPCMessageType.ANALYZED_DF:
+        return message
+    old_df, new_df = queued['data']['df'], message['data']['df']
+    if not old_df.empty and not new_df.empty:
+        new_df = concat([old_df[old_df['date'] < new_df['date'].iloc[0]], new_df],
+                        ignore_index=True)
+    data = {k: v for k, v in message['data'].items() if k != 'seq'}
+    data['df'] = new_df
+    return {**message, 'data': data}
+
 
 class WebSocketChannel:
     """
@@ -28,7 +75,8 @@ class WebSocketChannel:
         websocket: WebSocketType,
         channel_id: Optional[str] = None,
         serializer_cls: Type[WebSocketSerializer] = HybridJSONWebSocketSerializer,
-        send_throttle: float = 0.01
+        send_throttle: float = 0.01,
+        max_queue_size: int = MAX_QUEUE_SIZE
     ):
         self.channel_id = channel_id if channel_id else uuid4().hex[:8]
         self._websocket = WebSocketProxy(websocket)
@@ -47,6 +95,14 @@ class WebSocketChannel:
         # The subscribed message types
         self._subscriptions: List[str] = []
 
+        # Outbound message queue, see queue_message()
+        self._queue: Deque[_QueuedMessage] = deque()
+        self._queued_keys: Dict[Hashable, _QueuedMessage] = {}
+        self._queue_event = asyncio.Event()
+        self._max_queue_size = max_queue_size
+        self._coalesced = 0
+        self._dropped = 0
+
         # Wrap the WebSocket in the Serializing class
         self._wrapped_ws = serializer_cls(self._websocket)
 
@@ -65,6 +121,22 @@ class WebSocketChannel:
     def avg_send_time(self):
         return sum(self._send_times) / len(self._send_times)
 
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistics of the outbound message queue
+        """
+        return {
+            'channel_id': self.channel_id,
+            'remote_addr': ':'.join(str(part) for part in self.remote_addr),
+            'subscriptions': self._subscriptions,
+            'queue_size': len(self._queue),
+            'max_queue_size': self._max_queue_size,
+            'coalesced': self._coalesced,
+            'dropped': self._dropped,
+            'avg_send_time': self.avg_send_time if self._send_times else 0.0,
+        }
+
     def _calc_send_limit(self):
         """
         Calculate the send high limit for this channel
@@ -111,6 +183,61 @@ class WebSocketChannel:
         # Also throttles how fast we send
         await asyncio.sleep(self._send_throttle)
 
+    def queue_message(self, message: Dict[str, Any], ts: Optional[float] = None) -> None:
+        """
+        Queue a message to be sent by send_queued_messages(), without waiting for the send.
+        A queued message superseded by this message (e.g. the analyzed dataframe of the
+        same pair) is combined with it. If the queue is full, the oldest message is dropped.
+
+        :param message: The message to send
+        :param ts: Time the message was published, defaults to now
+        """
+        ts = ts if ts is not None else time.time()
+        key = _coalesce_key(message)
+        if key is not None and key in self._queued_keys:
+            queued = self._queued_keys[key]
+            queued.message = _coalesce(queued.message, message)
+            self._coalesced += 1
+            return
+
+        if len(self._queue) >= self._max_queue_size:
+            dropped = self._queue.popleft()
+            if dropped.key is not None:
+                del self._queued_keys[dropped.key]
+            self._dropped += 1
+            if self._dropped % 100 == 1:
+                logger.warning(f"Send queue of {self} is full, dropped {self._dropped} "
+                               "message(s) so far.")
+
+        queued_message = _QueuedMessage(key, message, ts)
+        self._queue.append(queued_message)
+        if key is not None:
+            self._queued_keys[key] = queued_message
+        self._queue_event.set()
+
+    async def send_queued_messages(self):
+        """
+        Send the queued messages, for as long as the channel is open.
+        """
+        while not self.is_closed():
+            if not self._queue:
+                self._queue_event.clear()
+                await self._queue_event.wait()
+                continue
+
+            queued = self._queue.popleft()
+            if queued.key is not None:
+                del self._queued_keys[queued.key]
+
+            # Log a warning if this channel is behind
+            # on the message stream by a lot
+            if (time.time() - queued.ts) > 60:
+                logger.warning(f"Channel {self} is behind MessageStream by 1 minute,"
+                               " consider reducing pair list size or amount of"
+                               " consumers.")
+
+            await self.send(queued.message, timeout=True)
+
     async def recv(self):
         """
         Receive a message on the wrapped websocket
@@ -130,7 +257,7 @@ class WebSocketChannel:
         accept, just close the channel.
         """
         try:
-            return await self._websocket.accept()
+            return await self._websocket.accept(self._wrapped_ws.subprotocol)
         except RuntimeError:
             await self.close()
 
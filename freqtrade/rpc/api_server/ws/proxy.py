@@ -1,6 +1,7 @@
-from typing import Any, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
 from fastapi import WebSocket as FastAPIWebSocket
+from fastapi import WebSocketDisconnect
 from websockets.client import WebSocketClientProtocol as WebSocket
 
 from freqtrade.rpc.api_server.ws.types import WebSocketType
@@ -32,8 +33,11 @@ class WebSocketProxy:
     async def send(self, data):
         """
         Send data on the wrapped websocket
+        Bytes are sent as binary frames, strings as text frames.
         """
-        if hasattr(self._websocket, "send_text"):
+        if isinstance(data, bytes) and hasattr(self._websocket, "send_bytes"):
+            await self._websocket.send_bytes(data)
+        elif hasattr(self._websocket, "send_text"):
             await self._websocket.send_text(data)
         else:
             await self._websocket.send(data)
@@ -41,9 +45,15 @@ class WebSocketProxy:
     async def recv(self):
         """
         Receive data on the wrapped websocket
+        Returns bytes for binary frames, and str for text frames.
         """
         if hasattr(self._websocket, "receive_text"):
-            return await self._websocket.receive_text()
+            message = await self._websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message["code"])
+            if message.get("text") is not None:
+                return message["text"]
+            return message["bytes"]
         else:
             return await self._websocket.recv()
 
@@ -65,9 +75,10 @@ class WebSocketProxy:
             except RuntimeError:
                 pass
 
-    async def accept(self):
+    async def accept(self, subprotocol: Optional[str] = None):
         """
         Accept the WebSocket connection, only support by FastAPI WebSockets
+        :param subprotocol: Subprotocol selected from the ones offered by the client
         """
         if hasattr(self._websocket, "accept"):
-            return await self._websocket.accept()
+            return await self._websocket.accept(subprotocol=subprotocol)
@@ -1,11 +1,17 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
 import orjson
 import rapidjson
 from pandas import DataFrame
 
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
 from freqtrade.misc import dataframe_to_json, json_to_dataframe
 from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
 from freqtrade.rpc.api_server.ws_schemas import WSMessageSchemaType
@@ -15,6 +21,10 @@ logger = logging.getLogger(__name__)
 
 
 class WebSocketSerializer(ABC):
+    # Websocket subprotocol to negotiate this serializer with the peer.
+    # None for the default serializer, which is used by peers without subprotocol.
+    subprotocol: Optional[str] = None
+
     def __init__(self, websocket: WebSocketProxy):
         self._websocket: WebSocketProxy = websocket
 
@@ -33,6 +43,10 @@ class WebSocketSerializer(ABC):
         data = await self._websocket.recv()
         return self._deserialize(data)
 
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
 
 class HybridJSONWebSocketSerializer(WebSocketSerializer):
     def _serialize(self, data) -> str:
@@ -43,6 +57,104 @@ class HybridJSONWebSocketSerializer(WebSocketSerializer):
         return rapidjson.loads(data, object_hook=_json_object_hook)
 
 
+class ArrowWebSocketSerializer(WebSocketSerializer):
+    """
+    Sends DataFrames as Arrow IPC streams instead of JSON, in binary frames of the form
+    <4 byte header length><JSON header><Arrow IPC stream of each DataFrame>.
+    The header is the message itself, with references to the Arrow streams in place of
+    the DataFrames.
+    """
+    subprotocol = 'freqtrade.arrow'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return pa is not None
+
+    def _serialize(self, data) -> bytes:
+        buffers: List[Any] = []
+        offset = 0
+
+        def default(z):
+            nonlocal offset
+            if isinstance(z, DataFrame):
+                try:
+                    buffer = _dataframe_to_arrow(z)
+                except pa.ArrowException:
+                    # Columns Arrow can't convert, e.g. mixed object columns
+                    return _json_default(z)
+                buffers.append(buffer)
+                offset += buffer.size
+                return {
+                    '__type__': 'dataframe',
+                    '__arrow__': [offset - buffer.size, buffer.size]
+                }
+            return _json_default(z)
+
+        header = orjson.dumps(data, default=default)
+        return b''.join([len(header).to_bytes(4, 'big'), header, *buffers])
+
+    def _deserialize(self, data: Union[bytes, str]):
+        if isinstance(data, str):
+            # Text frames are JSON messages
+            return rapidjson.loads(data, object_hook=_json_object_hook)
+
+        view = memoryview(data)
+        header_end = 4 + int.from_bytes(view[:4], 'big')
+        payload = view[header_end:]
+
+        def object_hook(z):
+            if z.get('__type__') == 'dataframe' and '__arrow__' in z:
+                start, size = z['__arrow__']
+                return _arrow_to_dataframe(payload[start:start + size])
+            return _json_object_hook(z)
+
+        return rapidjson.loads(bytes(view[4:header_end]), object_hook=object_hook)
+
+
+# Serializers selectable in the `external_message_consumer` producer configuration
+WS_SERIALIZERS: Dict[str, Type[WebSocketSerializer]] = {
+    'json': HybridJSONWebSocketSerializer,
+    'arrow': ArrowWebSocketSerializer,
+}
+
+
+def select_subprotocol(offered: List[str]) -> Optional[str]:
+    """
+    Select the first subprotocol offered by a peer which is available on this side.
+    :param offered: Subprotocols offered by the peer, in order of preference
+    :return: Selected subprotocol, or None to use the default JSON serializer
+    """
+    for subprotocol in offered:
+        for serializer_cls in WS_SERIALIZERS.values():
+            if serializer_cls.subprotocol == subprotocol and serializer_cls.is_available():
+                return subprotocol
+    return None
+
+
+def get_serializer_cls(subprotocol: Optional[str]) -> Type[WebSocketSerializer]:
+    """
+    Get the serializer for a negotiated subprotocol.
+    Peers which did not negotiate a subprotocol use the JSON serializer.
+    """
+    for serializer_cls in WS_SERIALIZERS.values():
+        if subprotocol and serializer_cls.subprotocol == subprotocol:
+            return serializer_cls
+    return HybridJSONWebSocketSerializer
+
+
+def _dataframe_to_arrow(dataframe: DataFrame):
+    table = pa.Table.from_pandas(dataframe)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _arrow_to_dataframe(data: memoryview) -> DataFrame:
+    with pa.ipc.open_stream(pa.py_buffer(data)) as reader:
+        return reader.read_pandas()
+
+
 # Support serializing pandas DataFrames
 def _json_default(z):
     if isinstance(z, DataFrame):
@@ -62,6 +62,8 @@ class WSAnalyzedDFMessage(WSMessageSchema):
         key: PairWithTimeframe
         df: DataFrame
         la: datetime
+        # Sequence number of emitted candle updates, not set for requested dataframes
+        seq: Optional[int] = None
 
     type: RPCMessageType = RPCMessageType.ANALYZED_DF
     data: AnalyzedDFData
@@ -8,17 +8,18 @@ import asyncio
 import logging
 import socket
 from threading import Thread
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypedDict, Union
 
 import websockets
 from pydantic import ValidationError
 
-from freqtrade.constants import FULL_DATAFRAME_THRESHOLD
+from freqtrade.constants import FULL_DATAFRAME_THRESHOLD, PairWithTimeframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import RPCMessageType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import WS_SERIALIZERS, get_serializer_cls
 from freqtrade.rpc.api_server.ws_schemas import (WSAnalyzedDFMessage, WSAnalyzedDFRequest,
                                                  WSMessageSchema, WSRequestSchema,
                                                  WSSubscribeRequest, WSWhitelistMessage,
@@ -35,6 +36,7 @@ class Producer(TypedDict):
     port: int
     secure: bool
     ws_token: str
+    serializer: str
 
 
 logger = logging.getLogger(__name__)
@@ -100,6 +102,9 @@ class ExternalMessageConsumer:
 
         self._channel_streams: Dict[str, MessageStream] = {}
 
+        # Last received sequence number of the emitted dataframes, per producer and pair_key
+        self._sequences: Dict[str, Dict[PairWithTimeframe, int]] = {}
+
         self.start()
 
     def start(self):
@@ -192,21 +197,31 @@ class ExternalMessageConsumer:
                 name = producer['name']
                 scheme = 'wss' if producer.get('secure', False) else 'ws'
                 ws_url = f"{scheme}://{host}:{port}/api/v1/message/ws?token={token}"
+                subprotocols = self._get_subprotocols(producer)
 
                 # This will raise InvalidURI if the url is bad
                 async with websockets.connect(
                     ws_url,
                     max_size=self.message_size_limit,
-                    ping_interval=None
+                    ping_interval=None,
+                    subprotocols=subprotocols
                 ) as ws:
+                    if subprotocols and ws.subprotocol is None:
+                        logger.info(f"Producer `{name}` does not support the "
+                                    f"`{producer.get('serializer')}` serializer, using json.")
+
                     async with create_channel(
                         ws,
                         channel_id=name,
+                        serializer_cls=get_serializer_cls(ws.subprotocol),
                         send_throttle=0.5
                     ) as channel:
 
                         # Create the message stream for this channel
                         self._channel_streams[name] = MessageStream()
+                        # Dataframes are requested again, messages missed while
+                        # disconnected don't need to be detected.
+                        self._sequences[name] = {}
 
                         # Run the channel tasks while connected
                         await channel.run_channel_tasks(
@@ -243,6 +258,23 @@ class ExternalMessageConsumer:
                 await asyncio.sleep(self.sleep_time)
                 continue
 
+    @staticmethod
+    def _get_subprotocols(producer: Producer) -> Optional[List[str]]:
+        """
+        Subprotocols to offer to the producer, to negotiate the configured serializer.
+        Producers which don't support the subprotocol will fall back to json.
+
+        :param producer: Dictionary containing producer info
+        """
+        serializer_cls = WS_SERIALIZERS[producer.get('serializer', 'json')]
+        if serializer_cls.subprotocol is None:
+            return None
+        if not serializer_cls.is_available():
+            logger.warning(f"The `{producer.get('serializer')}` serializer is not available, "
+                           "using json.")
+            return None
+        return [serializer_cls.subprotocol]
+
     async def _send_requests(self, channel: WebSocketChannel, channel_stream: MessageStream):
         # Send the initial requests
         for init_request in self._initial_requests:
@@ -354,6 +386,33 @@ class ExternalMessageConsumer:
 
         logger.debug(f"Consumed message from `{producer_name}` of type `RPCMessageType.WHITELIST`")
 
+    def _check_sequence(
+        self,
+        producer_name: str,
+        key: PairWithTimeframe,
+        seq: Optional[int]
+    ) -> int:
+        """
+        Track the sequence numbers of emitted dataframes.
+        Requested dataframes (and producers without sequence numbers) reset the tracking,
+        as they don't continue the sequence.
+
+        :param producer_name: The name of the producer
+        :param key: PairWithTimeframe of the message
+        :param seq: Sequence number of the message
+        :returns: Number of messages missed since the last message for this key
+        """
+        sequences = self._sequences.setdefault(producer_name, {})
+        last_seq = sequences.pop(key, None)
+        if seq is None:
+            return 0
+        sequences[key] = seq
+
+        # A lower sequence number means the producer restarted
+        if last_seq is None or seq <= last_seq:
+            return 0
+        return seq - last_seq - 1
+
     def _consume_analyzed_df_message(self, producer_name: str, message: WSMessageSchema):
         try:
             df_message = WSAnalyzedDFMessage.parse_obj(message)
@@ -367,6 +426,8 @@ class ExternalMessageConsumer:
 
         pair, timeframe, candle_type = key
 
+        missed_updates = self._check_sequence(producer_name, key, df_message.data.seq)
+
         if df.empty:
             logger.debug(f"Received Empty Dataframe for {key}")
             return
@@ -406,6 +467,22 @@ class ExternalMessageConsumer:
             )
             return
 
+        if missed_updates:
+            # The candles of the lost messages may have changed, replace the full dataframe
+            logger.warning(f"Missed {missed_updates} update(s) for {key} from "
+                           f"`{producer_name}`, requesting the full dataframe")
+
+            self.send_producer_request(
+                producer_name,
+                WSAnalyzedDFRequest(
+                    data={
+                        "limit": self.initial_candle_limit,
+                        "pair": pair
+                    }
+                )
+            )
+            return
+
         logger.debug(
             f"Consumed message from `{producer_name}` "
             f"of type `RPCMessageType.ANALYZED_DF` for {key}")
@@ -8,11 +8,13 @@ from math import isnan
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import arrow
+import orjson
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
 from numpy import NAN, inf, int64, mean
 from pandas import DataFrame, NaT
+from sqlalchemy import func
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
@@ -25,15 +27,27 @@ from freqtrade.exceptions import ExchangeError, PricingError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_msecs
 from freqtrade.loggers import bufferHandler
 from freqtrade.misc import decimals_per_coin, shorten_date
-from freqtrade.persistence import Order, PairLocks, Trade
+from freqtrade.persistence import LocalOrder, PairLocks, Trade
 from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.sql_functions import DateTrunc
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
+from freqtrade.util import LoopProfiler
 from freqtrade.wallets import PositionWallet, Wallet
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum amount of serialized /pair_candles responses (different limits) kept per pair
+MAX_PAIR_CANDLES_RESPONSES = 10
+
+
+def _pair_history_default(value: Any) -> str:
+    """ Serialize datetimes like the PairHistory api schema """
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_PRINT_FORMAT)
+    raise TypeError
+
 
 class RPCException(Exception):
     """
@@ -167,7 +181,7 @@ class RPC:
         else:
             results = []
             for trade in trades:
-                order: Optional[Order] = None
+                order: Optional[LocalOrder] = None
                 current_profit_fiat: Optional[float] = None
                 if trade.open_order_id:
                     order = trade.select_order_by_order_id(trade.open_order_id)
@@ -324,24 +338,31 @@ class RPC:
         profit_units: Dict[date, Dict] = {}
         daily_stake = self._freqtrade.wallets.get_total_stake_amount()
 
-        for day in range(0, timescale):
-            profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = Trade.query.session.query(Trade.close_profit_abs).filter(
+        # Aggregate profit and trade count of all periods in one query
+        period = DateTrunc(timeunit, Trade.close_date).label('period')
+        period_results = {
+            row.period: (row.profit or 0.0, row.trades)
+            for row in Trade.query.session.query(
+                period,
+                func.sum(Trade.close_profit_abs).label('profit'),
+                func.count(Trade.id).label('trades'),
+            ).filter(
                 Trade.is_open.is_(False),
-                Trade.close_date >= profitday,
-                Trade.close_date < (profitday + time_offset(1))
-            ).order_by(Trade.close_date).all()
+                Trade.close_date >= start_date - time_offset(timescale - 1),
+                Trade.close_date < start_date + time_offset(1),
+            ).group_by(period).all()
+        }
 
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None)
+        for day in range(0, timescale):
+            profitday = start_date - time_offset(day)
+            curdayprofit, trade_count = period_results.get(profitday, (0.0, 0))
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 'amount': curdayprofit,
                 'daily_stake': daily_stake,
                 'rel_profit': round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                'trades': len(trades),
+                'trades': trade_count,
             }
 
         data = [
@@ -1087,6 +1108,29 @@ class RPC:
         return self._convert_dataframe_to_dict(self._freqtrade.config['strategy'],
                                                pair, timeframe, _data, last_analyzed)
 
+    def _rpc_analysed_dataframe_json(self, pair: str, timeframe: str,
+                                     limit: Optional[int]) -> bytes:
+        """
+        Analyzed dataframe serialized to JSON.
+        Responses are cached until a new analyzed dataframe is available for the pair,
+        so repeated requests don't convert the dataframe again.
+        """
+        dataprovider = self._freqtrade.dataprovider
+        _, last_analyzed = dataprovider.get_analyzed_dataframe(pair, timeframe)
+        cache = dataprovider._get_response_cache(pair, timeframe)
+        key = (limit, last_analyzed)
+        # Requests run in a threadpool - other requests may clear the cache at any time.
+        response = cache.get(key)
+        if response is None:
+            response = orjson.dumps(
+                self._rpc_analysed_dataframe(pair, timeframe, limit),
+                default=_pair_history_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME)
+            if len(cache) >= MAX_PAIR_CANDLES_RESPONSES:
+                cache.clear()
+            cache[key] = response
+        return response
+
     def __rpc_analysed_dataframe_raw(
         self,
         pair: str,
@@ -1102,10 +1146,10 @@ class RPC:
         """
         _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(
             pair, timeframe)
-        _data = _data.copy()
-
         if limit:
             _data = _data.iloc[-limit:]
+        # Only copy the requested candles
+        _data = _data.copy()
 
         return _data, last_analyzed
 
@@ -1198,6 +1242,16 @@ class RPC:
             "ram_pct": psutil.virtual_memory().percent
         }
 
+    def _rpc_profile(self) -> Dict[str, Any]:
+        """
+        Rolling timings (in seconds) of bot loop phases, analysis per pair and exchange calls,
+        as well as latency statistics of the last candle refresh.
+        """
+        return {
+            **LoopProfiler.get_stats(),
+            'ohlcv_refresh': self._freqtrade.exchange.get_ohlcv_refresh_stats(),
+        }
+
     def _health(self) -> Dict[str, Union[str, int]]:
         last_p = self._freqtrade.last_process
         return {
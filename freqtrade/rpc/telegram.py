@@ -129,7 +129,7 @@ class Telegram(RPCHandler):
             r'/weekly$', r'/weekly \d+$', r'/monthly$', r'/monthly \d+$',
             r'/forcebuy$', r'/forcelong$', r'/forceshort$',
             r'/forcesell$', r'/forceexit$',
-            r'/edge$', r'/health$', r'/help$', r'/version$'
+            r'/edge$', r'/health$', r'/profile$', r'/help$', r'/version$'
         ]
         # Create keys for generation
         valid_keys_print = [k.replace('$', '') for k in valid_keys]
@@ -195,6 +195,7 @@ class Telegram(RPCHandler):
             CommandHandler('logs', self._logs),
             CommandHandler('edge', self._edge),
             CommandHandler('health', self._health),
+            CommandHandler('profile', self._profile),
             CommandHandler('help', self._help),
             CommandHandler('version', self._version),
         ]
@@ -1494,6 +1495,7 @@ class Telegram(RPCHandler):
             "*/count:* `Show number of active trades compared to allowed number of trades`\n"
             "*/edge:* `Shows validated pairs by Edge if it is enabled` \n"
             "*/health* `Show latest process timestamp - defaults to 1970-01-01 00:00:00` \n"
+            "*/profile:* `Show timings of the bot loop, the slowest pairs and exchange calls` \n"
 
             "_Statistics_\n"
             "------------\n"
@@ -1531,6 +1533,36 @@ class Telegram(RPCHandler):
         message = f"Last process: `{health['last_process_loc']}`"
         self._send_msg(message)
 
+    @authorized_only
+    def _profile(self, update: Update, context: CallbackContext) -> None:
+        """
+        Handler for /profile
+        Shows timings of the bot loop phases, the slowest pairs and exchange calls
+        """
+        profile = self._rpc._rpc_profile()
+        message = ''
+        for category, title, limit in (('phases', 'Phase', None),
+                                       ('pairs', 'Pair', 10),
+                                       ('exchange', 'Exchange call', 10)):
+            # Slowest first
+            timings = sorted(profile[category].items(), key=lambda x: x[1]['mean'],
+                             reverse=True)[:limit]
+            if not timings:
+                continue
+            table = tabulate(
+                [[name, f"{t['last'] * 1000:.1f}", f"{t['mean'] * 1000:.1f}",
+                  f"{t['max'] * 1000:.1f}"] for name, t in timings],
+                headers=[title, 'Last ms', 'Mean ms', 'Max ms'])
+            message += f"<pre>{table}</pre>\n"
+
+        refresh = profile['ohlcv_refresh']
+        if refresh:
+            message += (f"<b>Last candle refresh:</b> {refresh['requests']} requests in "
+                        f"{refresh['duration']:.2f}s, median latency "
+                        f"{refresh['latency_median']:.2f}s, "
+                        f"max latency {refresh['latency_max']:.2f}s\n")
+        self._send_msg(message or 'No timings recorded yet.', parse_mode=ParseMode.HTML)
+
     @authorized_only
     def _version(self, update: Update, context: CallbackContext) -> None:
         """
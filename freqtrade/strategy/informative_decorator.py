@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from pandas import DataFrame
 
@@ -9,6 +9,10 @@ from freqtrade.strategy.strategy_helper import merge_informative_pair
 
 
 PopulateIndicators = Callable[[Any, DataFrame, dict], DataFrame]
+# Populated informative dataframes, keyed on (populate function, asset, timeframe, candle type,
+# format).
+# Values hold a fingerprint of the raw informative candles the dataframe was built from.
+InformativeCache = Dict[Tuple, Tuple[Tuple, DataFrame]]
 
 
 @dataclass
@@ -73,6 +77,18 @@ def _format_pair_name(config, pair: str) -> str:
                        stake=config['stake_currency']).upper()
 
 
+def _candles_fingerprint(dataframe: DataFrame) -> Tuple:
+    """
+    Identify the state of an informative candle dataframe - changes whenever a candle is
+    added, or the last (possibly incomplete) candle is updated.
+    """
+    if dataframe.empty:
+        return (0, )
+    first = dataframe.iloc[0]
+    last = dataframe.iloc[-1]
+    return (len(dataframe), first['date'], last['date'], last['close'], last['volume'])
+
+
 def _create_and_merge_informative_pair(strategy, dataframe: DataFrame, metadata: dict,
                                        inf_data: InformativeData,
                                        populate_indicators: PopulateIndicators):
@@ -106,10 +122,6 @@ def _create_and_merge_informative_pair(strategy, dataframe: DataFrame, metadata:
         if inf_data.asset:
             fmt = '{base}_{quote}_' + fmt           # Informatives of other pairs
 
-    inf_metadata = {'pair': asset, 'timeframe': timeframe}
-    inf_dataframe = strategy.dp.get_pair_dataframe(asset, timeframe, candle_type)
-    inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
-
     formatter: Any = None
     if callable(fmt):
         formatter = fmt             # A custom user-specified formatter function.
@@ -124,14 +136,33 @@ def _create_and_merge_informative_pair(strategy, dataframe: DataFrame, metadata:
         'asset': asset,
         'timeframe': timeframe,
     }
-    inf_dataframe.rename(columns=lambda column: formatter(column=column, **fmt_args),
-                         inplace=True)
+
+    inf_metadata = {'pair': asset, 'timeframe': timeframe}
+    inf_dataframe = strategy.dp.get_pair_dataframe(asset, timeframe, candle_type)
+
+    # Informative timeframes are usually larger than the strategy timeframe - so most
+    # iterations don't bring a new informative candle, and the populated informative dataframe
+    # can be reused. Informatives of other assets (e.g. BTC/USDT) are also shared by all pairs.
+    cache: InformativeCache = strategy._ft_informative_cache
+    cache_key = (populate_indicators, asset, timeframe, candle_type, fmt)
+    fingerprint = _candles_fingerprint(inf_dataframe)
+    cached = cache.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        inf_dataframe = cached[1]
+    else:
+        inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
+        inf_dataframe.rename(columns=lambda column: formatter(column=column, **fmt_args),
+                             inplace=True)
+        cache[cache_key] = (fingerprint, inf_dataframe)
 
     date_column = formatter(column='date', **fmt_args)
     if date_column in dataframe.columns:
         raise OperationalException(f'Duplicate column name {date_column} exists in '
                                    f'dataframe! Ensure column names are unique!')
-    dataframe = merge_informative_pair(dataframe, inf_dataframe, strategy.timeframe, timeframe,
+    # merge_informative_pair() adds columns to the informative dataframe - a shallow copy keeps
+    # the cached dataframe untouched.
+    dataframe = merge_informative_pair(dataframe, inf_dataframe.copy(deep=False),
+                                       strategy.timeframe, timeframe,
                                        ffill=inf_data.ffill, append_timeframe=False,
                                        date_column=date_column)
     return dataframe
@@ -4,11 +4,12 @@ This module defines the interface to apply for strategies
 """
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
 import arrow
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade.constants import Config, IntOrInf, ListPairsWithTimeframes
 from freqtrade.data.dataprovider import DataProvider
@@ -19,10 +20,12 @@ from freqtrade.exchange import timeframe_to_minutes, timeframe_to_next_date, tim
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.strategy.hyper import HyperStrategyMixin
-from freqtrade.strategy.informative_decorator import (InformativeData, PopulateIndicators,
+from freqtrade.strategy.informative_decorator import (InformativeCache, InformativeData,
+                                                      PopulateIndicators,
                                                       _create_and_merge_informative_pair,
                                                       _format_pair_name)
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
+from freqtrade.util import LoopProfiler
 from freqtrade.wallets import Wallets
 
 
@@ -106,6 +109,10 @@ class IStrategy(ABC, HyperStrategyMixin):
     # Count of candles the strategy requires before producing valid signals
     startup_candle_count: int = 0
 
+    # Count of candles required to calculate indicators and signals of the latest candle.
+    # If set, only the last candles are analyzed when a new candle arrives.
+    lookback_candle_count: int = 0
+
     # Protections
     protections: List = []
 
@@ -130,6 +137,7 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         # Gather informative pairs from @informative-decorated methods.
         self._ft_informative: List[Tuple[InformativeData, PopulateIndicators]] = []
+        self._ft_informative_cache: InformativeCache = {}
         for attr_name in dir(self.__class__):
             cls_method = getattr(self.__class__, attr_name)
             if not callable(cls_method):
@@ -847,13 +855,8 @@ class IStrategy(ABC, HyperStrategyMixin):
         if not self.process_only_new_candles or new_candle:
 
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
-
-            self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
-
-            candle_type = self.config.get('candle_type_def', CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            dataframe = self._analyze_ticker_incremental(dataframe, metadata)
+            self._store_analyzed_dataframe(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -863,6 +866,53 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Analyze only the latest candles (plus lookback_candle_count candles) and combine them
+        with the previously analyzed dataframe.
+        Falls back to analyze_ticker() for the whole dataframe if incremental analysis is disabled
+        or the previous analysis doesn't match the candles.
+        The time spent is recorded per pair by LoopProfiler.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added
+        """
+        with LoopProfiler.timer('pairs', metadata['pair']):
+            lookback = self.lookback_candle_count
+            if lookback <= 0 or not self.process_only_new_candles:
+                return self.analyze_ticker(dataframe, metadata)
+
+            previous, _ = self.dp.get_analyzed_dataframe(metadata['pair'], self.timeframe)
+            if previous.empty:
+                return self.analyze_ticker(dataframe, metadata)
+            new_candles = int((dataframe['date'] > previous['date'].iloc[-1]).sum())
+            unchanged = len(dataframe) - new_candles
+            previous = previous.iloc[-unchanged:] if unchanged > 0 else previous.iloc[0:0]
+            if (new_candles == 0 or lookback + new_candles >= len(dataframe)
+                    or len(previous) != unchanged
+                    or previous['date'].iloc[0] != dataframe['date'].iloc[0]
+                    or previous['close'].iloc[-1] != dataframe['close'].iloc[unchanged - 1]):
+                return self.analyze_ticker(dataframe, metadata)
+
+            tail = dataframe.iloc[-(lookback + new_candles):].reset_index(drop=True)
+            tail = self.analyze_ticker(tail, metadata)
+            if list(tail.columns) != list(previous.columns):
+                # Columns depend on the data (or changed) - the cached analysis can't be extended.
+                return self.analyze_ticker(dataframe, metadata)
+            logger.debug(f"Analyzed {new_candles} new candle(s) for {metadata['pair']} "
+                         f"using {lookback} lookback candles.")
+            return concat([previous, tail.iloc[-new_candles:]], ignore_index=True)
+
+    def _store_analyzed_dataframe(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider and emit it to consumers.
+        """
+        self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
+
+        candle_type = self.config.get('candle_type_def', CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -895,12 +945,71 @@ class IStrategy(ABC, HyperStrategyMixin):
 
     def analyze(self, pairs: List[str]) -> None:
         """
-        Analyze all pairs using analyze_pair().
+        Analyze all pairs using analyze_pair() - or concurrently if `analysis_workers` is set.
         :param pairs: List of pairs to analyze
         """
+        self._prune_informative_cache(pairs)
+        # Don't report timings of pairs which left the whitelist
+        LoopProfiler.prune('pairs', pairs)
+        workers = self.config.get('analysis_workers', 1)
+        if workers > 1 and len(pairs) > 1 and not self.config.get('freqai', {}).get('enabled'):
+            self._analyze_concurrent(pairs, workers)
+            return
         for pair in pairs:
             self.analyze_pair(pair)
 
+    def _prune_informative_cache(self, pairs: List[str]) -> None:
+        """
+        Drop cached informative dataframes of assets which are no longer used -
+        so the cache doesn't grow with a dynamic whitelist.
+        :param pairs: Pairs which will be analyzed
+        """
+        assets = set(pairs)
+        assets.update(_format_pair_name(self.config, inf_data.asset)
+                      for inf_data, _ in self._ft_informative if inf_data.asset)
+        for key in [key for key in self._ft_informative_cache if key[1] not in assets]:
+            del self._ft_informative_cache[key]
+
+    def _analyze_concurrent(self, pairs: List[str], workers: int) -> None:
+        """
+        Analyze pairs using a thread pool.
+        Only analyze_ticker() runs in worker threads - results are checked, stored in the
+        dataprovider and emitted in the order of pairs, as with analyze_pair().
+        :param pairs: List of pairs to analyze
+        :param workers: Number of threads to use
+        """
+        candle_type = self.config.get('candle_type_def', CandleType.SPOT)
+        analyze_ticker = strategy_safe_wrapper(self._analyze_ticker_incremental, message="")
+        store_dataframe = strategy_safe_wrapper(self._store_analyzed_dataframe, message="")
+        pending: List[Tuple[str, bool, Tuple[int, float, datetime], Future]] = []
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analyze') as executor:
+            for pair in pairs:
+                dataframe = self.dp.ohlcv(pair, self.timeframe, candle_type=candle_type)
+                if not isinstance(dataframe, DataFrame) or dataframe.empty:
+                    logger.warning('Empty candle (OHLCV) data for pair %s', pair)
+                    continue
+                new_candle = (self._last_candle_seen_per_pair.get(pair, None)
+                              != dataframe.iloc[-1]['date'])
+                if self.process_only_new_candles and not new_candle:
+                    logger.debug("Skipping TA Analysis for already analyzed candle")
+                    continue
+                pending.append((pair, new_candle, self.preserve_df(dataframe),
+                                executor.submit(analyze_ticker, dataframe, {'pair': pair})))
+
+            for pair, new_candle, df_checks, future in pending:
+                try:
+                    dataframe = future.result()
+                    store_dataframe(pair, dataframe, new_candle)
+                    self.assert_df(dataframe, *df_checks)
+                except StrategyError as error:
+                    logger.warning(
+                        f"Unable to analyze candle (OHLCV) data for pair {pair}: {error}")
+                    continue
+
+                if dataframe.empty:
+                    logger.warning('Empty dataframe for pair %s', pair)
+
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
         """ keep some data for dataframes """
@@ -1302,8 +1411,13 @@ class IStrategy(ABC, HyperStrategyMixin):
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
         """
-        return {pair: self.advise_indicators(pair_data.copy(), {'pair': pair}).copy()
-                for pair, pair_data in data.items()}
+        # Parameters may have changed (e.g. hyperopt with --analyze-per-epoch).
+        self._ft_informative_cache.clear()
+        result = {pair: self.advise_indicators(pair_data.copy(), {'pair': pair}).copy()
+                  for pair, pair_data in data.items()}
+        # Cached informative dataframes are only reused within this call.
+        self._ft_informative_cache.clear()
+        return result
 
     def advise_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
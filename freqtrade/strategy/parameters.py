@@ -4,8 +4,8 @@ This module defines a base class for auto-hyperoptable strategies.
 """
 import logging
 from abc import ABC, abstractmethod
-from contextlib import suppress
-from typing import Any, Optional, Sequence, Union
+from contextlib import contextmanager, suppress
+from typing import Any, Iterator, Optional, Sequence, Set, Union
 
 from freqtrade.enums import HyperoptState
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
@@ -27,9 +27,10 @@ class BaseParameter(ABC):
     """
     category: Optional[str]
     default: Any
-    value: Any
     in_space: bool = False
     name: str
+    # Parameters read while track_reads() is active
+    _tracked_reads: Optional[Set['BaseParameter']] = None
 
     def __init__(self, *, default: Any, space: Optional[str] = None,
                  optimize: bool = True, load: bool = True, **kwargs):
@@ -54,6 +55,33 @@ class BaseParameter(ABC):
     def __repr__(self):
         return f'{self.__class__.__name__}({self.value})'
 
+    @property
+    def value(self) -> Any:
+        if BaseParameter._tracked_reads is not None:
+            BaseParameter._tracked_reads.add(self)
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+
+    @staticmethod
+    @contextmanager
+    def track_reads() -> Iterator[Set['BaseParameter']]:
+        """
+        Record all parameters whose value is read within this context.
+        Used to determine which parameters a strategy function depends on.
+        """
+        previous = BaseParameter._tracked_reads
+        reads: Set[BaseParameter] = set()
+        BaseParameter._tracked_reads = reads
+        try:
+            yield reads
+        finally:
+            BaseParameter._tracked_reads = previous
+            if previous is not None:
+                previous.update(reads)
+
     @abstractmethod
     def get_space(self, name: str) -> Union['Integer', 'Real', 'SKDecimal', 'Categorical']:
         """
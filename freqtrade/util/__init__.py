@@ -1,3 +1,4 @@
 # flake8: noqa: F401
 from freqtrade.util.ft_precise import FtPrecise
+from freqtrade.util.loop_profiler import LoopProfiler
 from freqtrade.util.periodic_cache import PeriodicCache
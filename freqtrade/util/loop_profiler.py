@@ -0,0 +1,100 @@
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, Iterable
+
+
+class ProfileTimer:
+    """
+    Context manager recording the time spent in its block to LoopProfiler.
+    """
+
+    __slots__ = ('category', 'name', 'start')
+
+    def __init__(self, category: str, name: str) -> None:
+        self.category = category
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> 'ProfileTimer':
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        LoopProfiler.record(self.category, self.name, perf_counter() - self.start)
+
+
+class LoopProfiler():
+    """
+    Rolling timings of the bot loop - phases of FreqtradeBot.process(), analysis per pair and
+    exchange calls.
+    Only the last `maxlen` durations are kept per timer, and recording only appends to a
+    bounded deque - so profiling is always enabled.
+    """
+
+    CATEGORIES = ('phases', 'pairs', 'exchange')
+    maxlen: int = 100
+    timings: Dict[str, Dict[str, Deque[float]]] = {}
+
+    @staticmethod
+    def timer(category: str, name: str) -> ProfileTimer:
+        """
+        Time a block of code:
+            with LoopProfiler.timer('phases', 'analyze'):
+                ...
+        :param category: One of CATEGORIES
+        :param name: Name of the timer (e.g. phase, pair or exchange method)
+        """
+        return ProfileTimer(category, name)
+
+    @staticmethod
+    def record(category: str, name: str, duration: float) -> None:
+        """
+        Record a duration (in seconds).
+        """
+        timers = LoopProfiler.timings.setdefault(category, {})
+        durations = timers.get(name)
+        if durations is None:
+            durations = timers.setdefault(name, deque(maxlen=LoopProfiler.maxlen))
+        durations.append(duration)
+
+    @staticmethod
+    def prune(category: str, names: Iterable[str]) -> None:
+        """
+        Remove timers of a category which are not in names -
+        e.g. pairs which are no longer in the whitelist.
+        """
+        keep = set(names)
+        timers = LoopProfiler.timings.get(category, {})
+        # Replace the dict instead of modifying it, as timers are read from other threads
+        LoopProfiler.timings[category] = {
+            name: durations for name, durations in timers.items() if name in keep}
+
+    @staticmethod
+    def get_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Summary of the recorded durations (in seconds) per category and timer.
+        Contains the number of recorded durations (limited to `maxlen`), last, mean and
+        max duration.
+        """
+        stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for category in LoopProfiler.CATEGORIES:
+            stats[category] = {}
+            # Copy, as timers are recorded from other threads
+            for name, durations in list(LoopProfiler.timings.get(category, {}).items()):
+                values = list(durations)
+                if not values:
+                    continue
+                stats[category][name] = {
+                    'count': len(values),
+                    'last': values[-1],
+                    'mean': sum(values) / len(values),
+                    'max': max(values),
+                }
+        return stats
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Remove all recorded durations.
+        """
+        LoopProfiler.timings = {}
@@ -376,6 +376,20 @@ class FtRestClient():
         """
         return self._get("health")
 
+    def profile(self):
+        """Return timings of bot loop phases, analysis per pair and exchange calls.
+
+        :return: json object
+        """
+        return self._get("profile")
+
+    def ws_channels(self):
+        """Return the connected message websocket channels and their send queue statistics.
+
+        :return: json object
+        """
+        return self._get("ws_channels")
+
 
 def add_arguments():
     parser = argparse.ArgumentParser()
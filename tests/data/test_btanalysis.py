@@ -1,16 +1,19 @@
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from arrow import Arrow
 from pandas import DataFrame, DateOffset, Timestamp, to_datetime
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import LAST_BT_RESULT_FN
 from freqtrade.data.btanalysis import (BT_DATA_COLUMNS, analyze_trade_parallelism,
                                        extract_trades_of_period, get_latest_backtest_filename,
                                        get_latest_hyperopt_file, load_backtest_data,
-                                       load_backtest_metadata, load_trades, load_trades_from_db)
+                                       load_backtest_metadata, load_trades, load_trades_from_db,
+                                       trade_list_to_dataframe)
 from freqtrade.data.history import load_data, load_pair_history
 from freqtrade.data.metrics import (calculate_cagr, calculate_calmar, calculate_csum,
                                     calculate_expectancy, calculate_market_change,
@@ -18,6 +21,7 @@ from freqtrade.data.metrics import (calculate_cagr, calculate_calmar, calculate_
                                     calculate_underwater, combine_dataframes_with_mean,
                                     create_cum_profit)
 from freqtrade.exceptions import OperationalException
+from freqtrade.persistence import Trade
 from tests.conftest import CURRENT_TEST_STRATEGY, create_mock_trades
 from tests.conftest_trades import MOCK_TRADE_COUNT
 
@@ -150,6 +154,40 @@ def test_load_trades_from_db(default_conf, fee, is_short, mocker):
     assert len(trades) == 0
 
 
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize('is_short', [False, True])
+def test_trade_list_to_dataframe(fee, is_short):
+    df = trade_list_to_dataframe([])
+    assert len(df) == 0
+    assert list(df.columns) == BT_DATA_COLUMNS
+
+    create_mock_trades(fee, is_short)
+    trades = Trade.get_trades().all()
+    # Contains open and closed trades
+    assert len({t.is_open for t in trades}) == 2
+
+    def expected_df(trades):
+        expected = DataFrame.from_records([t.to_json(True) for t in trades],
+                                          columns=BT_DATA_COLUMNS)
+        expected['close_date'] = to_datetime(expected['close_date'], utc=True)
+        expected['open_date'] = to_datetime(expected['open_date'], utc=True)
+        expected['close_rate'] = expected['close_rate'].astype('float64')
+        return expected
+
+    df = trade_list_to_dataframe(trades)
+    assert_frame_equal(df, expected_df(trades))
+
+    # Dates with sub-second precision (e.g. trades from the database)
+    closed = [t for t in trades if not t.is_open]
+    closed[0].open_date = datetime(2022, 1, 1, 10, 0, 0, 500000)
+    closed[0].close_date = datetime(2022, 1, 1, 10, 1, 0, 200000)
+    closed[1].open_date = datetime(2022, 1, 1, 10, 0, 0, 999999, tzinfo=timezone.utc)
+    closed[1].close_date = datetime(2022, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    df = trade_list_to_dataframe(trades)
+    assert_frame_equal(df, expected_df(trades))
+    assert df.loc[df['open_timestamp'] == 1641031200500, 'trade_duration'].tolist() == [0]
+
+
 def test_extract_trades_of_period(testdatadir):
     pair = "UNITTEST/BTC"
     # 2018-11-14 06:07:00
@@ -4,16 +4,19 @@ from pathlib import Path
 from shutil import copyfile
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (convert_ohlcv_format, convert_trades_format,
                                       ohlcv_fill_up_missing_data, ohlcv_to_dataframe,
-                                      reduce_dataframe_footprint, trades_dict_to_list,
-                                      trades_remove_duplicates, trades_to_ohlcv, trim_dataframe)
+                                      reduce_dataframe_footprint, trades_chunk_remove_duplicates,
+                                      trades_dict_to_list, trades_list_to_df,
+                                      trades_remove_duplicates, trades_to_ohlcv,
+                                      trades_to_ohlcv_chunk, trim_dataframe)
 from freqtrade.data.history import (get_timerange, load_data, load_pair_history,
                                     validate_backtest_data)
-from freqtrade.data.history.idatahandler import IDataHandler
+from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType
 from tests.conftest import generate_test_data, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -55,6 +58,55 @@ def test_trades_to_ohlcv(ohlcv_history_list, caplog):
     assert df.loc[:, 'high'][0] == 0.00141342
     assert df.loc[:, 'low'][0] == 0.00141266
 
+    # Typed DataFrames with only the required columns give the same result
+    trades_df = trades_list_to_df(trades)
+    assert trades_df['timestamp'].dtype == 'int64'
+    df1 = trades_to_ohlcv(trades_df[['timestamp', 'price', 'amount']], '1m')
+    assert df1.equals(df)
+
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_to_ohlcv(trades_df.iloc[0:0], '1m')
+
+
+def test_trades_to_ohlcv_chunk(testdatadir):
+    trades = trades_list_to_df(get_datahandler(testdatadir, 'jsongz').trades_load('XRP/ETH'))
+    expected = trades_to_ohlcv(trades, '5m').reset_index(drop=True)
+
+    pending = None
+    results = []
+    # Chunk boundaries within candles
+    for idx in range(0, len(trades), 333):
+        ohlcv, pending = trades_to_ohlcv_chunk(trades.iloc[idx:idx + 333], '5m', pending)
+        assert len(pending) == 1
+        results.append(ohlcv)
+    result = pd.concat(results + [pending], ignore_index=True)
+    assert result.equals(expected)
+
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_to_ohlcv_chunk(trades.iloc[0:0], '5m', pending)
+
+
+def test_trades_chunk_remove_duplicates():
+    trades = pd.DataFrame({
+        'timestamp': [1, 2, 2, 3, 3, 3, 3, 4, 4],
+        'id': ['1', '2', '2', '3', '4', '5', '3', '6', '7'],
+        'price': [1.0] * 9,
+        'amount': [1.0] * 9,
+    })
+    res, last = trades_chunk_remove_duplicates(trades.iloc[:4], None)
+    assert res['id'].tolist() == ['1', '2', '3']
+    assert last['id'].tolist() == ['3']
+    # Duplicate of the last trade of the previous chunk
+    res, last = trades_chunk_remove_duplicates(trades.iloc[4:7], last)
+    assert res['id'].tolist() == ['4', '5']
+    assert last['id'].tolist() == ['3', '4', '5']
+    res, last = trades_chunk_remove_duplicates(trades.iloc[6:7], last)
+    assert res.empty
+    assert last['id'].tolist() == ['3', '4', '5']
+    res, last = trades_chunk_remove_duplicates(trades.iloc[7:], last)
+    assert res['id'].tolist() == ['6', '7']
+    assert last['id'].tolist() == ['6', '7']
+
 
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(datadir=testdatadir,
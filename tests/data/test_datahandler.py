@@ -6,7 +6,8 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
@@ -16,7 +17,7 @@ from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler, g
 from freqtrade.data.history.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.parquetdatahandler import ParquetDataHandler
 from freqtrade.enums import CandleType, TradingMode
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_test_data, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -252,7 +253,7 @@ def test_datahandler__check_empty_df(testdatadir, caplog):
     assert log_has_re(expected_text, caplog)
 
 
-@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+@pytest.mark.parametrize('datahandler', ['parquet'])
 def test_datahandler_trades_not_supported(datahandler, testdatadir, ):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -284,7 +285,7 @@ def test_jsondatahandler_trades_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 1
 
 
-@pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize('datahandler', [dh for dh in AVAILABLE_DATAHANDLERS if dh != 'hdf5'])
 def test_datahandler_ohlcv_append(datahandler, testdatadir, ):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -360,6 +361,83 @@ def test_hdf5datahandler_trades_store(testdatadir, tmpdir):
     assert trades[-1][6] == trades_new[-1][6]
 
 
+def test_featherdatahandler_trades_store(testdatadir, tmpdir, mocker):
+    tmpdir1 = Path(tmpdir)
+    dh = get_datahandler(testdatadir, 'hdf5')
+    trades = dh.trades_load('XRP/ETH')
+
+    mocker.patch('freqtrade.data.history.featherdatahandler.TRADES_BATCH_SIZE', 100)
+    dh1 = get_datahandler(tmpdir1, 'feather')
+    dh1.trades_store('XRP/NEW', trades)
+    file = tmpdir1 / 'XRP_NEW-trades.feather'
+    assert file.is_file()
+    # Load trades back
+    trades_new = dh1.trades_load('XRP/NEW')
+    assert trades_new == trades
+
+    chunks = list(dh1.trades_iter('XRP/NEW', columns=['timestamp', 'price']))
+    assert len(chunks) == -(-len(trades) // 100)
+    assert list(chunks[0].columns) == ['timestamp', 'price']
+    assert chunks[0]['timestamp'].dtype == 'int64'
+    assert sum(len(c) for c in chunks) == len(trades)
+
+    # Batches outside of the timerange are skipped
+    start, stop = trades[150][0] // 1000, trades[250][0] // 1000
+    timerange = TimeRange('date', 'date', startts=start, stopts=stop)
+    chunks = list(dh1.trades_iter('XRP/NEW', timerange=timerange))
+    assert 1 < len(chunks) <= 3
+    trades_tr = dh1.trades_load('XRP/NEW', timerange=timerange)
+    assert trades_tr == [t for t in trades if start * 1000 <= t[0] < stop * 1000]
+
+    assert list(dh1.trades_iter('XRP/NOPAIR')) == []
+    assert dh1.trades_load('XRP/NOPAIR') == []
+
+
+def test_datahandler_trades_iter(testdatadir):
+    dh = get_datahandler(testdatadir, 'jsongz')
+    trades = dh.trades_load('XRP/ETH')
+    timerange = TimeRange('date', 'date', startts=trades[10][0] // 1000,
+                          stopts=trades[-10][0] // 1000)
+    chunks = list(dh.trades_iter('XRP/ETH', timerange=timerange, columns=['timestamp', 'amount']))
+    assert len(chunks) == 1
+    assert list(chunks[0].columns) == ['timestamp', 'amount']
+    assert chunks[0]['timestamp'].min() >= timerange.startts * 1000
+    assert chunks[0]['timestamp'].max() < timerange.stopts * 1000
+    assert chunks[0]['amount'].dtype == 'float64'
+
+
+def test_hdf5datahandler_ohlcv_append(testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    dh = get_datahandler(testdatadir, 'hdf5')
+    ohlcv = dh.ohlcv_load('UNITTEST/BTC', '5m', candle_type=CandleType.SPOT)
+
+    dh1 = get_datahandler(tmpdir1, 'hdf5')
+    dh1.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[:100], CandleType.SPOT)
+    dh1.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[100:], CandleType.SPOT)
+    ohlcv_new = dh1.ohlcv_load('UNITTEST/NEW', '5m', candle_type=CandleType.SPOT)
+    assert ohlcv_new.equals(ohlcv)
+
+
+def test_hdf5datahandler_trades_iter(testdatadir, mocker):
+    mocker.patch('freqtrade.data.history.hdf5datahandler.TRADES_BATCH_SIZE', 100)
+    dh = get_datahandler(testdatadir, 'hdf5')
+    trades = dh.trades_load('XRP/ETH')
+
+    chunks = list(dh.trades_iter('XRP/ETH', columns=['timestamp', 'price', 'amount']))
+    assert len(chunks) == -(-len(trades) // 100)
+    assert list(chunks[0].columns) == ['timestamp', 'price', 'amount']
+    assert sum(len(c) for c in chunks) == len(trades)
+    assert chunks[-1]['timestamp'].iloc[-1] == trades[-1][0]
+
+    timerange = TimeRange('date', 'date', startts=trades[150][0] // 1000,
+                          stopts=trades[250][0] // 1000)
+    chunks = list(dh.trades_iter('XRP/ETH', timerange=timerange))
+    expected = [t for t in trades if timerange.startts * 1000 <= t[0] < timerange.stopts * 1000]
+    assert sum(len(c) for c in chunks) == len(expected)
+
+    assert list(dh.trades_iter('XRP/NOPAIR')) == []
+
+
 def test_hdf5datahandler_trades_purge(mocker, testdatadir):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
     unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
@@ -496,6 +574,48 @@ def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 2
 
 
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_datahandler_ohlcv_load_timerange_batches(datahandler, testdatadir, tmpdir, mocker):
+    mocker.patch(f'freqtrade.data.history.{datahandler}datahandler.OHLCV_BATCH_SIZE', 1000)
+    ohlcv = generate_test_data('1h', 5000, '2020-01-01')
+    dh = get_datahandler(Path(tmpdir), datahandler)
+    dh.ohlcv_store('UNITTEST/NEW', '1h', ohlcv, CandleType.SPOT)
+
+    ohlcv1 = dh._ohlcv_load('UNITTEST/NEW', '1h', None, candle_type=CandleType.SPOT)
+    assert ohlcv1.equals(ohlcv)
+
+    # 2020-03-01 to 2020-03-15 is within the 2nd batch of 1000 candles
+    timerange = TimeRange.parse_timerange('20200301-20200315')
+    ohlcv2 = dh._ohlcv_load('UNITTEST/NEW', '1h', timerange, candle_type=CandleType.SPOT)
+    assert 14 * 24 < len(ohlcv2) <= 1000
+    assert ohlcv2['date'].min() <= Timestamp('2020-03-01', tz='UTC')
+    assert ohlcv2['date'].max() >= Timestamp('2020-03-15', tz='UTC')
+
+    # Result including startup candles matches the json datahandler
+    dhjson = get_datahandler(Path(tmpdir), 'json')
+    dhjson.ohlcv_store('UNITTEST/NEW', '1h', ohlcv, CandleType.SPOT)
+    ohlcv3 = dh.ohlcv_load('UNITTEST/NEW', '1h', CandleType.SPOT, timerange=timerange,
+                           startup_candles=30)
+    expected = dhjson.ohlcv_load('UNITTEST/NEW', '1h', CandleType.SPOT, timerange=timerange,
+                                 startup_candles=30)
+    assert ohlcv3['date'].iloc[0] == Timestamp('2020-02-28 18:00', tz='UTC')
+    assert_frame_equal(ohlcv3, expected)
+
+    timerange = TimeRange.parse_timerange('20220301-20220315')
+    assert dh._ohlcv_load('UNITTEST/NEW', '1h', timerange, candle_type=CandleType.SPOT).empty
+
+
+def test_featherdatahandler_ohlcv_load_without_batch_ranges(tmpdir):
+    ohlcv = generate_test_data('1h', 100, '2020-01-01')
+    dh = get_datahandler(Path(tmpdir), 'feather')
+    # Files written by older versions
+    filename = dh._pair_data_filename(Path(tmpdir), 'UNITTEST/NEW', '1h', CandleType.SPOT)
+    ohlcv.to_feather(filename)
+    timerange = TimeRange.parse_timerange('20200102-20200103')
+    ohlcv1 = dh._ohlcv_load('UNITTEST/NEW', '1h', timerange, candle_type=CandleType.SPOT)
+    assert ohlcv1.equals(ohlcv)
+
+
 def test_gethandlerclass():
     cl = get_datahandlerclass('json')
     assert cl == JsonDataHandler
@@ -221,6 +221,46 @@ def test_emit_df(mocker, default_conf, ohlcv_history):
     assert send_mock.call_count == 0
 
 
+def test_emit_df_delta(default_conf):
+    rpc_mock = MagicMock()
+    dataprovider = DataProvider(default_conf, exchange=None, rpc=rpc_mock)
+    pair_key = ('BTC/USDT', '5m', CandleType.SPOT)
+    df = generate_test_data('5m', 250)
+
+    def emitted():
+        data = rpc_mock.send_msg.call_args_list[0][0][0]['data']
+        rpc_mock.send_msg.reset_mock()
+        return data['df'], data['seq']
+
+    # First emit only contains the last candle
+    dataprovider._emit_df(pair_key, df.iloc[:100], True)
+    delta, seq = emitted()
+    assert seq == 1
+    assert delta['date'].tolist() == [df.iloc[99]['date']]
+
+    # Updated candle
+    dataprovider._emit_df(pair_key, df.iloc[:100], False)
+    delta, seq = emitted()
+    assert seq == 2
+    assert delta['date'].tolist() == [df.iloc[99]['date']]
+
+    # All candles appended since the last emit
+    dataprovider._emit_df(pair_key, df.iloc[:103], True)
+    delta, seq = emitted()
+    assert seq == 3
+    assert delta['date'].tolist() == df.iloc[100:103]['date'].tolist()
+
+    # Too many candles appended - consumers request the dataframe
+    dataprovider._emit_df(pair_key, df, True)
+    delta, seq = emitted()
+    assert seq == 4
+    assert delta['date'].tolist() == [df.iloc[-1]['date']]
+
+    # Sequence numbers are tracked per pair_key
+    dataprovider._emit_df(('ETH/USDT', '5m', CandleType.SPOT), df, True)
+    assert emitted()[1] == 1
+
+
 def test_refresh(mocker, default_conf):
     refresh_mock = MagicMock()
     mocker.patch("freqtrade.exchange.Exchange.refresh_latest_ohlcv", refresh_mock)
@@ -366,6 +406,27 @@ def test_get_analyzed_dataframe(mocker, default_conf, ohlcv_history):
     assert len(dataframe) == len(ohlcv_history)
 
 
+def test_get_response_cache(default_conf, ohlcv_history):
+    timeframe = default_conf["timeframe"]
+    dp = DataProvider(default_conf, None)
+    dp._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+    dp._set_cached_df("UNITTEST/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+
+    cache = dp._get_response_cache("XRP/BTC", timeframe)
+    assert cache == {}
+    cache['key'] = b'data'
+    assert dp._get_response_cache("XRP/BTC", timeframe) == {'key': b'data'}
+    dp._get_response_cache("UNITTEST/BTC", timeframe)['key'] = b'data'
+
+    # Storing a new dataframe invalidates the cache of this pair only
+    dp._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+    assert dp._get_response_cache("XRP/BTC", timeframe) == {}
+    assert dp._get_response_cache("UNITTEST/BTC", timeframe) == {'key': b'data'}
+
+    dp.clear_cache()
+    assert dp._get_response_cache("UNITTEST/BTC", timeframe) == {}
+
+
 def test_no_exchange_mode(default_conf):
     dp = DataProvider(default_conf, None)
 
@@ -13,7 +13,7 @@ from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
-from freqtrade.data.converter import ohlcv_to_dataframe
+from freqtrade.data.converter import ohlcv_to_dataframe, trades_list_to_df, trades_to_ohlcv
 from freqtrade.data.history.history_utils import (_download_pair_history, _download_trades_history,
                                                   _load_cached_data_for_updating,
                                                   convert_trades_to_ohlcv, get_timerange, load_data,
@@ -26,8 +26,8 @@ from freqtrade.enums import CandleType
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import file_dump_json
 from freqtrade.resolvers import StrategyResolver
-from tests.conftest import (CURRENT_TEST_STRATEGY, get_patched_exchange, log_has, log_has_re,
-                            patch_exchange)
+from tests.conftest import (CURRENT_TEST_STRATEGY, generate_test_data, get_patched_exchange,
+                            log_has, log_has_re, patch_exchange)
 
 
 def _clean_test_file(file: Path) -> None:
@@ -76,6 +76,27 @@ def test_load_data_1min_timeframe(ohlcv_history, mocker, caplog, testdatadir) ->
     )
 
 
+def test_load_data_parallel(caplog, testdatadir) -> None:
+    pairs = ['UNITTEST/BTC', 'XLM/BTC', 'NOPAIR/XXX', 'ETH/BTC']
+    progress = MagicMock()
+    expected = load_data(datadir=testdatadir, timeframe='5m', pairs=pairs,
+                         progress_callback=progress)
+    assert progress.call_count == 4
+    assert list(expected.keys()) == ['UNITTEST/BTC', 'XLM/BTC', 'ETH/BTC']
+
+    progress.reset_mock()
+    caplog.clear()
+    data = load_data(datadir=testdatadir, timeframe='5m', pairs=pairs, jobs=2,
+                     progress_callback=progress)
+    assert log_has('Loading 4 pairs using 2 processes.', caplog)
+    # Logs of the worker processes are handled by the main process
+    assert log_has_re(r'No history for NOPAIR/XXX, .*5m found\..*', caplog)
+    assert progress.call_count == 4
+    assert list(data.keys()) == list(expected.keys())
+    for pair, df in expected.items():
+        assert_frame_equal(data[pair], df)
+
+
 def test_load_data_mark(ohlcv_history, mocker, caplog, testdatadir) -> None:
     mocker.patch('freqtrade.exchange.Exchange.get_historic_ohlcv', return_value=ohlcv_history)
     file = testdatadir / 'futures/UNITTEST_USDT_USDT-1h-mark.json'
@@ -664,3 +685,72 @@ def test_convert_trades_to_ohlcv(testdatadir, tmpdir, caplog):
     convert_trades_to_ohlcv(['NoDatapair'], timeframes=['1m', '5m'],
                             datadir=tmpdir1, timerange=tr, erase=True)
     assert log_has('Could not convert NoDatapair to OHLCV.', caplog)
+
+
+@pytest.mark.parametrize('data_format_ohlcv', ['hdf5', 'json'])
+def test_convert_trades_to_ohlcv_keeps_data(testdatadir, tmpdir, mocker, caplog,
+                                            data_format_ohlcv):
+    tmpdir1 = Path(tmpdir)
+    dh = get_datahandler(tmpdir1, data_format_ohlcv)
+    candles = generate_test_data('5m', 50, '2022-01-01')
+    dh.ohlcv_store('XRP/ETH', '5m', candles, candle_type=CandleType.SPOT)
+
+    # No trades available
+    convert_trades_to_ohlcv(['XRP/ETH'], timeframes=['5m'], datadir=tmpdir1,
+                            timerange=TimeRange(), data_format_ohlcv=data_format_ohlcv,
+                            data_format_trades='hdf5')
+    assert log_has('Could not convert XRP/ETH to OHLCV.', caplog)
+    df = dh.ohlcv_load('XRP/ETH', '5m', candle_type=CandleType.SPOT, fill_missing=False)
+    assert len(df) == 50
+
+    # Conversion failing after some candles were converted
+    def failing_stream(*args, **kwargs):
+        yield '5m', candles.iloc[:10]
+        raise ValueError('Failed')
+
+    mocker.patch('freqtrade.data.history.history_utils._trades_to_ohlcv_stream', failing_stream)
+    convert_trades_to_ohlcv(['XRP/ETH'], timeframes=['5m'], datadir=tmpdir1,
+                            timerange=TimeRange(), data_format_ohlcv=data_format_ohlcv,
+                            data_format_trades='hdf5')
+    df = dh.ohlcv_load('XRP/ETH', '5m', candle_type=CandleType.SPOT, fill_missing=False)
+    assert len(df) == 50
+    # Temporary files are removed
+    assert not list(tmpdir1.glob('.convert-*'))
+
+
+@pytest.mark.parametrize('data_format_ohlcv', ['hdf5', 'json'])
+def test_convert_trades_to_ohlcv_chunked(testdatadir, tmpdir, mocker, data_format_ohlcv):
+    tmpdir1 = Path(tmpdir)
+    copyfile(testdatadir / 'XRP_ETH-trades.h5', tmpdir1 / 'XRP_ETH-trades.h5')
+    dh_trades = get_datahandler(tmpdir1, 'hdf5')
+    dh_trades.trades_store('XRP/OLD', dh_trades.trades_load('XRP/ETH'))
+    trades = trades_list_to_df(dh_trades.trades_load('XRP/ETH'))
+    mocker.patch('freqtrade.data.history.hdf5datahandler.TRADES_BATCH_SIZE', 2000)
+
+    convert_trades_to_ohlcv(['XRP/ETH'], timeframes=['1m', '5m'], datadir=tmpdir1,
+                            timerange=TimeRange(), data_format_ohlcv=data_format_ohlcv,
+                            data_format_trades='hdf5')
+    dh = get_datahandler(tmpdir1, data_format_ohlcv)
+    for timeframe in ['1m', '5m']:
+        df = dh.ohlcv_load('XRP/ETH', timeframe, candle_type=CandleType.SPOT, fill_missing=False)
+        expected = trades_to_ohlcv(trades, timeframe).reset_index(drop=True)
+        assert_frame_equal(df, expected, check_dtype=False)
+
+    # Rerunning (in parallel) doesn't duplicate appended data
+    convert_trades_to_ohlcv(['XRP/ETH', 'XRP/OLD'], timeframes=['5m'], datadir=tmpdir1,
+                            timerange=TimeRange(), data_format_ohlcv=data_format_ohlcv,
+                            data_format_trades='hdf5', jobs=2)
+    for pair in ['XRP/ETH', 'XRP/OLD']:
+        df = dh.ohlcv_load(pair, '5m', candle_type=CandleType.SPOT, fill_missing=False)
+        assert len(df) == len(trades_to_ohlcv(trades, '5m'))
+
+    # Duplicate trades (within and across chunks) don't add volume
+    trades_list = dh_trades.trades_load('XRP/ETH')
+    dh_trades.trades_store(
+        'XRP/DUP', sorted(trades_list + trades_list[::3], key=lambda t: (t[0], t[1])))
+    convert_trades_to_ohlcv(['XRP/DUP'], timeframes=['5m'], datadir=tmpdir1,
+                            timerange=TimeRange(), data_format_ohlcv=data_format_ohlcv,
+                            data_format_trades='hdf5')
+    df = dh.ohlcv_load('XRP/DUP', '5m', candle_type=CandleType.SPOT, fill_missing=False)
+    assert_frame_equal(df, trades_to_ohlcv(trades, '5m').reset_index(drop=True),
+                       check_dtype=False)
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import logging
 from copy import deepcopy
@@ -2345,6 +2346,99 @@ async def test__async_get_candle_history_empty(default_conf, mocker, caplog):
     assert exchange._api_async.fetch_ohlcv.call_count == 1
 
 
+def test_refresh_latest_ohlcv_streaming(default_conf, mocker, caplog):
+    caplog.set_level(logging.DEBUG)
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._ft_has['ohlcv_concurrent_requests'] = 2
+    pairs = [(pair, '5m', CandleType.SPOT)
+             for pair in ['ETH/BTC', 'LTC/BTC', 'XRP/BTC', 'NEO/BTC', 'TKN/BTC']]
+    # Informative pair which is also whitelisted - requested once, as whitelisted pair
+    pair_list = pairs + [pairs[2]]
+    latency = {'ETH/BTC': 0.3, 'LTC/BTC': 0.01, 'XRP/BTC': 0.01, 'NEO/BTC': 0.01, 'TKN/BTC': 0.01}
+    started = []
+    running = 0
+    max_running = 0
+
+    async def fetch_ohlcv(pair, *args, **kwargs):
+        nonlocal running, max_running
+        started.append(pair)
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(latency[pair])
+        running -= 1
+        if pair == 'TKN/BTC':
+            raise ccxt.NetworkError('Network error')
+        return generate_test_data_raw('5m', 10, '2022-01-01')
+
+    exchange._api_async.fetch_ohlcv = fetch_ohlcv
+    process_mock = mocker.spy(exchange, '_process_ohlcv_df')
+
+    res = exchange.refresh_latest_ohlcv(pair_list, cache=False)
+    assert list(res.keys()) == [p for p in pairs if p[0] not in ('ETH/BTC', 'TKN/BTC')] + [pairs[0]]
+    # Requests are started in the order of the pairlist, limited to 2 at a time.
+    assert started[:len(pairs)] == [p[0] for p in pairs]
+    assert max_running == 2
+    # Results are processed as soon as they arrive - the slow pair doesn't block others
+    assert process_mock.call_args_list[0][0][0] == 'LTC/BTC'
+    assert process_mock.call_args_list[-1][0][0] == 'ETH/BTC'
+    assert log_has_re(r"Async code raised an exception: .*NetworkError", caplog)
+
+    stats = exchange.get_ohlcv_refresh_stats()
+    assert stats['requests'] == len(pairs)
+    assert stats['duration'] >= stats['latency_max'] >= 0.3
+    assert sum(stats['latency_histogram'].values()) == len(pairs)
+    assert stats['latency_histogram']['0.1'] == 4
+    assert stats['latency_histogram']['0.5'] == 1
+    assert log_has_re(r"Refreshed 5 candle requests in .*", caplog)
+
+
+def test_refresh_latest_ohlcv_streaming_cancelled(default_conf, mocker, caplog):
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._ft_has['ohlcv_concurrent_requests'] = 2
+    pairs = [(pair, '5m', CandleType.SPOT) for pair in ['ETH/BTC', 'LTC/BTC', 'XRP/BTC']]
+
+    async def fetch_ohlcv(pair, *args, **kwargs):
+        await asyncio.sleep(0.01)
+        if pair == 'ETH/BTC':
+            raise asyncio.CancelledError()
+        return generate_test_data_raw('5m', 10, '2022-01-01')
+
+    exchange._api_async.fetch_ohlcv = fetch_ohlcv
+    # A cancelled request doesn't abort the refresh of other pairs
+    res = exchange.refresh_latest_ohlcv(pairs, cache=False)
+    assert list(res.keys()) == pairs[1:]
+    assert log_has_re(r"Async code raised an exception: CancelledError.*", caplog)
+
+    # Pending requests are cancelled and awaited if processing a result fails
+    async def fetch(pair):
+        await asyncio.sleep(0.01 if pair == 'ETH/BTC' else 1)
+        return pair, '5m', CandleType.SPOT, [], True
+
+    with pytest.raises(ValueError, match='Processing failed'):
+        exchange.loop.run_until_complete(exchange._stream_ohlcv_requests(
+            [fetch(pair) for pair, _, _ in pairs],
+            MagicMock(side_effect=ValueError('Processing failed'))))
+    assert all(task.done() for task in asyncio.all_tasks(exchange.loop))
+
+    # Cancelling the refresh itself is not turned into a result
+    async def cancel_refresh(process_result):
+        stream = asyncio.ensure_future(exchange._stream_ohlcv_requests(
+            [fetch(pair) for pair, _, _ in pairs], process_result))
+        # Requests are running
+        await asyncio.sleep(0.005)
+        for task in asyncio.all_tasks():
+            if task.get_coro().__name__ == 'limited':
+                task.cancel()
+        await stream
+
+    exchange._ft_has['ohlcv_concurrent_requests'] = 3
+    process_result = MagicMock()
+    with pytest.raises(asyncio.CancelledError):
+        exchange.loop.run_until_complete(cancel_refresh(process_result))
+    assert process_result.call_count == 0
+    assert all(task.done() for task in asyncio.all_tasks(exchange.loop))
+
+
 def test_refresh_latest_ohlcv_inv_result(default_conf, mocker, caplog):
 
     async def mock_get_candle_hist(pair, *args, **kwargs):
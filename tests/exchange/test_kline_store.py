@@ -0,0 +1,90 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame, concat
+
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.enums import CandleType
+from freqtrade.exchange.kline_store import KlineStore
+from tests.conftest import generate_test_data, log_has_re
+
+
+KEY = ('XRP/USDT', '5m', CandleType.SPOT)
+
+
+def _merge_reference(old: DataFrame, new: DataFrame, max_length: int) -> DataFrame:
+    # Behaviour of Exchange._process_ohlcv_df prior to KlineStore
+    df = clean_ohlcv_dataframe(concat([old, new], axis=0), '5m', 'XRP/USDT',
+                               fill_missing=True, drop_incomplete=False)
+    return df.tail(max_length).reset_index(drop=True)
+
+
+def test_kline_store_mapping():
+    store = KlineStore()
+    assert not store
+    df = generate_test_data('5m', 10)
+    store[KEY] = df
+    assert KEY in store
+    assert store[KEY] is df
+    assert list(store.keys()) == [KEY]
+    assert len(store) == 1
+    del store[KEY]
+    assert KEY not in store
+
+    # First refresh stores candles unchanged
+    assert store.merge_candles(KEY, df, 5) is df
+    assert store[KEY] is df
+
+
+@pytest.mark.parametrize('max_length', [30, 300])
+def test_kline_store_merge_candles(max_length, caplog):
+    caplog.set_level(logging.DEBUG)
+    data = generate_test_data('5m', 400, '2023-01-01 00:00:00+00:00')
+    store = KlineStore()
+    store[KEY] = data.iloc[:100]
+    expected = data.iloc[:100]
+
+    def merge(new):
+        nonlocal expected
+        expected = _merge_reference(expected, new, max_length)
+        result = store.merge_candles(KEY, new.reset_index(drop=True), max_length)
+        pd.testing.assert_frame_equal(result, expected)
+        assert store[KEY] is result
+
+    # Regular refreshes - overlapping with the last candles, appending one or more candles.
+    for start in range(98, 350, 2):
+        merge(data.iloc[start:start + 4])
+
+    # Updated (incomplete) last candle
+    last = data.iloc[[352]].copy()
+    last[['open', 'high', 'low', 'close', 'volume']] = [1.0, 1000.0, 0.01, 2.0, 1e9]
+    merge(last)
+    # Missing values don't overwrite known values
+    last[['open', 'high', 'low', 'close', 'volume']] = np.nan
+    merge(last)
+    # No new candles
+    merge(data.iloc[0:0])
+    # All of the above is merged in place
+    assert not log_has_re('Rebuilding candle cache', caplog)
+
+    # Gap - missing candles are filled up
+    merge(data.iloc[360:362])
+    assert log_has_re('Rebuilding candle cache', caplog)
+    # Candles before the stored candles
+    merge(data.iloc[0:2])
+
+
+def test_kline_store_merge_candles_fallback():
+    store = KlineStore()
+    data = generate_test_data('5m', 20)
+    # Unexpected columns are combined the regular way
+    store[KEY] = data.iloc[:10].assign(extra=1)
+    result = store.merge_candles(KEY, data.iloc[9:12], 100)
+    assert len(result) == 12
+    assert result.iloc[-1]['close'] == data.iloc[11]['close']
+
+    # Empty cache
+    store[KEY] = DataFrame(columns=data.columns)
+    pd.testing.assert_frame_equal(store.merge_candles(KEY, data, 100), data, check_dtype=False)
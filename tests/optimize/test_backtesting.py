@@ -19,14 +19,18 @@ from freqtrade.data.btanalysis import BT_DATA_COLUMNS, evaluate_result_multi
 from freqtrade.data.converter import clean_ohlcv_dataframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
-from freqtrade.enums import CandleType, ExitType, RunMode
+from freqtrade.enums import CandleType, ExitType, RunMode, TradingMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange.exchange import timeframe_to_next_date
-from freqtrade.optimize.backtest_caching import get_strategy_run_id
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtest_caching import (AnalyzedDataCache, get_strategy_analysis_id,
+                                                 get_strategy_run_id)
+from freqtrade.optimize.backtesting import Backtesting, _backtest_strategy
+from freqtrade.optimize.indicator_cache import IndicatorCache, get_strategy_indicator_id
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
-from tests.conftest import (CURRENT_TEST_STRATEGY, get_args, log_has, log_has_re, patch_exchange,
+from freqtrade.strategy.interface import IStrategy
+from tests.conftest import (CURRENT_TEST_STRATEGY, generate_test_data, get_args, get_markets,
+                            log_has, log_has_re, patch_exchange,
                             patched_configuration_load_config_file)
 
 
@@ -764,8 +768,11 @@ def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
 
 
 @pytest.mark.parametrize('use_detail', [True, False])
-def test_backtest_one_detail(default_conf_usdt, fee, mocker, testdatadir, use_detail) -> None:
+@pytest.mark.parametrize('engine', constants.BACKTEST_ENGINES)
+def test_backtest_one_detail(default_conf_usdt, fee, mocker, testdatadir, use_detail,
+                             engine) -> None:
     default_conf_usdt['use_exit_signal'] = False
+    default_conf_usdt['backtest_engine'] = engine
     mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
     mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
     mocker.patch("freqtrade.exchange.Exchange.get_max_pair_stake_amount", return_value=float('inf'))
@@ -1004,6 +1011,36 @@ def test_backtest_one_detail_futures_funding_fees(
         assert -20 < t.funding_fees < -0.1
 
 
+def test_backtest_detail_arrays(default_conf, mocker, testdatadir) -> None:
+    patch_exchange(mocker)
+    default_conf['timeframe_detail'] = '1m'
+    backtesting = Backtesting(default_conf)
+    data = history.load_data(datadir=testdatadir, timeframe='1m', pairs=['UNITTEST/BTC'])
+    backtesting.detail_data = data
+    detail = backtesting._detail_arrays['UNITTEST/BTC']
+    df = data['UNITTEST/BTC']
+    assert len(detail.dates_ns) == len(df)
+    assert detail.values.shape == (len(df), 4)
+
+    start = df.iloc[13]['date']
+    end = start + timedelta(minutes=5)
+    lower, upper = detail.get_offsets(start, 5 * 60 * 10 ** 9)
+    expected = df.loc[(df['date'] >= start) & (df['date'] < end)]
+    assert upper - lower == len(expected) == 5
+    assert detail.dates[lower] == expected.iloc[0]['date']
+    assert detail.values[lower:upper].tolist() == expected[
+        ['open', 'high', 'low', 'close']].values.tolist()
+
+    # Before and after the available data
+    assert detail.get_offsets(df.iloc[0]['date'] - timedelta(hours=1), 5 * 60 * 10 ** 9) == (0, 0)
+    assert detail.get_offsets(df.iloc[-1]['date'] + timedelta(hours=1), 5 * 60 * 10 ** 9) == (
+        len(df), len(df))
+
+    # Empty dataframes are not indexed
+    backtesting.detail_data = {'UNITTEST/BTC': pd.DataFrame(columns=df.columns)}
+    assert backtesting._detail_arrays == {}
+
+
 def test_backtest_timedout_entry_orders(default_conf, fee, mocker, testdatadir) -> None:
     # This strategy intentionally places unfillable orders.
     default_conf['strategy'] = 'StrategyTestV3CustomEntryPrice'
@@ -1366,6 +1403,137 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results['results'], '5m', 1)) == 0
 
 
+@pytest.mark.parametrize("tres", [0, 20])
+@pytest.mark.parametrize("max_open_trades", [1, 3])
+def test_backtest_columnar_engine(default_conf, fee, mocker, testdatadir, tres, max_open_trades):
+
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata['pair'] in ('ETH/BTC', 'LTC/BTC') else 18
+        dataframe['enter_long'] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe['exit_long'] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe['enter_short'] = 0
+        dataframe['exit_short'] = 0
+        return dataframe
+
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch("freqtrade.exchange.Exchange.get_max_pair_stake_amount", return_value=float('inf'))
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    data = trim_dictlist(data, -500)
+    if tres > 0:
+        # Missing start and a gap in the middle of the data
+        data['LTC/BTC'] = data['LTC/BTC'][tres:].reset_index()
+        data['ADA/BTC'] = data['ADA/BTC'].drop(data['ADA/BTC'].index[200:200 + tres])
+    default_conf['timeframe'] = '5m'
+    default_conf['max_open_trades'] = max_open_trades
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf['backtest_engine'] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+        assert backtesting.backtest_engine == engine
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+
+    assert len(results['loop']['results']) > 0
+    pd.testing.assert_frame_equal(results['loop']['results'], results['columnar']['results'])
+    for key in ('rejected_signals', 'timedout_entry_orders', 'final_balance'):
+        assert results['loop'][key] == results['columnar'][key]
+
+
+@pytest.mark.parametrize("strategy_conf", [
+    {},
+    {'stoploss': -0.01},
+    {'minimal_roi': {'0': 0.01, '20': 0.005, '60': -1}},
+    {'trailing_stop': True},
+    {'trailing_stop': True, 'trailing_stop_positive': 0.005,
+     'trailing_stop_positive_offset': 0.01, 'trailing_only_offset_is_reached': True},
+    {'trailing_stop': True, 'trailing_stop_positive': 0.02, 'stoploss': -0.01},
+    {'use_exit_signal': False, 'minimal_roi': {'0': 0.02}, 'stoploss': -0.02},
+    {'exit_profit_only': True, 'ignore_roi_if_entry_signal': True},
+    {'position_stacking': True, 'max_open_trades': 10},
+])
+def test_backtest_columnar_fast_exits(default_conf, fee, mocker, testdatadir, strategy_conf):
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch("freqtrade.exchange.Exchange.get_max_pair_stake_amount", return_value=float('inf'))
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs), -1000)
+    default_conf.update({'timeframe': '5m', 'max_open_trades': 3, 'stake_amount': 0.01})
+    default_conf.update(strategy_conf)
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf['backtest_engine'] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        assert backtesting._fast_exits_supported()
+        check_exit = mocker.spy(backtesting, '_check_trade_exit')
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+        results[engine]['check_exit_calls'] = check_exit.call_count
+
+    assert len(results['loop']['results']) > 0
+    pd.testing.assert_frame_equal(results['loop']['results'], results['columnar']['results'])
+    for key in ('rejected_signals', 'timedout_entry_orders', 'final_balance'):
+        assert results['loop'][key] == results['columnar'][key]
+    # Exit checks only happen on candles where the trade may exit
+    assert results['columnar']['check_exit_calls'] < results['loop']['check_exit_calls']
+
+
+def test_backtest_fast_exits_supported(default_conf, mocker):
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._fast_exits_supported()
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert not backtesting._fast_exits_supported()
+    backtesting.strategy.use_custom_stoploss = False
+
+    backtesting.strategy.position_adjustment_enable = True
+    assert not backtesting._fast_exits_supported()
+    backtesting.strategy.position_adjustment_enable = False
+
+    mocker.patch.object(type(backtesting.strategy), 'custom_exit', MagicMock(return_value=None))
+    assert not backtesting._fast_exits_supported()
+    # custom_exit is only called when exit signals are used
+    backtesting.strategy.use_exit_signal = False
+    assert backtesting._fast_exits_supported()
+
+    backtesting.trading_mode = TradingMode.FUTURES
+    assert not backtesting._fast_exits_supported()
+
+
+def test_backtest_calculate_row_steps():
+    tf = 300 * 10 ** 9
+    start = 1_000_000 * tf
+    # Rows start one candle after start, have a gap and a misaligned candle
+    dates = start + np.array([1, 2, 3, 6, 7, 7.5, 8], dtype=np.float64) * tf
+    steps = Backtesting._calculate_row_steps(dates.astype(np.int64), start, tf)
+    assert steps.tolist() == [0, 1, 2, 5, 6, 7, 8]
+
+    # Pair starting late
+    dates = start + np.array([5, 6], dtype=np.int64) * tf
+    assert Backtesting._calculate_row_steps(dates, start, tf).tolist() == [4, 5]
+
+    assert len(Backtesting._calculate_row_steps(np.empty(0, np.int64), start, tf)) == 0
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
 
     patch_exchange(mocker)
@@ -1991,3 +2159,233 @@ def test_get_strategy_run_id(default_conf_usdt):
     strategy = StrategyResolver.load_strategy(default_conf_usdt)
     x = get_strategy_run_id(strategy)
     assert isinstance(x, str)
+
+
+def test_get_strategy_analysis_id(default_conf_usdt):
+    default_conf_usdt.update({
+        'strategy': 'StrategyTestV2',
+        'max_open_trades': float('inf')
+    })
+    strategy = StrategyResolver.load_strategy(default_conf_usdt)
+    strategy.dp = DataProvider(default_conf_usdt, None)
+    x = get_strategy_analysis_id(strategy)
+    assert isinstance(x, str)
+    assert x != get_strategy_run_id(strategy)
+
+    # Trade simulation settings don't change the analyzed dataframes
+    strategy.config.update({'max_open_trades': 2, 'dry_run_wallet': 500,
+                            'timerange': '20220101-'})
+    assert get_strategy_analysis_id(strategy) == x
+    strategy.config['timeframe'] = '1h'
+    assert get_strategy_analysis_id(strategy) != x
+
+
+def _write_strategy_variants(directory: Path) -> None:
+    source = (Path(__file__).parents[1] / 'strategy/strats/strategy_test_v3.py').read_text()
+    (directory / 'strategy_test_v3.py').write_text(source)
+    # Different entry logic and stoploss - identical indicators
+    (directory / 'strategy_variant.py').write_text(
+        source.replace('StrategyTestV3', 'StrategyVariant')
+        .replace("(dataframe['fastd'] < 35)", "(dataframe['fastd'] < 30)")
+        .replace('stoploss = -0.10', 'stoploss = -0.05'))
+    # Different indicators
+    (directory / 'strategy_variant_rsi.py').write_text(
+        source.replace('StrategyTestV3', 'StrategyVariantRsi')
+        .replace("ta.RSI(dataframe)", "ta.RSI(dataframe, timeperiod=10)"))
+
+
+def test_get_strategy_indicator_id(default_conf, tmpdir):
+    _write_strategy_variants(Path(tmpdir))
+    default_conf['strategy_path'] = str(tmpdir)
+
+    def load(name):
+        return StrategyResolver.load_strategy(deepcopy({**default_conf, 'strategy': name}))
+
+    x = get_strategy_indicator_id(load(CURRENT_TEST_STRATEGY))
+    assert isinstance(x, str)
+    assert get_strategy_indicator_id(load('StrategyVariant')) == x
+    assert get_strategy_indicator_id(load('StrategyVariantRsi')) != x
+
+    strategy = load(CURRENT_TEST_STRATEGY)
+    strategy.config['timeframe'] = '1h'
+    assert get_strategy_indicator_id(strategy) != x
+
+
+def test_indicator_cache(default_conf, tmpdir):
+    _write_strategy_variants(Path(tmpdir))
+    default_conf['strategy_path'] = str(tmpdir)
+    strategies = [StrategyResolver.load_strategy(deepcopy({**default_conf, 'strategy': name}))
+                  for name in (CURRENT_TEST_STRATEGY, 'StrategyVariant', 'StrategyVariantRsi')]
+    for strategy in strategies:
+        strategy.ft_bot_start()
+    data = {'UNITTEST/BTC': generate_test_data('5m', 100)}
+
+    def advise_rsi(data):
+        # Reads a parameter while calculating indicators
+        return {pair: df.assign(rsi=strategies[0].buy_rsi.value) for pair, df in data.items()}
+
+    advise = MagicMock(side_effect=advise_rsi)
+    cache = IndicatorCache(strategies)
+    assert cache.is_shared(strategies[0])
+    assert cache.is_shared(strategies[1])
+    assert not cache.is_shared(strategies[2])
+    first = cache.advise_all_indicators(strategies[0], data, advise)
+    assert advise.call_count == 1
+    cache.release(strategies[0])
+
+    shared = cache.advise_all_indicators(strategies[1], data, advise)
+    assert advise.call_count == 1
+    pd.testing.assert_frame_equal(first['UNITTEST/BTC'], shared['UNITTEST/BTC'])
+    # Signals of one strategy don't modify the dataframes of other strategies
+    assert first['UNITTEST/BTC'] is not shared['UNITTEST/BTC']
+
+    # Different indicators
+    cache.advise_all_indicators(strategies[2], data, advise)
+    assert advise.call_count == 2
+
+    # Different value of a parameter read by populate_indicators
+    cache = IndicatorCache(strategies[:2])
+    cache.advise_all_indicators(strategies[0], data, advise)
+    strategies[1].buy_rsi.value = 15
+    cache.advise_all_indicators(strategies[1], data, advise)
+    assert advise.call_count == 4
+
+    # Dataframes are released after the last strategy with identical indicators
+    cache.release(strategies[0])
+    cache.release(strategies[1])
+    assert cache._entries == {}
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_backtest_start_multi_strat_shared_indicators(default_conf, fee, mocker, testdatadir,
+                                                      tmpdir, jobs) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['ETH/BTC']))
+    mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+    patch_exchange(mocker)
+    _write_strategy_variants(Path(tmpdir))
+    default_conf.update({
+        'strategy_path': str(tmpdir),
+        'strategy_list': [CURRENT_TEST_STRATEGY, 'StrategyVariant', 'StrategyVariantRsi'],
+        'strategy_jobs': jobs,
+        'tradable_balance_ratio': 1.0,
+        'amend_last_stake_amount': False,
+        'timerange': '20180110-20180130',
+        'export': 'none',
+        'datadir': testdatadir,
+    })
+    backtesting = Backtesting(default_conf)
+    # Backtesting is sent to the worker processes - so it can't contain mocks.
+    backtesting.exchange._markets = get_markets()
+    indicators = mocker.spy(IStrategy, 'advise_indicators')
+    backtest_one_strategy = mocker.spy(Backtesting, 'backtest_one_strategy')
+    backtesting.start()
+
+    # Worker processes only calculate indicators which are not shared
+    assert [call[0][0].get_strategy_name() for call in indicators.call_args_list] == (
+        [CURRENT_TEST_STRATEGY, 'StrategyVariantRsi'] if jobs == 1 else [CURRENT_TEST_STRATEGY])
+    assert backtest_one_strategy.call_count == (3 if jobs == 1 else 0)
+    assert backtesting.indicator_cache is None
+    assert list(backtesting.all_results.keys()) == default_conf['strategy_list']
+    results = {name: res['results'] for name, res in backtesting.all_results.items()}
+    assert len(results[CURRENT_TEST_STRATEGY]) > 0
+    # Stoploss and entry logic differ
+    assert not results[CURRENT_TEST_STRATEGY].equals(results['StrategyVariant'])
+
+    # Identical results without shared indicators
+    for name in default_conf.pop('strategy_list'):
+        backtesting = Backtesting({**default_conf, 'strategy': name})
+        backtesting.start()
+        pd.testing.assert_frame_equal(
+            backtesting.all_results[name]['results'], results[name])
+
+
+def test_backtest_strategy_worker(mocker) -> None:
+    mocker.patch('freqtrade.optimize.backtesting._worker_backtesting', None)
+    with pytest.raises(OperationalException, match=r'.*has not been initialized.'):
+        _backtest_strategy(0)
+
+
+def test_analyzed_data_cache(tmpdir) -> None:
+    all_candles = generate_test_data('1h', 24 * 72, '2022-01-15')
+    candles = all_candles.iloc[:24 * 70]
+    cache = AnalyzedDataCache(Path(tmpdir), 'abc')
+    strategy = MagicMock()
+    strategy.startup_candle_count = 5
+    # The EMA depends on more than startup_candle_count candles
+    strategy.advise_all_indicators = MagicMock(side_effect=lambda data: {
+        pair: df.assign(sma=df['close'].rolling(3).mean(),
+                        ema=df['close'].ewm(span=50, adjust=False).mean())
+        for pair, df in data.items()})
+    expected = strategy.advise_all_indicators({'ETH/BTC': candles})['ETH/BTC']
+
+    assert cache.load('ETH/BTC', candles) is None
+    res = cache.advise_all_indicators(strategy, {'ETH/BTC': candles})
+    pd.testing.assert_frame_equal(res['ETH/BTC'], expected)
+    # One file per month
+    assert len(list((Path(tmpdir) / 'abc' / 'ETH_BTC').glob('*.pkl'))) == 3
+
+    strategy.advise_all_indicators.reset_mock()
+    res = cache.advise_all_indicators(strategy, {'ETH/BTC': candles, 'XRP/BTC': candles})
+    pd.testing.assert_frame_equal(res['ETH/BTC'], expected)
+    pd.testing.assert_frame_equal(res['XRP/BTC'], expected)
+    assert list(res.keys()) == ['ETH/BTC', 'XRP/BTC']
+    # Only the new pair is analyzed
+    assert list(strategy.advise_all_indicators.call_args_list[0][0][0].keys()) == ['XRP/BTC']
+
+    # Shorter timerange ending at a month boundary reuses prior chunks
+    shorter = candles[candles['date'] < '2022-03-01']
+    pd.testing.assert_frame_equal(cache.load('ETH/BTC', shorter), expected.loc[shorter.index])
+
+    # Extended timerange analyzes the whole pair - identical to an uncached run
+    longer = all_candles.iloc[:24 * 71]
+    expected_longer = strategy.advise_all_indicators({'ETH/BTC': longer})['ETH/BTC']
+    assert len(cache.load('ETH/BTC', longer)) == len(shorter)
+    strategy.advise_all_indicators.reset_mock()
+    res = cache.advise_all_indicators(strategy, {'ETH/BTC': longer})
+    pd.testing.assert_frame_equal(res['ETH/BTC'], expected_longer)
+    analyzed = strategy.advise_all_indicators.call_args_list[0][0][0]['ETH/BTC']
+    assert len(analyzed) == len(longer)
+    assert len(list((Path(tmpdir) / 'abc' / 'ETH_BTC').glob('*.pkl'))) == 4
+    # Stored months match an uncached run as well
+    pd.testing.assert_frame_equal(cache.load('ETH/BTC', longer), expected_longer)
+
+    # Changed candles invalidate this and all following months - but not prior months
+    changed = candles.copy()
+    changed.loc[changed['date'] == '2022-02-10 00:00:00+00:00', 'close'] = 5.0
+    assert len(cache.load('ETH/BTC', changed)) == len(candles[candles['date'] < '2022-02-01'])
+    res = cache.advise_all_indicators(strategy, {'ETH/BTC': changed})
+    pd.testing.assert_frame_equal(
+        res['ETH/BTC'], strategy.advise_all_indicators({'ETH/BTC': changed})['ETH/BTC'])
+    assert len(list((Path(tmpdir) / 'abc' / 'ETH_BTC').glob('*.pkl'))) == 6
+
+    # Analysis results which dropped candles are not stored
+    cache.store('LTC/BTC', candles, expected.iloc[1:])
+    assert not (Path(tmpdir) / 'abc' / 'LTC_BTC').exists()
+
+
+def test_backtest_analysis_cache(default_conf, fee, mocker, testdatadir, tmpdir) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch("freqtrade.exchange.Exchange.get_max_pair_stake_amount", return_value=float('inf'))
+    patch_exchange(mocker)
+    default_conf.update({
+        'user_data_dir': Path(tmpdir),
+        'analysis_cache': True,
+        'timerange': '20180110-20180130',
+    })
+    timerange = TimeRange.parse_timerange(default_conf['timerange'])
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'],
+                             timerange=timerange)
+    results = []
+    for _ in range(2):
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        indicators = mocker.spy(backtesting.strategy, 'advise_indicators')
+        backtesting.backtest_one_strategy(backtesting.strategylist[0], data, timerange)
+        results.append(backtesting.all_results[backtesting.strategy.get_strategy_name()])
+        assert indicators.call_count == (1 if len(results) == 1 else 0)
+
+    pd.testing.assert_frame_equal(results[0]['results'], results[1]['results'])
+    assert (Path(tmpdir) / 'backtest_results' / 'analysis_cache').is_dir()
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+import pytest
+import rapidjson
+
+from freqtrade.commands.optimize_commands import start_benchmark
+from freqtrade.constants import BACKTEST_ENGINES
+from freqtrade.data.converter import ohlcv_to_dataframe
+from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.benchmark import Benchmark, generate_benchmark_candles
+from tests.conftest import (CURRENT_TEST_STRATEGY, get_args, log_has, log_has_re, patch_exchange,
+                            patched_configuration_load_config_file)
+
+
+def test_generate_benchmark_candles():
+    candles = generate_benchmark_candles(0, 100, '5m')
+    assert len(candles) == 100
+    assert candles == generate_benchmark_candles(0, 100, '5m')
+    assert candles != generate_benchmark_candles(1, 100, '5m')
+
+    df = ohlcv_to_dataframe(candles, '5m', 'ETH/BTC', fill_missing=True, drop_incomplete=False)
+    assert len(df) == 100
+    assert (df['date'].diff().dropna().dt.total_seconds() == 300).all()
+    assert (df['high'] >= df[['open', 'close']].max(axis=1)).all()
+    assert (df['low'] <= df[['open', 'close']].min(axis=1)).all()
+
+
+def test_start_benchmark(mocker, fee, default_conf, caplog, tmpdir, capsys) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    patched_configuration_load_config_file(mocker, default_conf)
+
+    args = [
+        'benchmark',
+        '--config', 'config.json',
+        '--strategy', CURRENT_TEST_STRATEGY,
+        '--userdir', str(tmpdir),
+        '--benchmark-pairs', '2',
+        '--benchmark-candles', '300',
+        '--benchmark-repeats', '1',
+    ]
+    start_benchmark(get_args(args))
+    assert log_has('Starting freqtrade in Benchmark mode', caplog)
+    assert log_has_re(r'Benchmarking StrategyTestV3 with 2 pairs and 300 candles.*', caplog)
+
+    files = list((tmpdir / 'benchmark_results').listdir())
+    assert len(files) == 1
+    results = rapidjson.loads(files[0].read_text('utf-8'))
+    assert results['strategy'] == 'StrategyTestV3'
+    assert results['pairs'] == 2
+    assert results['candles'] == 300
+    names = [res['name'] for res in results['results']]
+    assert names == ['ohlcv_to_dataframe', 'refresh_candles', 'analyze_ticker',
+                     'advise_all_indicators', '_get_ohlcv_as_lists',
+                     *[f'backtest[{engine}]' for engine in BACKTEST_ENGINES],
+                     'calc_profit_ratio']
+    assert all(res['throughput'] > 0 for res in results['results'])
+    assert results['results'][0]['items'] == 600
+
+    captured = capsys.readouterr()
+    assert 'backtest[loop]' in captured.out
+    assert 'Change' not in captured.out
+
+    # Prior results are compared
+    mocker.patch('freqtrade.optimize.benchmark.file_dump_json')
+    start_benchmark(get_args(args))
+    captured = capsys.readouterr()
+    assert 'Change' in captured.out
+
+
+def test_benchmark_init(mocker, default_conf, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
+    default_conf.update({
+        'strategy': CURRENT_TEST_STRATEGY,
+        'benchmark_pairs': 20,
+        'benchmark_candles': 200,
+    })
+    benchmark = Benchmark(default_conf)
+    assert benchmark.pairs == default_conf['exchange']['pair_whitelist']
+    assert log_has_re(r'Only \d+ pairs in whitelist, benchmarking with \d+ pairs\.', caplog)
+
+    default_conf['benchmark_candles'] = 10
+    with pytest.raises(OperationalException, match=r'Benchmark requires more than \d+ candles.*'):
+        Benchmark(default_conf)
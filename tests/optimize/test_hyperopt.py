@@ -4,20 +4,26 @@ from functools import wraps
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from arrow import Arrow
 from filelock import Timeout
+from joblib.externals import cloudpickle
 from skopt.space import Integer
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize import hyperopt as hyperopt_module
+from freqtrade.optimize.hyperopt import Hyperopt, _init_hyperopt_worker, _run_hyperopt_epoch
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt_data_store import (dump_mmap_dataframes, load_mmap_dataframes,
+                                                    remove_mmap_dataframes)
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.signal_cache import SignalCache
 from freqtrade.optimize.space import SKDecimal
 from freqtrade.strategy import IntParameter
 from tests.conftest import (CURRENT_TEST_STRATEGY, get_args, get_markets, log_has, log_has_re,
@@ -914,6 +920,7 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmpdir,
         'hyperopt_jobs': 2,
         'fee': fee.return_value,
     })
+    pool_mock = mocker.spy(Hyperopt, 'get_worker_pool')
     hyperopt = Hyperopt(hyperopt_conf)
     hyperopt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
     hyperopt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
@@ -934,6 +941,42 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmpdir,
     assert len(list(buy_rsi_range)) == 51
 
     hyperopt.start()
+    assert pool_mock.call_count == 1
+    assert hyperopt.num_epochs_saved == 2
+
+
+def test_hyperopt_worker(mocker, hyperopt_conf, fee) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.validate_config', MagicMock())
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    mocker.patch('freqtrade.exchange.Exchange._load_markets')
+    mocker.patch('freqtrade.exchange.Exchange.markets',
+                 PropertyMock(return_value=get_markets()))
+    mocker.patch.object(hyperopt_module, '_worker_hyperopt', None)
+    with pytest.raises(OperationalException, match=r'.*has not been initialized.'):
+        _run_hyperopt_epoch([1])
+
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.release_exchange()
+    hyperopt.opt = MagicMock()
+    payload = cloudpickle.dumps(hyperopt)
+    # The optimizer is not sent to the workers
+    assert 'opt' not in cloudpickle.loads(payload).__dict__
+    assert hyperopt.opt is not None
+
+    _init_hyperopt_worker(payload)
+    worker_hyperopt = hyperopt_module._worker_hyperopt
+    assert isinstance(worker_hyperopt, Hyperopt)
+    assert worker_hyperopt is not hyperopt
+
+    go = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+                      return_value={'loss': 1})
+    assert _run_hyperopt_epoch([20, 30]) == {'loss': 1}
+    go.assert_called_once_with([20, 30])
+
+    # Same worker instance is used for subsequent epochs
+    _run_hyperopt_epoch([25, 30])
+    assert hyperopt_module._worker_hyperopt is worker_hyperopt
+    assert go.call_count == 2
 
 
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmpdir, fee) -> None:
@@ -1111,3 +1154,191 @@ def test_max_open_trades_consistency(mocker, hyperopt_conf, tmpdir, fee) -> None
 
     assert hyperopt.backtesting.strategy.max_open_trades == 8
     assert hyperopt.config['max_open_trades'] == 8
+
+
+def test_mmap_dataframes(testdatadir, tmpdir) -> None:
+    data = load_data(testdatadir, '5m', ['UNITTEST/BTC', 'ETH/BTC'])
+    data['UNITTEST/BTC']['signal'] = 1
+    data['UNITTEST/BTC']['flag'] = data['UNITTEST/BTC']['close'] > 0.09
+    data['UNITTEST/BTC']['enter_tag'] = 'tag'
+    data['EMPTY/BTC'] = pd.DataFrame(columns=data['ETH/BTC'].columns)
+    store = Path(tmpdir) / 'store'
+    dump_mmap_dataframes(data, store)
+    assert (store / 'metadata.pkl').is_file()
+
+    loaded = load_mmap_dataframes(store)
+    assert list(loaded.keys()) == list(data.keys())
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(loaded[pair][df.columns], df)
+
+    # Numeric columns are backed by the memory-mapped file
+    df = loaded['UNITTEST/BTC']
+    base = df['close'].values
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap)
+    # Modifications are copy-on-write - and not visible to other readers
+    df.loc[:, 'close'] = 5.0
+    assert (df['close'] == 5.0).all()
+    pd.testing.assert_frame_equal(
+        load_mmap_dataframes(store)['UNITTEST/BTC'][data['UNITTEST/BTC'].columns],
+        data['UNITTEST/BTC'])
+
+    remove_mmap_dataframes(store)
+    assert not store.exists()
+
+
+def test_in_strategy_auto_hyperopt_mmap_data(mocker, hyperopt_conf, tmpdir, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    (Path(tmpdir) / 'hyperopt_results').mkdir(parents=True)
+    hyperopt_conf.update({
+        'strategy': 'HyperoptableStrategy',
+        'user_data_dir': Path(tmpdir),
+        'hyperopt_random_state': 42,
+        'spaces': ['buy'],
+        'epochs': 2,
+        'hyperopt_mmap_data': True,
+    })
+    dumper = mocker.patch('freqtrade.optimize.hyperopt.dump')
+    loader = mocker.patch('freqtrade.optimize.hyperopt.load_mmap_dataframes',
+                          side_effect=load_mmap_dataframes)
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+
+    hyperopt.start()
+    assert dumper.call_count == 0
+    assert loader.call_count == 2
+    assert (hyperopt.data_mmap_dir / 'metadata.pkl').is_file()
+    assert hyperopt.current_best_epoch is not None
+
+    # Store is removed on the next run
+    Hyperopt(hyperopt_conf)
+    assert not hyperopt.data_mmap_dir.exists()
+
+
+@pytest.mark.parametrize('spaces', [['buy', 'roi'], ['roi', 'stoploss']])
+def test_in_strategy_auto_hyperopt_signal_cache(mocker, hyperopt_conf, tmpdir, fee, spaces) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    (Path(tmpdir) / 'hyperopt_results').mkdir(parents=True)
+    hyperopt_conf.update({
+        'strategy': 'HyperoptableStrategy',
+        'user_data_dir': Path(tmpdir),
+        'hyperopt_random_state': 42,
+        'spaces': spaces,
+        'epochs': 5,
+    })
+    results = {}
+    entry_calls = {}
+    for signal_cache in (None, 2):
+        hyperopt_conf['hyperopt_signal_cache'] = signal_cache
+        saver = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_result')
+        hyperopt = Hyperopt(hyperopt_conf)
+        hyperopt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+        assert (hyperopt.backtesting.signal_cache is not None) == bool(signal_cache)
+        advise_entry = mocker.spy(hyperopt.backtesting.strategy, 'advise_entry')
+
+        hyperopt.start()
+        results[signal_cache] = [(c[0][0]['loss'], c[0][0]['results_metrics']['total_trades'])
+                                 for c in saver.call_args_list]
+        entry_calls[signal_cache] = advise_entry.call_count
+
+    assert len(results[None]) == 5
+    assert results[2] == results[None]
+    pairs = len(hyperopt.backtesting.signal_cache._converted)
+    assert entry_calls[None] == 5 * pairs
+    if 'buy' in spaces:
+        assert entry_calls[2] > pairs
+    else:
+        # Signals only need to be calculated once
+        assert entry_calls[2] == pairs
+        assert len(hyperopt.backtesting.signal_cache._signals) == pairs
+
+
+def test_signal_cache_modified_columns(mocker, hyperopt_conf, ohlcv_history) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf['hyperopt_signal_cache'] = 2
+    backtesting = Hyperopt(hyperopt_conf).backtesting
+    buy_rsi = IntParameter(low=1, high=5, default=1, space='buy')
+    buy_rsi.name = 'buy_rsi'
+
+    def populate_entry_trend(dataframe, metadata):
+        # Overwrites an existing column, depending on a parameter
+        dataframe['rsi'] = dataframe['rsi'] * buy_rsi.value
+        dataframe['enter_long'] = (dataframe['rsi'] > 100).astype(int)
+        return dataframe
+
+    def populate_exit_trend(dataframe, metadata):
+        dataframe['exit_long'] = 0
+        return dataframe
+
+    backtesting.strategy.populate_entry_trend = populate_entry_trend
+    backtesting.strategy.populate_exit_trend = populate_exit_trend
+    pair_data = ohlcv_history.copy()
+    pair_data['rsi'] = 40.0
+    pair_data['sma'] = 1.0
+
+    def advise(value, cached):
+        buy_rsi.value = value
+        cache = backtesting.signal_cache
+        if not cached:
+            backtesting.signal_cache = None
+        # Without signal cache, the input dataframe is modified
+        result = backtesting._advise_signals(
+            'UNITTEST/BTC', pair_data if cached else pair_data.copy())
+        backtesting.signal_cache = cache
+        return result
+
+    for value in (1, 3, 1, 3):
+        expected = advise(value, False)
+        result = advise(value, True)
+        pd.testing.assert_frame_equal(result, expected)
+        assert (result['rsi'] == 40 * value).all()
+        assert result['enter_long'].sum() == (len(pair_data) if value == 3 else 0)
+    # Input data is not modified
+    assert (pair_data['rsi'] == 40).all()
+    assert 'enter_long' not in pair_data.columns
+    signals = backtesting.signal_cache.get('UNITTEST/BTC')
+    assert set(signals.columns) == {'rsi', 'enter_long', 'exit_long'}
+
+
+def test_signal_cache() -> None:
+    buy_a = IntParameter(low=0, high=5, default=1, space='buy')
+    buy_b = IntParameter(low=0, high=5, default=1, space='buy')
+    buy_a.name, buy_b.name = 'buy_a', 'buy_b'
+    signals = pd.DataFrame({'enter_long': [0, 1]})
+    cache = SignalCache(maxsize=2)
+
+    assert cache.get('XRP/BTC') is None
+    cache.set('XRP/BTC', {buy_a}, signals)
+    assert cache.get('XRP/BTC') is signals
+    assert cache.get('ETH/BTC') is None
+
+    buy_a.value = 2
+    assert cache.get('XRP/BTC') is None
+    # buy_b was not read before - so it's not part of the key
+    buy_a.value = 1
+    buy_b.value = 3
+    assert cache.get('XRP/BTC') is signals
+
+    # Reading a new parameter invalidates prior entries
+    signals2 = pd.DataFrame({'enter_long': [1, 1]})
+    cache.set('XRP/BTC', {buy_a, buy_b}, signals2)
+    assert cache.get('XRP/BTC') is signals2
+    buy_b.value = 1
+    assert cache.get('XRP/BTC') is None
+    buy_b.value = 3
+
+    # Least recently used entries are dropped
+    for value in (2, 3):
+        buy_a.value = value
+        cache.set('XRP/BTC', {buy_a}, signals)
+    buy_a.value = 1
+    assert cache.get('XRP/BTC') is None
+
+    assert cache.get_converted('XRP/BTC', 'lists', signals) is None
+    cache.set_converted('XRP/BTC', 'lists', signals, [[1]])
+    assert cache.get_converted('XRP/BTC', 'lists', signals.copy()) == [[1]]
+    assert cache.get_converted('XRP/BTC', 'arrays', signals) is None
+    assert cache.get_converted('XRP/BTC', 'lists', signals2) is None
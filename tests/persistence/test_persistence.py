@@ -1,5 +1,5 @@
 # pragma pylint: disable=missing-docstring, C0103
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from types import FunctionType
 
 import arrow
@@ -8,7 +8,8 @@ import pytest
 from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.enums import TradingMode
 from freqtrade.exceptions import DependencyException
-from freqtrade.persistence import LocalTrade, Order, Trade, init_db
+from freqtrade.persistence import LocalOrder, LocalTrade, Order, Trade, init_db
+from freqtrade.persistence.sql_functions import DateTrunc
 from tests.conftest import create_mock_trades, create_mock_trades_with_leverage, log_has, log_has_re
 
 
@@ -2005,6 +2006,7 @@ def test_Trade_object_idem():
         'commit',
         'rollback',
         'query',
+        'update_order',
         'open_date',
         'get_best_pair',
         'get_overall_performance',
@@ -2436,6 +2438,68 @@ def test_select_filled_orders(fee):
     assert len(orders) == 0
 
 
+def test_local_order(fee):
+    order_date = datetime(2022, 5, 1, 10, 0, 0)
+    order = LocalOrder(
+        id=1,
+        ft_trade_id=1,
+        ft_pair='ADA/USDT',
+        order_id='1',
+        ft_order_side='buy',
+        side='buy',
+        order_type='limit',
+        status='open',
+        order_date=order_date,
+        price=2.0,
+        average=2.0,
+        amount=30.0,
+        filled=0,
+        remaining=30.0,
+        cost=60.0,
+    )
+    # Not mapped to the database, and without instance dictionary
+    assert not hasattr(order, '__dict__')
+    assert not hasattr(order, 'trade')
+    assert order.ft_is_open is True
+    assert order.stop_price is None
+    assert order.safe_price == 2.0
+    assert order.safe_filled == 0
+    assert order.safe_remaining == 30.0
+    assert order.order_date_utc == order_date.replace(tzinfo=timezone.utc)
+    assert 'Order(id=1, order_id=1, trade_id=1, side=buy' in str(order)
+    with pytest.raises(AttributeError):
+        order.not_an_attribute = 1
+
+    trade = LocalTrade(
+        id=1,
+        pair='ADA/USDT',
+        stake_amount=60.0,
+        open_rate=2.0,
+        amount=30.0,
+        open_date=order_date,
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        exchange='binance',
+        leverage=1.0,
+    )
+    trade.orders.append(order)
+    close_date = order_date + timedelta(minutes=5)
+    order.close_bt_order(close_date, trade)
+    assert not order.ft_is_open
+    assert order.status == 'closed'
+    assert order.filled == 30.0
+    assert order.remaining == 0
+    assert order.order_filled_utc == close_date.replace(tzinfo=timezone.utc)
+    assert trade.select_filled_or_open_orders() == [order]
+    assert order.to_json(trade.entry_side, True) == {
+        'amount': 30.0,
+        'safe_price': 2.0,
+        'ft_order_side': 'buy',
+        'order_filled_timestamp': int(close_date.replace(tzinfo=timezone.utc).timestamp() * 1000),
+        'ft_is_entry': True,
+    }
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_order_to_ccxt(limit_buy_order_open):
 
@@ -2596,3 +2660,28 @@ def test_recalc_trade_from_orders_dca(data) -> None:
     trade = Trade.query.first()
     assert trade
     assert trade.open_order_id is None
+
+
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize('timeunit,expected', [
+    ('days', [date(2022, 5, 1), date(2022, 5, 2), date(2022, 5, 31), date(2022, 6, 1)]),
+    ('weeks', [date(2022, 4, 25), date(2022, 5, 2), date(2022, 5, 30), date(2022, 5, 30)]),
+    ('months', [date(2022, 5, 1), date(2022, 5, 1), date(2022, 5, 1), date(2022, 6, 1)]),
+])
+def test_date_trunc(fee, timeunit, expected):
+    # Sunday, Monday, Tuesday (end of month), Wednesday
+    close_dates = [datetime(2022, 5, 1, 23, 59, 59), datetime(2022, 5, 2, 0, 0, 0),
+                   datetime(2022, 5, 31, 12, 30), datetime(2022, 6, 1, 8, 0)]
+    for close_date in close_dates:
+        Trade.query.session.add(Trade(
+            pair='ETH/BTC', stake_amount=0.001, amount=1, open_rate=0.01, is_open=False,
+            fee_open=fee.return_value, fee_close=fee.return_value, exchange='binance',
+            open_date=close_date - timedelta(hours=1), close_date=close_date,
+        ))
+    Trade.commit()
+
+    res = Trade.query.session.query(DateTrunc(timeunit, Trade.close_date)).order_by(Trade.id).all()
+    assert [row[0] for row in res] == expected
+
+    with pytest.raises(ValueError, match=r'Invalid timeunit'):
+        DateTrunc('years', Trade.close_date)
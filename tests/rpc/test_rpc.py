@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import ANY, MagicMock, PropertyMock
 
 import pytest
+from dateutil.relativedelta import relativedelta
 from numpy import isnan
 
 from freqtrade.edge import PairInfo
@@ -318,6 +319,40 @@ def test__rpc_timeunit_profit(default_conf_usdt, ticker, fee,
         rpc._rpc_timeunit_profit(0, stake_currency, fiat_display_currency)
 
 
+@pytest.mark.parametrize('timeunit', ['days', 'weeks', 'months'])
+def test__rpc_timeunit_profit_periods(default_conf_usdt, fee, mocker, timeunit) -> None:
+    mocker.patch('freqtrade.rpc.telegram.Telegram', MagicMock())
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf_usdt)
+    create_mock_trades_usdt(fee)
+
+    today = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+    trades = Trade.get_trades([Trade.is_open.is_(False)]).order_by(Trade.id).all()
+    assert len(trades) > 2
+    for idx, trade in enumerate(trades):
+        trade.close_date = today - timedelta(days=idx * 9)
+    Trade.commit()
+
+    rpc = RPC(freqtradebot)
+    result = rpc._rpc_timeunit_profit(6, 'USDT', 'USD', timeunit)
+    assert len(result['data']) == 6
+
+    # Compare against each period summed separately
+    start_balance = freqtradebot.wallets.get_total_stake_amount()
+    for period in result['data']:
+        start = (datetime.strptime(period['date'], '%Y-%m').date()
+                 if timeunit == 'months' else period['date'])
+        end = start + (relativedelta(months=1) if timeunit == 'months'
+                       else timedelta(**{timeunit: 1}))
+        period_trades = [t for t in trades if start <= t.close_date.date() < end]
+        profit = sum(t.close_profit_abs for t in period_trades)
+        start_balance -= profit
+        assert period['trade_count'] == len(period_trades)
+        assert period['abs_profit'] == pytest.approx(profit)
+        assert period['starting_balance'] == pytest.approx(start_balance)
+    assert sum(period['trade_count'] for period in result['data']) == sum(
+        1 for t in trades if t.close_date.date() >= start)
+
+
 @pytest.mark.parametrize('is_short', [True, False])
 def test_rpc_trade_history(mocker, default_conf, markets, fee, is_short):
     mocker.patch('freqtrade.rpc.telegram.Telegram', MagicMock())
@@ -1,7 +1,9 @@
 """
 Unit test file for rpc/api_server.py
 """
+import asyncio
 import logging
+import re
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -24,8 +26,14 @@ from freqtrade.rpc import RPC
 from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
-from tests.conftest import (CURRENT_TEST_STRATEGY, create_mock_trades, get_mock_coro,
-                            get_patched_freqtradebot, log_has, log_has_re, patch_get_signal)
+from freqtrade.rpc.api_server.ws.channel import WebSocketChannel
+from freqtrade.rpc.api_server.ws.serializer import (ArrowWebSocketSerializer,
+                                                    HybridJSONWebSocketSerializer,
+                                                    get_serializer_cls, select_subprotocol)
+from freqtrade.util import LoopProfiler
+from tests.conftest import (CURRENT_TEST_STRATEGY, create_mock_trades, generate_test_data,
+                            get_mock_coro, get_patched_freqtradebot, log_has, log_has_re,
+                            patch_get_signal)
 
 
 BASE_URI = "/api/v1"
@@ -1313,7 +1321,7 @@ def test_api_forceexit(botclient, mocker, ticker, fee, markets):
     assert trade.is_open is False
 
 
-def test_api_pair_candles(botclient, ohlcv_history):
+def test_api_pair_candles(botclient, ohlcv_history, mocker):
     ftbot, client = botclient
     timeframe = '5m'
     amount = 3
@@ -1403,6 +1411,39 @@ def test_api_pair_candles(botclient, ohlcv_history):
                  None, None, None, None]
              ])
 
+    # Responses are cached until a new dataframe is analyzed
+    convert_mock = mocker.spy(RPC, '_convert_dataframe_to_dict')
+    rc1 = client_get(client,
+                     f"{BASE_URI}/pair_candles?limit={amount}&pair=XRP%2FBTC&timeframe={timeframe}")
+    assert_response(rc1)
+    assert rc1.json() == rc.json()
+    assert convert_mock.call_count == 0
+    assert re.match(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$', rc1.json()['last_analyzed'])
+
+    rc1 = client_get(client,
+                     f"{BASE_URI}/pair_candles?limit=2&pair=XRP%2FBTC&timeframe={timeframe}")
+    assert len(rc1.json()['data']) == 2
+    assert convert_mock.call_count == 1
+
+    ohlcv_history.loc[2, 'enter_long'] = 1
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+    rc1 = client_get(client,
+                     f"{BASE_URI}/pair_candles?limit={amount}&pair=XRP%2FBTC&timeframe={timeframe}")
+    assert convert_mock.call_count == 2
+    assert rc1.json()['enter_long_signals'] == rc.json()['enter_long_signals'] + 1
+
+    # Another request clears the cache right after the response was stored
+    class ClearedCache(dict):
+        def __setitem__(self, key, value):
+            super().__setitem__(key, value)
+            self.clear()
+
+    mocker.patch.object(ftbot.dataprovider, '_get_response_cache', return_value=ClearedCache())
+    rc1 = client_get(client,
+                     f"{BASE_URI}/pair_candles?limit={amount}&pair=XRP%2FBTC&timeframe={timeframe}")
+    assert_response(rc1)
+    assert convert_mock.call_count == 3
+
 
 def test_api_pair_history(botclient, ohlcv_history):
     ftbot, client = botclient
@@ -1799,6 +1840,121 @@ def test_health(botclient):
     assert ret['last_process'] == '1970-01-01T00:00:00+00:00'
 
 
+def test_api_profile(botclient):
+    ftbot, client = botclient
+    LoopProfiler.reset()
+    LoopProfiler.record('phases', 'analyze', 0.2)
+    LoopProfiler.record('pairs', 'ETH/BTC', 0.1)
+    ftbot.exchange._update_ohlcv_refresh_stats([0.05, 0.3], 0.4)
+
+    rc = client_get(client, f"{BASE_URI}/profile")
+
+    assert_response(rc)
+    ret = rc.json()
+    assert ret['phases'] == {'analyze': {'count': 1, 'last': 0.2, 'mean': 0.2, 'max': 0.2}}
+    assert ret['pairs'] == {'ETH/BTC': {'count': 1, 'last': 0.1, 'mean': 0.1, 'max': 0.1}}
+    assert ret['exchange'] == {}
+    assert ret['ohlcv_refresh']['requests'] == 2
+    assert ret['ohlcv_refresh']['latency_histogram']['0.1'] == 1
+    assert ret['ohlcv_refresh']['latency_histogram']['0.5'] == 1
+    LoopProfiler.reset()
+
+
+def test_ws_channel_queue():
+    channel = WebSocketChannel(MagicMock(), channel_id='test', max_queue_size=4)
+    ohlcv_history = generate_test_data('5m', 20)
+
+    def df_message(pair, df, seq):
+        return {'type': 'analyzed_df',
+                'data': {'key': (pair, '5m', CandleType.SPOT), 'df': df, 'la': 0, 'seq': seq}}
+
+    channel.queue_message(df_message('ETH/BTC', ohlcv_history.iloc[10:11], 1))
+    channel.queue_message({'type': 'whitelist', 'data': ['ETH/BTC']})
+    channel.queue_message(df_message('XRP/BTC', ohlcv_history.iloc[10:11], 1))
+    channel.queue_message({'type': 'new_candle', 'data': ('ETH/BTC', '5m', CandleType.SPOT)})
+    # Superseded messages are combined
+    channel.queue_message(df_message('ETH/BTC', ohlcv_history.iloc[11:13], 2))
+    channel.queue_message({'type': 'whitelist', 'data': ['ETH/BTC', 'XRP/BTC']})
+    channel.queue_message({'type': 'new_candle', 'data': ('ETH/BTC', '5m', CandleType.SPOT)})
+
+    stats = channel.stats
+    assert stats['channel_id'] == 'test'
+    assert stats['queue_size'] == 4
+    assert stats['coalesced'] == 3
+    assert stats['dropped'] == 0
+
+    message = channel._queue[0].message
+    assert len(message['data']['df']) == 3
+    assert message['data']['df']['date'].tolist() == ohlcv_history.iloc[10:13]['date'].tolist()
+    # Combined candle updates don't continue the sequence
+    assert 'seq' not in message['data']
+    assert channel._queue[1].message['data'] == ['ETH/BTC', 'XRP/BTC']
+
+    # Full queue drops the oldest message
+    channel.queue_message({'type': 'status', 'data': 'running'})
+    assert channel.stats['queue_size'] == 4
+    assert channel.stats['dropped'] == 1
+    assert [m.message['type'] for m in channel._queue] == [
+        'whitelist', 'analyzed_df', 'new_candle', 'status']
+    # Not coalesced
+    channel.queue_message({'type': 'status', 'data': 'running'})
+    assert channel.stats['dropped'] == 2
+    assert channel.stats['coalesced'] == 3
+    # The dropped dataframe isn't queued anymore - the new message is queued as is
+    channel.queue_message(df_message('ETH/BTC', ohlcv_history.iloc[13:14], 3))
+    assert channel.stats['dropped'] == 3
+    assert channel._queue[-1].message['data']['seq'] == 3
+    assert len(channel._queue[-1].message['data']['df']) == 1
+
+
+async def test_ws_channel_send_queued_messages(mocker):
+    channel = WebSocketChannel(MagicMock(), channel_id='test', send_throttle=0)
+    sent = []
+
+    async def send(message, timeout=False):
+        sent.append(message)
+        if len(sent) == 2:
+            channel._closed.set()
+
+    mocker.patch.object(channel, 'send', side_effect=send)
+    task = asyncio.create_task(channel.send_queued_messages())
+    await asyncio.sleep(0)
+    assert sent == []
+
+    channel.queue_message({'type': 'status', 'data': '1'})
+    channel.queue_message({'type': 'status', 'data': '2'})
+    await asyncio.wait_for(task, 1)
+    assert sent == [{'type': 'status', 'data': '1'}, {'type': 'status', 'data': '2'}]
+    assert channel.stats['queue_size'] == 0
+
+
+def test_api_ws_channels(botclient):
+    ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
+
+    rc = client_get(client, f"{BASE_URI}/ws_channels")
+    assert_response(rc)
+    assert rc.json() == []
+
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json({'type': 'subscribe', 'data': ['whitelist']})
+        ws.send_json({"type": "whitelist", "data": None})
+        ws.receive_json()
+
+        rc = client_get(client, f"{BASE_URI}/ws_channels")
+        assert_response(rc)
+        ret = rc.json()
+        assert len(ret) == 1
+        assert ret[0]['subscriptions'] == ['whitelist']
+        assert ret[0]['queue_size'] == 0
+        assert ret[0]['dropped'] == 0
+        assert ret[0]['max_queue_size'] > 0
+
+    time.sleep(0.1)
+    rc = client_get(client, f"{BASE_URI}/ws_channels")
+    assert rc.json() == []
+
+
 def test_api_ws_subscribe(botclient, mocker):
     ftbot, client = botclient
     ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
@@ -1852,6 +2008,60 @@ def test_api_ws_requests(botclient, caplog):
     assert response['type'] == "analyzed_df"
 
 
+def test_ws_serializers(ohlcv_history):
+    assert select_subprotocol([]) is None
+    assert select_subprotocol(['freqtrade.unknown', 'freqtrade.arrow']) == 'freqtrade.arrow'
+    assert get_serializer_cls(None) is HybridJSONWebSocketSerializer
+    assert get_serializer_cls('freqtrade.unknown') is HybridJSONWebSocketSerializer
+    assert get_serializer_cls('freqtrade.arrow') is ArrowWebSocketSerializer
+
+    df = ohlcv_history.copy()
+    df['enter_tag'] = None
+    df.loc[1, 'enter_tag'] = 'tag'
+    # Mixed column, can't be converted by arrow
+    mixed = pd.DataFrame({'date': ohlcv_history['date'], 'mixed': [1, 'a', 2.0]})
+    message = {'type': 'analyzed_df', 'data': {'key': ['ETH/BTC', '5m', 'spot'], 'df': df,
+                                               'others': [mixed, df.iloc[:5]]}}
+
+    serializer = ArrowWebSocketSerializer(None)
+    serialized = serializer._serialize(message)
+    assert isinstance(serialized, bytes)
+    result = serializer._deserialize(serialized)
+    assert result['data']['key'] == ['ETH/BTC', '5m', 'spot']
+    pd.testing.assert_frame_equal(result['data']['df'], df)
+    pd.testing.assert_frame_equal(result['data']['others'][1], df.iloc[:5])
+    assert result['data']['others'][0]['mixed'].tolist() == [1, 'a', 2.0]
+
+    # Text frames are deserialized as json
+    json_serialized = HybridJSONWebSocketSerializer(None)._serialize(message)
+    result = serializer._deserialize(json_serialized)
+    assert result['data']['df']['close'].tolist() == pytest.approx(df['close'].tolist())
+
+
+def test_api_ws_arrow_serializer(botclient):
+    ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
+    serializer = ArrowWebSocketSerializer(None)
+
+    with client.websocket_connect(ws_url, subprotocols=['freqtrade.arrow']) as ws:
+        assert ws.accepted_subprotocol == 'freqtrade.arrow'
+        ws.send_bytes(serializer._serialize({"type": "whitelist", "data": None}))
+        response = serializer._deserialize(ws.receive_bytes())
+        assert response['type'] == "whitelist"
+
+        ws.send_bytes(serializer._serialize({"type": "analyzed_df", "data": {"limit": 100}}))
+        response = serializer._deserialize(ws.receive_bytes())
+        assert response['type'] == "analyzed_df"
+        assert isinstance(response['data']['df'], pd.DataFrame)
+
+    # Unknown subprotocols fall back to json
+    with client.websocket_connect(ws_url, subprotocols=['freqtrade.unknown']) as ws:
+        assert ws.accepted_subprotocol is None
+        ws.send_json({"type": "whitelist", "data": None})
+        response = ws.receive_json()
+        assert response['type'] == "whitelist"
+
+
 def test_api_ws_send_msg(default_conf, mocker, caplog):
     try:
         caplog.set_level(logging.DEBUG)
@@ -11,8 +11,9 @@ import pytest
 import websockets
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import CandleType
 from freqtrade.rpc.external_message_consumer import ExternalMessageConsumer
-from tests.conftest import log_has, log_has_re, log_has_when
+from tests.conftest import generate_test_data, log_has, log_has_re, log_has_when
 
 
 _TEST_WS_TOKEN = "secret_Ws_t0ken"
@@ -166,6 +167,42 @@ def test_emc_handle_producer_message(patched_emc, caplog, ohlcv_history):
     assert log_has_re(r"Empty message .+", caplog)
 
 
+def test_emc_analyzed_df_sequence(patched_emc, caplog, mocker):
+    test_producer = {"name": "test", "url": "ws://test", "ws_token": "test"}
+    key = ("BTC/USDT", "5m", CandleType.SPOT)
+    df = generate_test_data('5m', 200)
+    request_mock = mocker.patch(
+        'freqtrade.rpc.external_message_consumer.ExternalMessageConsumer.send_producer_request')
+
+    def message(candles, seq=None):
+        data = {"key": key, "df": candles, "la": datetime.now(timezone.utc)}
+        if seq is not None:
+            data['seq'] = seq
+        return {"type": "analyzed_df", "data": data}
+
+    # Requested dataframe, without sequence number
+    patched_emc.handle_producer_message(test_producer, message(df.iloc[:150]))
+    # Emitted candles
+    patched_emc.handle_producer_message(test_producer, message(df.iloc[150:151], 4))
+    patched_emc.handle_producer_message(test_producer, message(df.iloc[151:153], 5))
+    assert request_mock.call_count == 0
+    assert len(patched_emc._dp.get_producer_df('BTC/USDT', producer_name='test')[0]) == 153
+
+    # Updates 6 and 7 were lost
+    patched_emc.handle_producer_message(test_producer, message(df.iloc[153:154], 8))
+    assert log_has_re(r"Missed 2 update\(s\) for .* requesting the full dataframe", caplog)
+    assert request_mock.call_count == 1
+    assert request_mock.call_args[0][1].data == {"limit": 1500, "pair": "BTC/USDT"}
+
+    # Requested dataframes reset the sequence
+    request_mock.reset_mock()
+    patched_emc.handle_producer_message(test_producer, message(df))
+    patched_emc.handle_producer_message(test_producer, message(df.iloc[-1:], 12))
+    # Producer restarted
+    patched_emc.handle_producer_message(test_producer, message(df.iloc[-1:], 1))
+    assert request_mock.call_count == 0
+
+
 async def test_emc_create_connection_success(default_conf, caplog, mocker):
     default_conf.update({
         "external_message_consumer": {
@@ -206,6 +243,57 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
         emc.shutdown()
 
 
+@pytest.mark.parametrize('server_subprotocols,expected', [
+    (['freqtrade.arrow'], 'freqtrade.arrow'),
+    (None, None),
+])
+async def test_emc_create_connection_serializer(default_conf, caplog, mocker,
+                                                server_subprotocols, expected):
+    default_conf.update({
+        "external_message_consumer": {
+            "enabled": True,
+            "producers": [
+                {
+                    "name": "default",
+                    "host": _TEST_WS_HOST,
+                    "port": _TEST_WS_PORT,
+                    "ws_token": _TEST_WS_TOKEN,
+                    "serializer": "arrow"
+                }
+            ],
+            "wait_timeout": 60,
+            "ping_timeout": 60,
+            "sleep_timeout": 60
+        }
+    })
+
+    mocker.patch('freqtrade.rpc.external_message_consumer.ExternalMessageConsumer.start',
+                 MagicMock())
+    dp = DataProvider(default_conf, None, None, None)
+    emc = ExternalMessageConsumer(default_conf, dp)
+
+    test_producer = default_conf['external_message_consumer']['producers'][0]
+    subprotocols = []
+
+    emc._running = True
+
+    async def eat(websocket):
+        subprotocols.append(websocket.subprotocol)
+        emc._running = False
+
+    try:
+        async with websockets.serve(eat, _TEST_WS_HOST, _TEST_WS_PORT,
+                                    subprotocols=server_subprotocols):
+            await emc._create_connection(test_producer, asyncio.Lock())
+
+        assert subprotocols == [expected]
+        assert log_has_re(r"Connected to channel.+", caplog)
+        assert log_has_re(r"Producer `default` does not support the `arrow` serializer.*",
+                          caplog) is (expected is None)
+    finally:
+        emc.shutdown()
+
+
 @pytest.mark.parametrize('host,port', [
     (_TEST_WS_HOST, -1),
     ("10000.1241..2121/", _TEST_WS_PORT),
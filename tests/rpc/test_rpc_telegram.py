@@ -29,6 +29,7 @@ from freqtrade.persistence.models import Order
 from freqtrade.rpc import RPC
 from freqtrade.rpc.rpc import RPCException
 from freqtrade.rpc.telegram import Telegram, authorized_only
+from freqtrade.util import LoopProfiler
 from tests.conftest import (CURRENT_TEST_STRATEGY, create_mock_trades, create_mock_trades_usdt,
                             get_patched_freqtradebot, log_has, log_has_re, patch_exchange,
                             patch_get_signal, patch_whitelist)
@@ -106,7 +107,7 @@ def test_telegram_init(default_conf, mocker, caplog) -> None:
                    "['reload_config', 'reload_conf'], ['show_config', 'show_conf'], "
                    "['stopbuy', 'stopentry'], ['whitelist'], ['blacklist'], "
                    "['blacklist_delete', 'bl_delete'], "
-                   "['logs'], ['edge'], ['health'], ['help'], ['version']"
+                   "['logs'], ['edge'], ['health'], ['profile'], ['help'], ['version']"
                    "]")
 
     assert log_has(message_str, caplog)
@@ -1737,6 +1738,34 @@ def test_version_handle(default_conf, update, mocker) -> None:
     assert '*Strategy version: * `1.1.1`' in msg_mock.call_args_list[0][0][0]
 
 
+def test_profile_handle(default_conf, update, mocker) -> None:
+    telegram, freqtradebot, msg_mock = get_telegram_testobject(mocker, default_conf)
+    LoopProfiler.reset()
+
+    telegram._profile(update=update, context=MagicMock())
+    assert msg_mock.call_count == 1
+    assert 'No timings recorded yet.' in msg_mock.call_args_list[0][0][0]
+
+    msg_mock.reset_mock()
+    LoopProfiler.record('phases', 'analyze', 0.25)
+    LoopProfiler.record('phases', 'process', 0.5)
+    for i in range(12):
+        LoopProfiler.record('pairs', f'PAIR{i}/BTC', i / 100)
+    freqtradebot.exchange._update_ohlcv_refresh_stats([0.05, 0.3], 0.4)
+
+    telegram._profile(update=update, context=MagicMock())
+    assert msg_mock.call_count == 1
+    msg = msg_mock.call_args_list[0][0][0]
+    assert 'Phase' in msg
+    assert 'analyze' in msg
+    # Only the 10 slowest pairs are shown
+    assert 'PAIR11/BTC' in msg
+    assert 'PAIR1/BTC' not in msg
+    assert 'Exchange call' not in msg
+    assert 'Last candle refresh:</b> 2 requests in 0.40s' in msg
+    LoopProfiler.reset()
+
+
 def test_show_config_handle(default_conf, update, mocker) -> None:
 
     default_conf['runmode'] = RunMode.DRY_RUN
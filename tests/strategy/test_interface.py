@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 import arrow
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_series_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
@@ -21,8 +22,9 @@ from freqtrade.strategy.hyper import detect_parameters
 from freqtrade.strategy.parameters import (BaseParameter, BooleanParameter, CategoricalParameter,
                                            DecimalParameter, IntParameter, RealParameter)
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from tests.conftest import (CURRENT_TEST_STRATEGY, TRADE_SIDES, create_mock_trades, log_has,
-                            log_has_re)
+from freqtrade.util import LoopProfiler
+from tests.conftest import (CURRENT_TEST_STRATEGY, TRADE_SIDES, create_mock_trades,
+                            generate_test_data, log_has, log_has_re)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -729,6 +731,102 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has('Skipping TA Analysis for already analyzed candle', caplog)
 
 
+def test_analyze_concurrent(default_conf, ohlcv_history, mocker, caplog) -> None:
+    default_conf.update({'strategy': CURRENT_TEST_STRATEGY, 'analysis_workers': 3})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    # dp.ohlcv() returns a copy for every call
+    mocker.patch.object(strategy.dp, 'ohlcv',
+                        side_effect=lambda *args, **kwargs: ohlcv_history.copy())
+    set_cached_mock = mocker.patch.object(strategy.dp, '_set_cached_df')
+    emit_mock = mocker.patch.object(strategy.dp, '_emit_df')
+    analyze_pair_mock = mocker.patch.object(strategy, 'analyze_pair')
+
+    populate_indicators = strategy.populate_indicators
+
+    def failing_indicators(dataframe, metadata):
+        if metadata['pair'] == 'LTC/BTC':
+            raise ValueError('xyz')
+        return populate_indicators(dataframe, metadata)
+
+    indicators_mock = mocker.patch.object(strategy, 'populate_indicators',
+                                          side_effect=failing_indicators)
+    pairs = ['ETH/BTC', 'LTC/BTC', 'XRP/BTC', 'NEO/BTC']
+    strategy.analyze(pairs)
+
+    assert analyze_pair_mock.call_count == 0
+    # Results are stored in order of pairs - the failing pair is skipped
+    assert [c[0][0] for c in set_cached_mock.call_args_list] == ['ETH/BTC', 'XRP/BTC', 'NEO/BTC']
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == ['ETH/BTC', 'XRP/BTC', 'NEO/BTC']
+    assert all(c[0][2] is True for c in emit_mock.call_args_list)
+    assert log_has_re(r'Unable to analyze candle \(OHLCV\) data for pair LTC/BTC: xyz', caplog)
+    assert 'rsi' in set_cached_mock.call_args_list[0][0][2]
+    expected = strategy.analyze_ticker(ohlcv_history.copy(), {'pair': 'ETH/BTC'})
+    assert set_cached_mock.call_args_list[0][0][2].equals(expected)
+
+    # Only the failed pair is analyzed again if no new candle arrived
+    set_cached_mock.reset_mock()
+    indicators_mock.reset_mock()
+    strategy.analyze(pairs[::-1])
+    assert set_cached_mock.call_count == 0
+    assert [c[0][1]['pair'] for c in indicators_mock.call_args_list] == ['LTC/BTC']
+
+    # Single pair - or FreqAI - use the serial analysis
+    LoopProfiler.record('pairs', 'XRP/BTC', 0.1)
+    strategy.analyze(['ETH/BTC'])
+    assert analyze_pair_mock.call_count == 1
+    # Timings of pairs which are no longer analyzed are dropped
+    assert 'XRP/BTC' not in LoopProfiler.get_stats()['pairs']
+    strategy.config['freqai'] = {'enabled': True}
+    strategy.analyze(pairs)
+    assert analyze_pair_mock.call_count == 5
+
+
+def test__analyze_ticker_incremental(default_conf, mocker, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    default_conf.update({'strategy': CURRENT_TEST_STRATEGY, 'lookback_candle_count': 100})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert strategy.lookback_candle_count == 100
+    strategy.dp = DataProvider(default_conf, None, None)
+    candles = generate_test_data('5m', 450, '2022-01-01')
+    analyze_mock = mocker.spy(strategy, 'analyze_ticker')
+    LoopProfiler.reset()
+
+    first = candles.iloc[:400].reset_index(drop=True)
+    strategy._analyze_ticker_internal(first.copy(), {'pair': 'ETH/BTC'})
+    assert len(analyze_mock.call_args_list[-1][0][0]) == 400
+    assert LoopProfiler.get_stats()['pairs']['ETH/BTC']['count'] == 1
+
+    # Rolling window - 2 new candles, 2 candles dropped at the start
+    second = candles.iloc[2:402].reset_index(drop=True)
+    res = strategy._analyze_ticker_internal(second.copy(), {'pair': 'ETH/BTC'})
+    assert len(analyze_mock.call_args_list[-1][0][0]) == 102
+    assert log_has('Analyzed 2 new candle(s) for ETH/BTC using 100 lookback candles.', caplog)
+    assert len(res) == 400
+    assert (res['date'] == second['date']).all()
+    full = strategy.analyze_ticker(second.copy(), {'pair': 'ETH/BTC'})
+    assert list(res.columns) == list(full.columns)
+    # Non-recursive indicators of new candles match the full analysis
+    assert_series_equal(res['bb_upperband'].iloc[-2:], full['bb_upperband'].iloc[-2:])
+    assert_series_equal(res['enter_long'].iloc[-2:], full['enter_long'].iloc[-2:])
+    assert strategy.dp.get_analyzed_dataframe('ETH/BTC', strategy.timeframe)[0] is res
+
+    # Candles not matching the previous analysis - full analysis
+    analyze_mock.reset_mock()
+    third = candles.iloc[10:410].reset_index(drop=True)
+    third.loc[391, 'close'] += 1
+    res = strategy._analyze_ticker_internal(third.copy(), {'pair': 'ETH/BTC'})
+    assert analyze_mock.call_count == 1
+    assert len(analyze_mock.call_args_list[-1][0][0]) == 400
+
+    # Disabled without process_only_new_candles
+    analyze_mock.reset_mock()
+    strategy.process_only_new_candles = False
+    strategy._analyze_ticker_internal(candles.iloc[11:411].reset_index(drop=True),
+                                      {'pair': 'ETH/BTC'})
+    assert len(analyze_mock.call_args_list[-1][0][0]) == 400
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf['timeframe']
@@ -947,6 +1045,26 @@ def test_hyperopt_parameters():
     assert len(list(boolpar.range)) == 1
 
 
+def test_hyperopt_parameters_track_reads():
+    intpar = IntParameter(low=0, high=5, default=1, space='buy')
+    fltpar = DecimalParameter(low=0.0, high=0.5, default=0.1, decimals=1, space='sell')
+    catpar = CategoricalParameter(['a', 'b', 'c'], default='a', space='buy')
+
+    with BaseParameter.track_reads() as reads:
+        assert intpar.value == 1
+        with BaseParameter.track_reads() as inner_reads:
+            assert list(catpar.range) == ['a']
+        fltpar.value = 0.2
+    assert inner_reads == {catpar}
+    # Reads of nested contexts are added to the outer context, assignments are not reads.
+    assert reads == {intpar, catpar}
+    assert BaseParameter._tracked_reads is None
+
+    # Reads outside of track_reads() are not recorded
+    assert fltpar.value == 0.2
+    assert reads == {intpar, catpar}
+
+
 def test_auto_hyperopt_interface(default_conf):
     default_conf.update({'strategy': 'HyperoptableStrategyV2'})
     PairLocks.timeframe = default_conf['timeframe']
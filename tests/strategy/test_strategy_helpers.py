@@ -254,3 +254,76 @@ def test_informative_decorator(mocker, default_conf_usdt, trading_mode):
     for _, dataframe in analyzed.items():
         for col in expected_columns:
             assert col in dataframe.columns
+
+
+def test_informative_decorator_cache(mocker, default_conf_usdt):
+    test_data_5m = generate_test_data('5m', 40)
+    test_data_30m = generate_test_data('30m', 40)
+    test_data_1h = generate_test_data('1h', 40)
+    data = {
+        '5m': test_data_5m,
+        '30m': test_data_30m,
+        '1h': test_data_1h,
+        '15m': test_data_5m,
+    }
+    default_conf_usdt['strategy'] = 'InformativeDecoratorTest'
+    strategy = StrategyResolver.load_strategy(default_conf_usdt)
+    exchange = get_patched_exchange(mocker, default_conf_usdt)
+    strategy.dp = DataProvider({}, exchange, None)
+    mocker.patch.object(strategy.dp, 'current_whitelist', return_value=['XRP/USDT', 'LTC/USDT'])
+    mocker.patch('freqtrade.data.dataprovider.DataProvider.historic_ohlcv',
+                 side_effect=lambda pair, timeframe, candle_type: data[timeframe].copy())
+
+    calls = []
+
+    def count_calls(populate_fn):
+        def wrapper(strategy, dataframe, metadata):
+            calls.append((metadata['pair'], metadata['timeframe']))
+            return populate_fn(strategy, dataframe, metadata)
+        return wrapper
+
+    strategy._ft_informative = [(inf_data, count_calls(populate_fn))
+                                for inf_data, populate_fn in strategy._ft_informative]
+
+    expected = strategy.advise_indicators(test_data_5m.copy(), {'pair': 'XRP/USDT'})
+    assert len(calls) == 6
+    assert len(strategy._ft_informative_cache) == 6
+
+    # Unchanged informative candles - populated informative dataframes are reused.
+    calls.clear()
+    result = strategy.advise_indicators(test_data_5m.copy(), {'pair': 'XRP/USDT'})
+    assert calls == []
+    pd.testing.assert_frame_equal(result, expected)
+    # Cached dataframes are not modified by merging
+    assert all('date_merge' not in df.columns
+               for _, df in strategy._ft_informative_cache.values())
+
+    # Informatives of other assets are shared between pairs
+    strategy.advise_indicators(test_data_5m.copy(), {'pair': 'LTC/USDT'})
+    assert sorted(calls) == [('LTC/USDT', '1h'), ('LTC/USDT', '30m')]
+
+    # A new informative candle invalidates the cache for this timeframe only
+    calls.clear()
+    data['1h'] = generate_test_data('1h', 41)
+    strategy.advise_indicators(test_data_5m.copy(), {'pair': 'XRP/USDT'})
+    assert sorted(calls) == [('ETH/BTC', '1h'), ('NEO/USDT', '1h'), ('XRP/USDT', '1h')]
+
+    # An update of the last (incomplete) candle invalidates the cache as well
+    calls.clear()
+    data['1h'] = data['1h'].copy()
+    data['1h'].loc[data['1h'].index[-1], 'close'] += 1
+    strategy.advise_indicators(test_data_5m.copy(), {'pair': 'XRP/USDT'})
+    assert len(calls) == 3
+
+    # Informatives of pairs which are no longer analyzed are dropped
+    mocker.patch.object(strategy, 'analyze_pair')
+    strategy.analyze(['LTC/USDT'])
+    assets = {key[1] for key in strategy._ft_informative_cache}
+    assert 'XRP/USDT' not in assets
+    assert 'LTC/USDT' in assets
+    # Informatives of explicitly defined assets are kept
+    assert len(strategy._ft_informative_cache) == 6
+
+    # advise_all_indicators() doesn't keep cached dataframes around
+    strategy.advise_all_indicators({'XRP/USDT': test_data_5m})
+    assert strategy._ft_informative_cache == {}
@@ -21,6 +21,7 @@ from freqtrade.freqtradebot import FreqtradeBot
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.persistence.models import PairLock
 from freqtrade.plugins.protections.iprotection import ProtectionReturn
+from freqtrade.util import LoopProfiler
 from freqtrade.worker import Worker
 from tests.conftest import (create_mock_trades, create_mock_trades_usdt, get_patched_freqtradebot,
                             get_patched_worker, log_has, log_has_re, patch_edge, patch_exchange,
@@ -569,11 +570,15 @@ def test_process_trade_creation(default_conf_usdt, ticker_usdt, limit_order, lim
 
     trades = Trade.query.filter(Trade.is_open.is_(True)).all()
     assert not trades
+    LoopProfiler.reset()
 
     freqtrade.process()
 
     trades = Trade.query.filter(Trade.is_open.is_(True)).all()
     assert len(trades) == 1
+    phases = LoopProfiler.get_stats()['phases']
+    assert {'process', 'update_fees', 'refresh_whitelist', 'refresh_candles', 'analyze',
+            'enter_positions'}.issubset(phases)
     trade = trades[0]
     assert trade is not None
     assert pytest.approx(trade.stake_amount) == default_conf_usdt['stake_amount']
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from freqtrade.exceptions import TemporaryError
+from freqtrade.exchange.common import retrier
+from freqtrade.util import LoopProfiler
+
+
+def test_loop_profiler(mocker):
+    LoopProfiler.reset()
+    mocker.patch.object(LoopProfiler, 'maxlen', 3)
+    perf_counter = mocker.patch('freqtrade.util.loop_profiler.perf_counter')
+
+    for duration in [1, 2, 3, 4]:
+        perf_counter.side_effect = [10, 10 + duration]
+        with LoopProfiler.timer('phases', 'analyze'):
+            pass
+    LoopProfiler.record('pairs', 'ETH/BTC', 0.5)
+
+    stats = LoopProfiler.get_stats()
+    assert list(stats.keys()) == ['phases', 'pairs', 'exchange']
+    # Only the last 3 durations are kept
+    assert stats['phases'] == {'analyze': {'count': 3, 'last': 4, 'mean': 3, 'max': 4}}
+    assert stats['pairs'] == {'ETH/BTC': {'count': 1, 'last': 0.5, 'mean': 0.5, 'max': 0.5}}
+    assert stats['exchange'] == {}
+
+    # Errors are timed as well
+    perf_counter.side_effect = [10, 15]
+    with pytest.raises(ValueError):
+        with LoopProfiler.timer('phases', 'analyze'):
+            raise ValueError()
+    assert LoopProfiler.get_stats()['phases']['analyze']['max'] == 5
+
+    LoopProfiler.record('pairs', 'XRP/BTC', 0.2)
+    LoopProfiler.prune('pairs', ['XRP/BTC', 'LTC/BTC'])
+    assert list(LoopProfiler.get_stats()['pairs'].keys()) == ['XRP/BTC']
+    assert 'analyze' in LoopProfiler.get_stats()['phases']
+
+    LoopProfiler.reset()
+    assert LoopProfiler.get_stats() == {'phases': {}, 'pairs': {}, 'exchange': {}}
+
+
+def test_loop_profiler_exchange_calls():
+    LoopProfiler.reset()
+    api_call = MagicMock(__name__='fetch_ticker', side_effect=[TemporaryError(), 'ok', 'ok'])
+    wrapped = retrier(api_call)
+    assert wrapped() == 'ok'
+    assert wrapped() == 'ok'
+
+    assert api_call.call_count == 3
+    # Retries are part of the measured call
+    assert LoopProfiler.get_stats()['exchange']['fetch_ticker']['count'] == 2